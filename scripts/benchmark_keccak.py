@@ -0,0 +1,45 @@
+"""Check available Keccak-256 backends against the reference implementation and measure their throughput.
+
+Usage: python scripts/benchmark_keccak.py
+"""
+
+import os
+from timeit import repeat
+
+from pymavryk.crypto.keccak import KeccakHash
+from pymavryk.crypto.keccak import keccak256_backend
+from pymavryk.crypto.keccak import keccak256_backends
+
+reference = KeccakHash.preset(1088, 512, 256)
+sizes = [32, 1024, 64 * 1024]
+
+
+def check_conformance():
+    for size in [0, 1, 135, 136, 137, 272, 1000, 4096]:
+        data = os.urandom(size)
+        expected = reference(data).digest()
+        for name, keccak256 in keccak256_backends.items():
+            assert keccak256(data) == expected, f'{name} backend mismatch on {size} bytes'
+    print(f'backends: {", ".join(keccak256_backends)} (selected: {keccak256_backend}), all conform')
+
+
+def throughput(keccak256, size):
+    data = os.urandom(size)
+    number = max(1, 64 * 1024 // size)
+    elapsed = min(repeat(lambda: keccak256(data), number=number, repeat=3)) / number
+    return elapsed, size / elapsed / 1024 / 1024
+
+
+def benchmark():
+    check_conformance()
+    backends = {'reference': lambda data: reference(data).digest(), **keccak256_backends}
+    for name, keccak256 in backends.items():
+        for size in sizes:
+            if name == 'reference' and size > 1024:
+                continue
+            elapsed, speed = throughput(keccak256, size)
+            print(f'{name:>14} {size:>6} bytes: {elapsed * 1e6:10.1f} us, {speed:8.2f} MiB/s')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,46 @@
+"""Compare hand-written Michelson parser with PLY one on the contracts from the test suite.
+
+Usage: python scripts/benchmark_parser.py [path/to/contracts ...]
+"""
+
+import sys
+from contextlib import suppress
+from glob import glob
+from os.path import dirname
+from os.path import join
+from timeit import repeat
+
+from pymavryk.michelson.parse import MichelsonParser
+
+default_path = join(dirname(dirname(__file__)), 'tests')
+
+
+def load_sources(paths):
+    sources = []
+    for path in paths:
+        for filename in sorted(glob(join(path, '**', '*.tz'), recursive=True)):
+            with open(filename) as f:
+                sources.append(f.read())
+    return sources
+
+
+def parse_all(parser, sources):
+    for source in sources:
+        with suppress(Exception):
+            parser.parse(source)
+
+
+def benchmark():
+    sources = load_sources(sys.argv[1:] or [default_path])
+    print(f'{len(sources)} files, {sum(map(len, sources)) // 1024} KiB')
+
+    build_time = min(repeat(lambda: MichelsonParser(fast=False), number=10, repeat=5)) / 10
+    print(f'parser init (tables cached): {build_time * 1000:.2f} ms')
+
+    for name, parser in [('ply', MichelsonParser(fast=False)), ('fast', MichelsonParser())]:
+        elapsed = min(repeat(lambda: parse_all(parser, sources), number=1, repeat=5))  # noqa: B023
+        print(f'{name}: {elapsed * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    benchmark()
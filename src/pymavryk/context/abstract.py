@@ -1,4 +1,6 @@
 from hashlib import blake2b  # type: ignore
+from typing import Any
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -159,6 +161,15 @@ class AbstractContext:
     def get_big_map_value(self, ptr: int, key_hash: str):
         raise NotImplementedError
 
+    def get_big_map_values(self, ptr: int, key_hashes: List[str]) -> List:
+        raise NotImplementedError
+
+    def iter_big_map_values(self, ptr: int, offset: int = 0) -> Iterator:
+        raise NotImplementedError
+
+    def iter_big_map_items(self, ptr: int, offset: int = 0) -> Iterator[Tuple[str, Any]]:
+        raise NotImplementedError
+
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
 
@@ -1,6 +1,13 @@
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime
 from itertools import chain
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -8,6 +15,7 @@ from typing import Tuple
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.context.abstract import get_originated_address
 from pymavryk.crypto.encoding import base58_encode
+from pymavryk.crypto.encoding import is_bh
 from pymavryk.crypto.key import Key
 from pymavryk.logging import logger
 from pymavryk.michelson.forge import forge_micheline
@@ -17,9 +25,45 @@ from pymavryk.michelson.micheline import get_script_sections
 from pymavryk.operation import DEFAULT_OPERATIONS_TTL
 from pymavryk.operation import MAX_OPERATIONS_TTL
 from pymavryk.rpc.errors import RpcError
+from pymavryk.rpc.node import DEFAULT_POOL_SIZE
+from pymavryk.rpc.query import RpcQuery
 from pymavryk.rpc.shell import ShellQuery
 
 DEFAULT_IPFS_GATEWAY = 'https://ipfs.io/ipfs'
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PREFETCH = 2
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], List],
+    offset: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Generator[Any, None, None]:
+    """Iterate over paginated collection, fetching next pages in background.
+
+    :param fetch_page: function (offset, length) -> list of items, last page is shorter than page_size
+    :param offset: number of items to skip
+    :param page_size: number of items per page
+    :param prefetch: number of pages requested in advance (memory usage is bounded by page_size * (prefetch + 1))
+    """
+    assert page_size > 0 and prefetch > 0, 'page_size and prefetch must be positive'
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pages = deque(executor.submit(fetch_page, offset + i * page_size, page_size) for i in range(prefetch))
+        next_offset = offset + prefetch * page_size
+        exhausted = False
+        while pages:
+            page = pages.popleft().result()
+            if len(page) < page_size:
+                exhausted = True
+            elif not exhausted:
+                pages.append(executor.submit(fetch_page, next_offset, page_size))
+                next_offset += page_size
+            yield from page
+
+
+def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: copy(v) if isinstance(v, (dict, list, set)) else v for k, v in state.items()}
 
 
 class ExecutionContext(AbstractContext):
@@ -47,6 +91,7 @@ class ExecutionContext(AbstractContext):
         ipfs_gateway=None,
         global_constants=None,
         view_results=None,
+        gas_meter=None,
     ):
         self.key: Optional[Key] = key
         self.shell: Optional[ShellQuery] = shell
@@ -94,10 +139,25 @@ class ExecutionContext(AbstractContext):
         self._sandboxed: Optional[bool] = None
         self.ipfs_gateway = (ipfs_gateway or DEFAULT_IPFS_GATEWAY).rstrip('/')
         self.storage_value = script.get('storage') if script else None
+        self.gas_meter = gas_meter
 
     def __copy__(self):
         raise ValueError("It's not allowed to copy context")
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture current state, cheap alternative to `deepcopy`.
+
+        Containers (big_map registry, patched view results, etc.) are copied one level deep, values inside them
+        as well as script expressions are never mutated in place and are shared; so are the shell, the key
+        and the gas meter.
+        """
+        return _copy_state(self.__dict__)
+
+    def rollback(self, snapshot: Dict[str, Any]) -> None:
+        """Return to a previously captured state (the snapshot can be reused)"""
+        self.__dict__.clear()
+        self.__dict__.update(_copy_state(snapshot))
+
     @property
     def script(self) -> Optional[dict]:
         if self.parameter_expr and self.storage_expr and self.code_expr:
@@ -330,6 +390,128 @@ class ExecutionContext(AbstractContext):
         except RpcError:
             return None  # TODO: special exception/value | Key does not exist
 
+    def _get_big_map_block(self, ptr: int, pin_block=False) -> Optional[Tuple[RpcQuery, int]]:
+        if self.tzt or (ptr not in self.big_maps):
+            return None
+        ptr, _ = self.big_maps[ptr]
+        if ptr < 0:
+            return None
+        if self.shell is None:
+            raise ValueError(f'Shell is undefined, cannot connect to network')
+        block_id = self.block_id
+        if pin_block and not isinstance(block_id, int) and not is_bh(block_id):
+            # NOTE: pin the block so that all values are taken from the same state
+            block_id = self.shell.blocks[block_id].hash()
+        return self.shell.blocks[block_id], ptr
+
+    def _fetch_big_map_values(
+        self,
+        big_map: RpcQuery,
+        key_hashes: List[str],
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List:
+        def fetch(key_hash: str):
+            try:
+                return big_map[key_hash]()
+            except RpcError as e:
+                # NOTE: only a missing key is expected, failed requests must not look like one
+                if e.status_code == 404:
+                    return None
+                raise
+
+        if executor is not None:
+            return list(executor.map(fetch, key_hashes))
+        if len(key_hashes) <= 1:
+            return list(map(fetch, key_hashes))
+        max_workers = max_workers or getattr(big_map.node, 'pool_size', DEFAULT_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(key_hashes))) as executor:
+            return list(executor.map(fetch, key_hashes))
+
+    def get_big_map_values(self, ptr: int, key_hashes: List[str], max_workers: Optional[int] = None) -> List:
+        """Fetch multiple big_map values concurrently.
+
+        :param ptr: big_map ID
+        :param key_hashes: list of script expression hashes
+        :param max_workers: max number of simultaneous requests, defaults to the node connection pool size
+        :raises RpcError: node has failed to return a value (other than for a missing key)
+        :returns: list of Micheline expressions (None for missing keys), in the same order
+        """
+        res = self._get_big_map_block(ptr, pin_block=len(key_hashes) > 1)
+        if res is None:
+            return [None] * len(key_hashes)
+        block, ptr = res
+        return self._fetch_big_map_values(block.context.big_maps[ptr], key_hashes, max_workers=max_workers)
+
+    def iter_big_map_values(
+        self,
+        ptr: int,
+        offset: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Generator[Any, None, None]:
+        """Iterate over all values of a big_map (on-chain state), pages are fetched concurrently ahead of consumer.
+
+        Order of values is unspecified, but consistent for the same block.
+
+        :param ptr: big_map ID
+        :param offset: number of values to skip (use it as a cursor to resume iteration)
+        :param page_size: number of values per request
+        :param prefetch: number of pages requested in advance
+        :returns: generator of Micheline expressions
+        """
+        res = self._get_big_map_block(ptr, pin_block=True)
+        if res is None:
+            return
+        block, ptr = res
+        big_map = block.context.big_maps[ptr]
+
+        def fetch_page(page_offset: int, length: int) -> List:
+            return big_map(offset=page_offset, length=length)
+
+        yield from iter_pages(fetch_page, offset=offset, page_size=page_size, prefetch=prefetch)
+
+    def iter_big_map_items(
+        self,
+        ptr: int,
+        offset: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Generator[Tuple[str, Any], None, None]:
+        """Iterate over all entries of a big_map (on-chain state), values are fetched concurrently ahead of consumer.
+
+        NOTE: node context stores big_map keys in hashed form only, so entries are yielded
+        in the order of key hashes (script_expr), which can be used to check against known keys.
+        The raw context RPC listing key hashes doesn't support pagination, so the whole list of key hashes
+        is fetched (and kept in memory) before the first entry is yielded, only values are streamed.
+        Values of all pages are fetched by a single pool of threads, no larger than the node connection pool.
+
+        :param ptr: big_map ID
+        :param offset: number of entries to skip (use it as a cursor to resume iteration)
+        :param page_size: number of values per page
+        :param prefetch: number of pages requested in advance
+        :raises RpcError: node has failed to return a value (iteration cannot be continued, resume it with offset)
+        :returns: generator of (key hash, Micheline expression) tuples, expression is None if the key has been \
+            removed since listing
+        """
+        res = self._get_big_map_block(ptr, pin_block=True)
+        if res is None:
+            return
+        block, ptr = res
+        big_map = block.context.big_maps[ptr]
+        # NOTE: one request for all key hashes, sorted to keep offsets valid across calls
+        key_hashes = sorted(block.context.raw.json.big_maps.index[ptr].contents())
+
+        max_workers = getattr(big_map.node, 'pool_size', DEFAULT_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def fetch_page(page_offset: int, length: int) -> List:
+                page = key_hashes[page_offset : page_offset + length]
+                values = self._fetch_big_map_values(big_map, page, executor=executor)
+                return [(key_hash, values[i]) for i, key_hash in enumerate(page)]
+
+            yield from iter_pages(fetch_page, offset=offset, page_size=page_size, prefetch=prefetch)
+
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
 
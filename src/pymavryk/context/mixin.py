@@ -11,7 +11,7 @@ from pymavryk.crypto.encoding import is_public_key
 from pymavryk.crypto.key import Key
 from pymavryk.crypto.key import is_installed
 from pymavryk.jupyter import InlineDocstring
-from pymavryk.rpc import RpcMultiNode
+from pymavryk.rpc import RpcBalancedNode
 from pymavryk.rpc import RpcNode
 from pymavryk.rpc import ShellQuery
 from pymavryk.rpc.errors import RpcError
@@ -139,7 +139,7 @@ class ContextMixin(metaclass=InlineDocstring):
             if shell.endswith('.pool'):
                 shell = shell.split('.')[0]
                 assert shell in nodes, f'unknown network {shell}'
-                shell = ShellQuery(RpcMultiNode(nodes[shell]))
+                shell = ShellQuery(RpcBalancedNode(nodes[shell]))
             elif shell in nodes:
                 shell = ShellQuery(RpcNode(nodes[shell][0]))
             else:
@@ -13,8 +13,10 @@ from pymavryk.contract.result import ContractCallResult
 from pymavryk.jupyter import get_class_docstring
 from pymavryk.logging import logger
 from pymavryk.michelson.format import micheline_to_michelson
+from pymavryk.michelson.gas import GasMeter
 from pymavryk.michelson.repl import Interpreter
 from pymavryk.michelson.sections.storage import StorageSection
+from pymavryk.michelson.trace import TraceSink
 from pymavryk.operation import DEFAULT_BURN_RESERVE
 from pymavryk.operation import DEFAULT_GAS_RESERVE
 from pymavryk.operation.content import format_mumav
@@ -154,6 +156,8 @@ class ContractCall(ContextMixin):
         now=None,
         self_address=None,
         view_results: Optional[Dict[str, Any]] = None,
+        trace: Union[bool, TraceSink] = True,
+        gas_meter: Optional[GasMeter] = None,
     ) -> ContractCallResult:
         """Run code in the builtin REPL (WARNING! Not recommended for critical tasks).
 
@@ -167,6 +171,10 @@ class ContractCall(ContextMixin):
         :param now: patch NOW
         :param self_address: patch SELF/SELF_ADDRESS
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
+        :param trace: collect execution trace (logged on failure in debug mode), disable to speed up execution,
+            or pass a custom `TraceSink` (e.g. to keep the last N steps only)
+        :param gas_meter: roughly estimate gas locally (read `consumed_gas` of the meter afterwards) and optionally \
+            enforce its limit, see `pymavryk.michelson.gas.GasMeter`
         :rtype: pymavryk.contract.result.ContractCallResult
         """
         storage_ty = StorageSection.match(self.context.storage_expr)
@@ -189,6 +197,8 @@ class ContractCall(ContextMixin):
             now=now,
             address=self_address,
             view_results=view_results,
+            trace=trace,
+            gas_meter=gas_meter,
         )
         if error:
             logger.debug('\n'.join(stdout))
@@ -1,8 +1,13 @@
+from typing import Any
+from typing import Generator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from deprecation import deprecated  # type: ignore
 
+from pymavryk.context.impl import DEFAULT_PAGE_SIZE
 from pymavryk.context.impl import ExecutionContext
 from pymavryk.context.mixin import ContextMixin
 from pymavryk.jupyter import get_class_docstring
@@ -10,6 +15,8 @@ from pymavryk.michelson.format import micheline_to_michelson
 from pymavryk.michelson.parse import michelson_to_micheline
 from pymavryk.michelson.types.base import MichelsonType
 from pymavryk.michelson.types.base import generate_pydoc
+from pymavryk.michelson.types.big_map import BigMapType
+from pymavryk.michelson.types.map import MapType
 
 
 class ContractData(ContextMixin):
@@ -42,6 +49,60 @@ class ContractData(ContextMixin):
             raise KeyError(item)
         return ContractData(self.context, res, path=f'{self.path}/{item}')
 
+    def get_many(self, keys: List[Any], try_unpack=False) -> List[Any]:
+        """Get multiple map/big_map values at once (big_map values are fetched concurrently)
+
+        :param keys: list of keys (Python objects)
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :returns: list of values as Python objects (None for missing keys), in the same order
+        """
+        if not isinstance(self.data, MapType):
+            raise TypeError(f'expected map or big_map, got {self.data.prim}')
+        key_type = type(self.data).args[0]
+        values = self.data.get_many([key_type.from_python_object(key) for key in keys])
+        return [None if val is None else val.to_python_object(try_unpack=try_unpack) for val in values]
+
+    def iter_values(self, offset=0, page_size=DEFAULT_PAGE_SIZE, try_unpack=False) -> Generator[Any, None, None]:
+        """Lazily iterate over all big_map values, fetching pages concurrently ahead of consumer
+
+        :param offset: number of values to skip (pass the number of consumed values to resume iteration)
+        :param page_size: number of values per request
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :returns: generator of Python objects
+        """
+        if not isinstance(self.data, BigMapType):
+            raise TypeError(f'expected big_map, got {self.data.prim}')
+        for val in self.data.iter_values(offset=offset, page_size=page_size):
+            yield val.to_python_object(try_unpack=try_unpack)
+
+    def iter_items(
+        self, offset=0, page_size=DEFAULT_PAGE_SIZE, try_unpack=False
+    ) -> Generator[Tuple[str, Any], None, None]:
+        """Lazily iterate over all big_map entries, fetching values concurrently ahead of consumer
+
+        NOTE: big_map keys are stored on-chain in hashed form only, use `get_key_hash` to match them with known keys.
+        The list of key hashes is fetched at once before the first entry is yielded.
+        Value is None if the key has been removed since listing, failed requests are raised.
+
+        :param offset: number of entries to skip (pass the number of consumed entries to resume iteration)
+        :param page_size: number of values fetched concurrently
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :returns: generator of (key hash, Python object) tuples
+        """
+        if not isinstance(self.data, BigMapType):
+            raise TypeError(f'expected big_map, got {self.data.prim}')
+        for key_hash, val in self.data.iter_items(offset=offset, page_size=page_size):
+            yield key_hash, None if val is None else val.to_python_object(try_unpack=try_unpack)
+
+    def get_key_hash(self, key) -> str:
+        """Get big_map key hash (script_expr)
+
+        :param key: Python object
+        """
+        if not isinstance(self.data, BigMapType):
+            raise TypeError(f'expected big_map, got {self.data.prim}')
+        return self.data.get_key_hash(key)
+
     def __call__(self, try_unpack=False):
         """Get Michelson value as a Python object
 
@@ -1,5 +1,6 @@
 from pprint import pformat
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Union
@@ -7,6 +8,7 @@ from typing import Union
 from pymavryk.context.mixin import ContextMixin
 from pymavryk.context.mixin import ExecutionContext
 from pymavryk.contract.call import ContractCall
+from pymavryk.jupyter import LazyDocstring
 from pymavryk.jupyter import get_class_docstring
 from pymavryk.logging import logger
 from pymavryk.michelson.micheline import MichelsonRuntimeError
@@ -17,9 +19,17 @@ from pymavryk.michelson.sections.parameter import ParameterSection
 class ContractEntrypoint(ContextMixin):
     """Proxy class for spawning ContractCall instances."""
 
-    def __init__(self, context: ExecutionContext, entrypoint: str) -> None:
+    __doc__ = LazyDocstring(__doc__)  # type: ignore
+
+    def __init__(
+        self,
+        context: ExecutionContext,
+        entrypoint: str,
+        pydoc: Optional[Callable[[], str]] = None,
+    ) -> None:
         super().__init__(context=context)
         self.entrypoint = entrypoint
+        self._pydoc = pydoc
 
     def __repr__(self) -> str:
         res = [
@@ -1,15 +1,20 @@
 import json
 import logging
+from collections import OrderedDict
 from decimal import Decimal
 from functools import cached_property
 from functools import lru_cache
+from functools import partial
+from hashlib import blake2b
 from os.path import exists
 from os.path import expanduser
+from threading import Lock
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 from typing import cast
@@ -30,6 +35,7 @@ from pymavryk.crypto.key import Key
 from pymavryk.jupyter import get_class_docstring
 from pymavryk.logging import logger
 from pymavryk.michelson.format import micheline_to_michelson
+from pymavryk.michelson.format import write_michelson
 from pymavryk.michelson.micheline import MichelsonRuntimeError
 from pymavryk.michelson.parse import michelson_to_micheline
 from pymavryk.michelson.program import MichelsonProgram
@@ -40,6 +46,22 @@ from pymavryk.michelson.types.base import generate_pydoc
 from pymavryk.operation.group import OperationGroup
 from pymavryk.rpc import ShellQuery
 
+DEFAULT_PROGRAM_CACHE_SIZE = 256
+
+_interface_classes: 'OrderedDict[str, Type[ContractInterface]]' = OrderedDict()
+_interface_classes_lock = Lock()
+
+
+def get_code_hash(code_expr) -> str:
+    """Get digest of the contract code (Micheline expression), used as a program cache key"""
+    return blake2b(json.dumps(code_expr).encode(), digest_size=32).hexdigest()
+
+
+def clear_program_cache() -> None:
+    """Drop all cached contract programs"""
+    with _interface_classes_lock:
+        _interface_classes.clear()
+
 
 class ContractTokenMetadataProxy:
     """Get TZIP-21 contract token metadata by token_id"""
@@ -60,29 +82,81 @@ class ContractInterface(ContextMixin):
         super().__init__(context=context)
         self._logger = logging.getLogger(__name__)
         self._storage: Optional[ContractData] = None
-        self.entrypoints = self.program.parameter.list_entrypoints()
-        self.views = {view.name: view for view in self.program.views}  # type: Dict[str, Type[ViewSection]]
+        self.entrypoints = self._get_cached('entrypoints', self.program.parameter.list_entrypoints)
+        self.views: Dict[str, Type[ViewSection]] = self._get_cached(
+            'views', lambda: {view.name: view for view in self.program.views}
+        )
 
-        for entrypoint, ty in self.entrypoints.items():
+        for entrypoint in self.entrypoints:
             if entrypoint == 'token_metadata':
                 continue
-            attr = ContractEntrypoint(context=context, entrypoint=entrypoint)
-            attr.__doc__ = generate_pydoc(ty, entrypoint)
+            attr = ContractEntrypoint(
+                context=context,
+                entrypoint=entrypoint,
+                pydoc=partial(self._get_entrypoint_pydoc, entrypoint),
+            )
             assert not hasattr(self, entrypoint), f'Entrypoint name collision {entrypoint}'
             setattr(self, entrypoint, attr)
 
-        for view_name, view_ty in self.views.items():
+        for view_name in self.views:
+            parameter, return_type, code = self._get_view_exprs(view_name)
             view_attr = ContractView(
                 context=context,
                 name=view_name,
-                parameter=view_ty.args[1].as_micheline_expr(),
-                return_type=view_ty.args[2].as_micheline_expr(),
-                code=view_ty.args[3].as_micheline_expr(),  # type: ignore
+                parameter=parameter,
+                return_type=return_type,
+                code=code,
+                pydoc=partial(self._get_view_pydoc, view_name),
             )
-            view_attr.__doc__ = view_ty.generate_pydoc()  # type: ignore
             assert not hasattr(self, view_name), f'View name collision {view_name}'
             setattr(self, view_name, view_attr)
 
+    @classmethod
+    def _get_cached(cls, key, factory: Callable[[], Any]) -> Any:
+        # NOTE: shared by all interfaces of the same program, see `from_context`
+        cache = cls.__dict__.get('_program_cache')
+        if cache is None:
+            cache = {}
+            cls._program_cache = cache
+        if key not in cache:
+            cache[key] = factory()
+        return cache[key]
+
+    @classmethod
+    def _get_entrypoint_pydoc(cls, entrypoint: str) -> str:
+        ty = cls._get_cached('entrypoints', cls.program.parameter.list_entrypoints)[entrypoint]
+        return cls._get_cached(('pydoc', entrypoint), lambda: generate_pydoc(ty, entrypoint))
+
+    @classmethod
+    def _get_view_exprs(cls, view_name: str) -> Tuple[Any, Any, Any]:
+        view_ty = next(view for view in cls.program.views if view.name == view_name)
+        return cls._get_cached(
+            ('view', view_name),
+            lambda: tuple(view_ty.args[i].as_micheline_expr() for i in range(1, 4)),  # type: ignore
+        )
+
+    @classmethod
+    def _get_view_pydoc(cls, view_name: str) -> str:
+        view_ty = next(view for view in cls.program.views if view.name == view_name)
+        return cls._get_cached(('view_pydoc', view_name), view_ty.generate_pydoc)  # type: ignore
+
+    @staticmethod
+    def _create_class(code_expr, program_factory: Callable[[], Type[MichelsonProgram]]) -> Type['ContractInterface']:
+        code_hash = get_code_hash(code_expr)
+        with _interface_classes_lock:
+            cls = _interface_classes.get(code_hash)
+            if cls is not None:
+                _interface_classes.move_to_end(code_hash)
+                return cls
+
+        program = program_factory()
+        cls = type(ContractInterface.__name__, (ContractInterface,), {'program': program})
+        with _interface_classes_lock:
+            cls = _interface_classes.setdefault(code_hash, cls)
+            while len(_interface_classes) > DEFAULT_PROGRAM_CACHE_SIZE:
+                _interface_classes.popitem(last=False)
+        return cls
+
     def __repr__(self) -> str:
         res = [
             super().__repr__(),
@@ -149,8 +223,7 @@ class ContractInterface(ContextMixin):
             code_expr = context.resolve_global_constants(expression)
         else:
             code_expr = expression
-        program = MichelsonProgram.match(code_expr)
-        cls = type(ContractInterface.__name__, (ContractInterface,), {'program': program})
+        cls = ContractInterface._create_class(code_expr, lambda: MichelsonProgram.match(code_expr))
         context = ExecutionContext(
             shell=context.shell if context else None,
             key=context.key if context else None,
@@ -162,12 +235,16 @@ class ContractInterface(ContextMixin):
     @staticmethod
     def from_context(context: ExecutionContext) -> 'ContractInterface':
         """Create contract from the previously loaded context data.
+        Parsed programs are cached (process-wide) by code hash, so that repeated instantiation is cheap.
 
         :param context: execution context
         :return: ContractInterface
         """
-        program = MichelsonProgram.load(context, with_code=True)
-        cls = type(ContractInterface.__name__, (ContractInterface,), {'program': program})
+        code_expr = [context.parameter_expr, context.storage_expr, context.code_expr, *context.views_expr]
+        if context.global_constants:
+            # NOTE: program is loaded with global constants substituted, same code can refer to different values
+            code_expr = context.resolve_global_constants(code_expr)
+        cls = ContractInterface._create_class(code_expr, lambda: MichelsonProgram.load(context, with_code=True))
         return cls(context)
 
     @classmethod
@@ -208,7 +285,7 @@ class ContractInterface(ContextMixin):
         :param path: path to the file
         """
         with open(path, 'w+') as f:
-            f.write(self.to_michelson())
+            write_michelson(self.to_micheline(), f)
 
     @deprecated(deprecated_in='3.0.0', removed_in='4.0.0', details='use `.storage[path][to][big_map][key]()` instead')
     def big_map_get(self, path):
@@ -256,6 +333,7 @@ class ContractInterface(ContextMixin):
                 address=self.context.address,
                 block_id=block_id,
                 mode=mode,
+                script=self.context.script,
                 ipfs_gateway=ipfs_gateway,
             )
         )
@@ -1,17 +1,21 @@
 from pprint import pformat
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Union
 
 from pymavryk.context.impl import ExecutionContext
 from pymavryk.context.mixin import ContextMixin
 from pymavryk.contract.call import ContractCallResult
 from pymavryk.contract.call import skip_nones
+from pymavryk.jupyter import LazyDocstring
 from pymavryk.jupyter import get_class_docstring
 from pymavryk.logging import logger
 from pymavryk.michelson.micheline import MichelsonRuntimeError
 from pymavryk.michelson.repl import Interpreter
+from pymavryk.michelson.trace import TraceSink
 from pymavryk.michelson.types.base import MichelsonType
 from pymavryk.michelson.types.base import generate_pydoc
 
@@ -74,6 +78,8 @@ def format_view_params(param_expr, storage_expr):
 class ContractView(ContextMixin):
     """Proxy class for handling off-chain and on-chain views"""
 
+    __doc__ = LazyDocstring(__doc__)  # type: ignore
+
     def __init__(
         self,
         context: ExecutionContext,
@@ -81,13 +87,14 @@ class ContractView(ContextMixin):
         parameter: Optional[Dict[str, Any]],
         return_type: Dict[str, Any],
         code: List[Any],
+        pydoc: Optional[Callable[[], str]] = None,
     ) -> None:
         super().__init__(context=context)
         self.name = name
         self.param_ty_expr = parameter or {'prim': 'unit'}
         self.return_ty_expr = return_type
         self.code_expr = code
-        self.__doc__ = generate_pydoc(MichelsonType.match(self.param_ty_expr), title=name)
+        self._pydoc = pydoc or (lambda: generate_pydoc(MichelsonType.match(self.param_ty_expr), title=name))
 
     def __repr__(self) -> str:
         res = [
@@ -294,12 +301,20 @@ class ContractViewCall(ContextMixin):
             raise error
         return storage  # type: ignore
 
-    def onchain_view(self, storage=None, balance=None, view_results: Optional[Dict[str, Any]] = None):
+    def onchain_view(
+        self,
+        storage=None,
+        balance=None,
+        view_results: Optional[Dict[str, Any]] = None,
+        trace: Union[bool, TraceSink] = True,
+    ):
         """Get return value of an on-chain view (not supporting external view calls).
 
         :param storage: override current contract storage (as Python object)
         :param balance: patch BALANCE
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
+        :param trace: collect execution trace (logged on failure in debug mode), disable to speed up execution,
+            or pass a custom `TraceSink` (e.g. to keep the last N steps only)
         :returns: Decoded return value
         """
         ret, stdout, error = Interpreter.run_view(
@@ -314,6 +329,7 @@ class ContractViewCall(ContextMixin):
                 },
                 view_results=view_results,
             ),
+            trace=trace,
         )
         if error:
             logger.debug('\n'.join(stdout))
@@ -1,9 +1,18 @@
 # Using implementation from https://github.com/ctz/keccak/blob/f7fb2365f7bfeedd7308960baa0b3e470205f997/keccak.py
+import hashlib
+import struct
 from binascii import hexlify
+from contextlib import suppress
 from copy import deepcopy
+from functools import partial
 from functools import reduce
 from math import log
 from operator import xor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
 
 # The Keccak-f round constants.
 RoundConstants = [
@@ -375,4 +384,241 @@ class KeccakHash:
         return create
 
 
-Keccak256 = KeccakHash.preset(1088, 512, 256)
+# NOTE: below is a specialized Keccak-256 (as used by the KECCAK instruction), generic implementation above
+# is kept as a reference; native implementation is used instead if there's one installed
+
+MASK = (1 << 64) - 1
+RATE_BYTES = 136
+block_struct = struct.Struct('<17Q')
+digest_struct = struct.Struct('<4Q')
+
+
+def keccak_f1600(lanes: List[int]) -> None:
+    """Keccak-f[1600] permutation over 25 lanes (x + 5 * y order), in place"""
+    a00, a01, a02, a03, a04 = lanes[0:5]
+    a05, a06, a07, a08, a09 = lanes[5:10]
+    a10, a11, a12, a13, a14 = lanes[10:15]
+    a15, a16, a17, a18, a19 = lanes[15:20]
+    a20, a21, a22, a23, a24 = lanes[20:25]
+    for rc in RoundConstants:
+        # theta
+        c0 = a00 ^ a05 ^ a10 ^ a15 ^ a20
+        c1 = a01 ^ a06 ^ a11 ^ a16 ^ a21
+        c2 = a02 ^ a07 ^ a12 ^ a17 ^ a22
+        c3 = a03 ^ a08 ^ a13 ^ a18 ^ a23
+        c4 = a04 ^ a09 ^ a14 ^ a19 ^ a24
+        d0 = c4 ^ ((c1 << 1 | c1 >> 63) & MASK)
+        d1 = c0 ^ ((c2 << 1 | c2 >> 63) & MASK)
+        d2 = c1 ^ ((c3 << 1 | c3 >> 63) & MASK)
+        d3 = c2 ^ ((c4 << 1 | c4 >> 63) & MASK)
+        d4 = c3 ^ ((c0 << 1 | c0 >> 63) & MASK)
+        # rho and pi
+        b00 = a00 ^ d0
+        v = a01 ^ d1
+        b10 = (v << 1 | v >> 63) & MASK
+        v = a02 ^ d2
+        b20 = (v << 62 | v >> 2) & MASK
+        v = a03 ^ d3
+        b05 = (v << 28 | v >> 36) & MASK
+        v = a04 ^ d4
+        b15 = (v << 27 | v >> 37) & MASK
+        v = a05 ^ d0
+        b16 = (v << 36 | v >> 28) & MASK
+        v = a06 ^ d1
+        b01 = (v << 44 | v >> 20) & MASK
+        v = a07 ^ d2
+        b11 = (v << 6 | v >> 58) & MASK
+        v = a08 ^ d3
+        b21 = (v << 55 | v >> 9) & MASK
+        v = a09 ^ d4
+        b06 = (v << 20 | v >> 44) & MASK
+        v = a10 ^ d0
+        b07 = (v << 3 | v >> 61) & MASK
+        v = a11 ^ d1
+        b17 = (v << 10 | v >> 54) & MASK
+        v = a12 ^ d2
+        b02 = (v << 43 | v >> 21) & MASK
+        v = a13 ^ d3
+        b12 = (v << 25 | v >> 39) & MASK
+        v = a14 ^ d4
+        b22 = (v << 39 | v >> 25) & MASK
+        v = a15 ^ d0
+        b23 = (v << 41 | v >> 23) & MASK
+        v = a16 ^ d1
+        b08 = (v << 45 | v >> 19) & MASK
+        v = a17 ^ d2
+        b18 = (v << 15 | v >> 49) & MASK
+        v = a18 ^ d3
+        b03 = (v << 21 | v >> 43) & MASK
+        v = a19 ^ d4
+        b13 = (v << 8 | v >> 56) & MASK
+        v = a20 ^ d0
+        b14 = (v << 18 | v >> 46) & MASK
+        v = a21 ^ d1
+        b24 = (v << 2 | v >> 62) & MASK
+        v = a22 ^ d2
+        b09 = (v << 61 | v >> 3) & MASK
+        v = a23 ^ d3
+        b19 = (v << 56 | v >> 8) & MASK
+        v = a24 ^ d4
+        b04 = (v << 14 | v >> 50) & MASK
+        # chi and iota
+        a00 = b00 ^ (~b01 & b02) ^ rc
+        a01 = b01 ^ (~b02 & b03)
+        a02 = b02 ^ (~b03 & b04)
+        a03 = b03 ^ (~b04 & b00)
+        a04 = b04 ^ (~b00 & b01)
+        a05 = b05 ^ (~b06 & b07)
+        a06 = b06 ^ (~b07 & b08)
+        a07 = b07 ^ (~b08 & b09)
+        a08 = b08 ^ (~b09 & b05)
+        a09 = b09 ^ (~b05 & b06)
+        a10 = b10 ^ (~b11 & b12)
+        a11 = b11 ^ (~b12 & b13)
+        a12 = b12 ^ (~b13 & b14)
+        a13 = b13 ^ (~b14 & b10)
+        a14 = b14 ^ (~b10 & b11)
+        a15 = b15 ^ (~b16 & b17)
+        a16 = b16 ^ (~b17 & b18)
+        a17 = b17 ^ (~b18 & b19)
+        a18 = b18 ^ (~b19 & b15)
+        a19 = b19 ^ (~b15 & b16)
+        a20 = b20 ^ (~b21 & b22)
+        a21 = b21 ^ (~b22 & b23)
+        a22 = b22 ^ (~b23 & b24)
+        a23 = b23 ^ (~b24 & b20)
+        a24 = b24 ^ (~b20 & b21)
+    lanes[0:5] = a00, a01, a02, a03, a04
+    lanes[5:10] = a05, a06, a07, a08, a09
+    lanes[10:15] = a10, a11, a12, a13, a14
+    lanes[15:20] = a15, a16, a17, a18, a19
+    lanes[20:25] = a20, a21, a22, a23, a24
+
+
+def keccak_absorb(lanes: List[int], data, end: int) -> None:
+    """XOR full blocks of data[:end] into the state, permuting it after each one"""
+    for pos in range(0, end, RATE_BYTES):
+        for i, lane in enumerate(block_struct.unpack_from(data, pos)):
+            lanes[i] ^= lane
+        keccak_f1600(lanes)
+
+
+def keccak_pad_digest(lanes: List[int], tail) -> bytes:
+    """Pad the last (incomplete) block and absorb it, lanes are modified in place"""
+    block = bytearray(tail)
+    block.extend(bytes(RATE_BYTES - len(block)))
+    block[len(tail)] ^= 0x01
+    block[-1] ^= 0x80
+    keccak_absorb(lanes, block, RATE_BYTES)
+    return digest_struct.pack(*lanes[:4])
+
+
+def keccak256_python(data: bytes) -> bytes:
+    """Keccak-256 digest, pure Python
+
+    :param data: input bytes
+    """
+    lanes = [0] * 25
+    tail_pos = len(data) - len(data) % RATE_BYTES
+    keccak_absorb(lanes, data, tail_pos)
+    return keccak_pad_digest(lanes, data[tail_pos:])
+
+
+def find_keccak256_factories() -> Dict[str, Callable[..., Any]]:
+    """Available native Keccak-256 implementations: constructors of hashlib-like objects (optional initial input),
+    fastest first
+    """
+    factories: Dict[str, Callable[..., Any]] = {}
+    with suppress(ImportError):
+        from Crypto.Hash import keccak  # type: ignore
+
+        factories['pycryptodome'] = lambda data=b'': keccak.new(digest_bits=256, data=data, update_after_digest=True)
+    with suppress(ImportError):
+        from Cryptodome.Hash import keccak as keccak_x  # type: ignore
+
+        factories['pycryptodomex'] = lambda data=b'': keccak_x.new(digest_bits=256, data=data, update_after_digest=True)
+    with suppress(ImportError):
+        import sha3  # type: ignore
+
+        factories['pysha3'] = sha3.keccak_256
+    # NOTE: OpenSSL 3.2+
+    with suppress(ValueError):
+        hashlib.new('keccak-256')
+        factories['openssl'] = partial(hashlib.new, 'keccak-256')
+    return factories
+
+
+def find_keccak256_backends() -> Dict[str, Callable[[bytes], bytes]]:
+    """Available Keccak-256 implementations, fastest first"""
+
+    def one_shot(new: Callable[..., Any]) -> Callable[[bytes], bytes]:
+        return lambda data: new(data).digest()
+
+    backends = {name: one_shot(new) for name, new in keccak256_factories.items()}
+    backends['python'] = keccak256_python
+    return backends
+
+
+keccak256_factories = find_keccak256_factories()
+keccak256_backends = find_keccak256_backends()
+keccak256_backend = next(iter(keccak256_backends))
+keccak256 = keccak256_backends[keccak256_backend]
+
+
+class Keccak256Hash:
+    """
+    Keccak-256 with a hashlib-compatible interface (same as `KeccakHash.preset(1088, 512, 256)`),
+    uses the fastest available implementation. Input is absorbed as it comes, nothing but the last
+    incomplete block is kept.
+
+    NOTE: pycryptodome hash objects cannot be copied, `copy` is not available with this backend.
+
+    :param initial_input: bytes or latin-1 string
+    :param backend: one of `keccak256_backends`, the fastest one by default
+    """
+
+    digest_size = 32
+    block_size = RATE_BYTES
+
+    def __init__(self, initial_input=None, backend: Optional[str] = None):
+        self.backend = backend or keccak256_backend
+        new = keccak256_factories.get(self.backend)
+        assert new is not None or self.backend == 'python', f'unknown backend {self.backend}'
+        self.native = None if new is None else new()
+        self.lanes = [0] * 25
+        self.tail = bytearray()
+        if initial_input is not None:
+            self.update(initial_input)
+
+    def __repr__(self):
+        return f'<Keccak256Hash ({self.backend})>'
+
+    def copy(self):
+        res = Keccak256Hash.__new__(Keccak256Hash)
+        res.backend = self.backend
+        res.native = None if self.native is None else self.native.copy()
+        res.lanes = self.lanes[:]
+        res.tail = self.tail[:]
+        return res
+
+    def update(self, s):
+        data = s.encode('latin-1') if isinstance(s, str) else s
+        if self.native is not None:
+            self.native.update(data)
+            return
+        self.tail.extend(data)
+        if len(self.tail) >= RATE_BYTES:
+            end = len(self.tail) - len(self.tail) % RATE_BYTES
+            keccak_absorb(self.lanes, self.tail, end)
+            del self.tail[:end]
+
+    def digest(self):
+        if self.native is not None:
+            return self.native.digest()
+        return keccak_pad_digest(self.lanes[:], self.tail)
+
+    def hexdigest(self):
+        return hexlify(self.digest())
+
+
+Keccak256 = Keccak256Hash
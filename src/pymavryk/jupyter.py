@@ -108,3 +108,23 @@ class InlineDocstring(type):
         else:
             new_attrs = attrs
         return type.__new__(mcs, name, bases, new_attrs, **kwargs)
+
+
+class LazyDocstring:
+    """Instance `__doc__` generated on first access by the `_pydoc` callable (if set), class docstring otherwise"""
+
+    def __init__(self, doc: Optional[str]) -> None:
+        self.doc = doc
+
+    def __get__(self, obj, objtype=None) -> Optional[str]:
+        if obj is None:
+            return self.doc
+        if '__doc__' not in obj.__dict__:
+            pydoc = getattr(obj, '_pydoc', None)
+            if pydoc is None:
+                return self.doc
+            obj.__dict__['__doc__'] = pydoc()
+        return obj.__dict__['__doc__']
+
+    def __set__(self, obj, value: Optional[str]) -> None:
+        obj.__dict__['__doc__'] = value
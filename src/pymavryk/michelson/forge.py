@@ -1,6 +1,8 @@
 from contextlib import suppress
+from functools import lru_cache
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Tuple
 from typing import Union
@@ -15,6 +17,26 @@ from pymavryk.michelson.tags import prim_tags
 
 prim_int = {v[0]: k for k, v in prim_tags.items()}
 
+implicit_prefixes = {
+    b'\x00\x00': b'mv1',
+    b'\x00\x01': b'mv2',
+    b'\x00\x02': b'mv3',
+    b'\x00\x03': b'mv4',
+}
+originated_prefixes = {
+    b'\x01': b'KT1',
+    b'\x02': b'txr1',
+    b'\x03': b'sr1',
+}
+public_key_prefixes = {
+    b'\x00': b'edpk',
+    b'\x01': b'sppk',
+    b'\x02': b'p2pk',
+}
+
+# NOTE: decoders accept any bytes-like object, pass a `memoryview` to avoid copying slices
+BytesLike = Union[bytes, bytearray, memoryview]
+
 
 def get_tag(args_len: int, annots_len: int) -> bytes:
     tag = min(args_len * 2 + 3 + (1 if annots_len > 0 else 0), 9)
@@ -32,17 +54,22 @@ def forge_int(value: int) -> bytes:
     :param value: signed unbounded integer
     """
     res = bytearray()
+    forge_int_into(res, value)
+    return bytes(res)
+
+
+def forge_int_into(buf: bytearray, value: int) -> None:
+    """Append signed unbounded integer in the byte form to the buffer (without Micheline tag)."""
     i = abs(value)
 
-    res.append((i & 0b00111111) | (0b11000000 if value < 0 else 0b10000000))
+    buf.append((i & 0b00111111) | (0b11000000 if value < 0 else 0b10000000))
     i >>= 6
 
     while i != 0:
-        res.append((i & 0b01111111) | 0b10000000)
+        buf.append((i & 0b01111111) | 0b10000000)
         i >>= 7
 
-    res[-1] &= 0b01111111
-    return bytes(res)
+    buf[-1] &= 0b01111111
 
 
 def forge_int16(value: int) -> bytes:
@@ -53,26 +80,27 @@ def forge_int32(value: int) -> bytes:
     return value.to_bytes(4, 'big')
 
 
-def unforge_int(data: bytes) -> (int, int):  # type: ignore
+def unforge_int(data: BytesLike, offset: int = 0) -> (int, int):  # type: ignore
     """Decode signed unbounded integer from bytes.
 
     :param data: Encoded integer
+    :param offset: position of the integer in data
     :returns: tuple(parsed integer, length in bytes)
     """
     value = 0
     length = 1
 
-    while data[length - 1] & 0b10000000 != 0:
+    while data[offset + length - 1] & 0b10000000 != 0:
         length += 1
 
-    for i in range(length - 1, 0, -1):
+    for i in range(offset + length - 1, offset, -1):
         value <<= 7
         value |= data[i] & 0b01111111
 
     value <<= 6
-    value |= data[0] & 0b00111111
+    value |= data[offset] & 0b00111111
 
-    if (data[0] & 0b01000000) != 0:
+    if (data[offset] & 0b01000000) != 0:
         value = -value
 
     return value, length
@@ -147,6 +175,8 @@ def optimize_timestamp(value: str) -> int:
     return int(value)
 
 
+# NOTE: addresses repeat a lot in big_map keys and parameters, base58 decoding is the most expensive part
+@lru_cache(maxsize=4096)
 def forge_address(value: str, tz_only=False) -> bytes:
     """Encode address or key hash into bytes.
 
@@ -177,31 +207,21 @@ def forge_address(value: str, tz_only=False) -> bytes:
     return res[1:] if tz_only else res
 
 
-def unforge_address(data: bytes) -> str:
+def unforge_address(data: BytesLike) -> str:
     """Decode address or key_hash from bytes.
 
     :param data: encoded address or key_hash
     :returns: base58 encoded address
     """
-    tz_prefixes = {
-        b'\x00\x00': b'mv1',
-        b'\x00\x01': b'mv2',
-        b'\x00\x02': b'mv3',
-        b'\x00\x03': b'mv4',
-    }
-
-    for bin_prefix, tz_prefix in tz_prefixes.items():
-        if data.startswith(bin_prefix):
-            return base58_encode(data[2:], tz_prefix).decode()
-
-    if data.startswith(b'\x01') and data.endswith(b'\x00'):
-        return base58_encode(data[1:-1], b'KT1').decode()
-    elif data.startswith(b'\x02') and data.endswith(b'\x00'):
-        return base58_encode(data[1:-1], b'txr1').decode()
-    elif data.startswith(b'\x03') and data.endswith(b'\x00'):
-        return base58_encode(data[1:-1], b'sr1').decode()
-    else:
-        return base58_encode(data[1:], tz_prefixes[b'\x00' + data[:1]]).decode()
+    tz_prefix = implicit_prefixes.get(bytes(data[:2]))
+    if tz_prefix:
+        return base58_encode(data[2:], tz_prefix).decode()
+
+    kt_prefix = originated_prefixes.get(bytes(data[:1]))
+    if kt_prefix and data[-1:] == b'\x00':
+        return base58_encode(data[1:-1], kt_prefix).decode()
+
+    return base58_encode(data[1:], implicit_prefixes[b'\x00' + bytes(data[:1])]).decode()
 
 
 def forge_contract(value: str) -> bytes:
@@ -217,7 +237,7 @@ def forge_contract(value: str) -> bytes:
     return res
 
 
-def unforge_contract(data: bytes) -> str:
+def unforge_contract(data: BytesLike) -> str:
     """Decode contract (address + optional entrypoint) from bytes
 
     :param data: encoded contract
@@ -225,7 +245,7 @@ def unforge_contract(data: bytes) -> str:
     """
     res = unforge_address(data[:22])
     if len(data) > 22:
-        res += f'%{data[22:].decode()}'
+        res += f'%{str(data[22:], "utf-8")}'
     return res
 
 
@@ -247,18 +267,13 @@ def forge_public_key(value: str) -> bytes:
     raise ValueError(f'Unrecognized key type: #{prefix}')
 
 
-def unforge_public_key(data: bytes) -> str:
+def unforge_public_key(data: BytesLike) -> str:
     """Decode public key from byte form.
 
     :param data: encoded public key.
     :returns: base58 encoded public key
     """
-    key_prefix = {
-        b'\x00': b'edpk',
-        b'\x01': b'sppk',
-        b'\x02': b'p2pk',
-    }
-    return base58_encode(data[1:], key_prefix[data[:1]]).decode()
+    return base58_encode(data[1:], public_key_prefixes[bytes(data[:1])]).decode()
 
 
 def forge_array(data: bytes, len_bytes=4) -> bytes:
@@ -270,145 +285,215 @@ def forge_array(data: bytes, len_bytes=4) -> bytes:
     return len(data).to_bytes(len_bytes, 'big') + data
 
 
-def unforge_array(data: bytes, len_bytes=4) -> tuple:
+def unforge_array(data: BytesLike, len_bytes=4, offset: int = 0) -> tuple:
     """Decode array of bytes.
 
     :param data: encoded array
     :param len_bytes: number of bytes to store array length
-    :returns: Tuple[list of bytes, array length]
+    :param offset: position of the array in data
+    :returns: Tuple[list of bytes (same type as data), array length]
     """
-    assert len(data) >= len_bytes, f'not enough bytes to parse array length, wanted {len_bytes}'
-    length = int.from_bytes(data[:len_bytes], 'big')
-    assert len(data) >= len_bytes + length, f'not enough bytes to parse array body, wanted {length}'
-    return data[len_bytes : len_bytes + length], len_bytes + length
+    start = offset + len_bytes
+    assert len(data) >= start, f'not enough bytes to parse array length, wanted {len_bytes}'
+    length = int.from_bytes(data[offset:start], 'big')
+    assert len(data) >= start + length, f'not enough bytes to parse array body, wanted {length}'
+    return data[start : start + length], len_bytes + length
 
 
-def forge_micheline(data: Union[List, Dict]) -> bytes:
-    """Encode a Micheline expression into the byte form.
+def begin_array(buf: bytearray) -> int:
+    """Reserve space for the array length, returns position to pass to `end_array` once the body is written."""
+    pos = len(buf)
+    buf.extend(b'\x00\x00\x00\x00')
+    return pos
+
+
+def end_array(buf: bytearray, pos: int) -> None:
+    """Back-patch the length of the array started at `pos`."""
+    buf[pos : pos + 4] = (len(buf) - pos - 4).to_bytes(4, 'big')
 
+
+def forge_prim_into(buf: bytearray, prim: str, args_len: int = 0) -> None:
+    """Append Micheline tag and primitive code, up to two arguments (without annotations) can be written next."""
+    assert args_len < 3, f'use forge_micheline_into for {args_len} args'
+    buf.append(3 + args_len * 2)
+    buf.extend(prim_tags[prim])
+
+
+def forge_int_value_into(buf: bytearray, value: int) -> None:
+    """Append Micheline int literal."""
+    buf.append(0)
+    forge_int_into(buf, value)
+
+
+def forge_string_value_into(buf: bytearray, value: str) -> None:
+    """Append Micheline string literal."""
+    data = value.encode()
+    buf.append(1)
+    buf.extend(len(data).to_bytes(4, 'big'))
+    buf.extend(data)
+
+
+def forge_bytes_value_into(buf: bytearray, value: bytes) -> None:
+    """Append Micheline bytes literal."""
+    buf.append(10)
+    buf.extend(len(value).to_bytes(4, 'big'))
+    buf.extend(value)
+
+
+def forge_micheline_into(buf: bytearray, data: Union[List, Dict]) -> None:
+    """Append a Micheline expression in the byte form to the buffer.
+
+    :param buf: output buffer
     :param data: Micheline expression
     """
-    res = []
-
     if isinstance(data, list):
-        res.append(b'\x02')
-        res.append(forge_array(b''.join(map(forge_micheline, data))))
+        buf.append(2)
+        pos = begin_array(buf)
+        for item in data:
+            forge_micheline_into(buf, item)
+        end_array(buf, pos)
 
     elif isinstance(data, dict):
         if data.get('prim'):
-            args_len = len(data.get('args', []))
-            annots_len = len(data.get('annots', []))
-
-            res.append(get_tag(args_len, annots_len))
-            res.append(prim_tags[data['prim']])
-
-            if args_len > 0:
-                args = b''.join(map(forge_micheline, data['args']))
-                if args_len < 3:
-                    res.append(args)
-                else:
-                    res.append(forge_array(args))
-
-            if annots_len > 0:
-                res.append(forge_array(' '.join(data['annots']).encode()))
-            elif args_len >= 3:
-                res.append(b'\x00' * 4)
+            args = data.get('args', [])
+            annots = data.get('annots', [])
+
+            buf.extend(get_tag(len(args), len(annots)))
+            buf.extend(prim_tags[data['prim']])
+
+            if len(args) < 3:
+                for arg in args:
+                    forge_micheline_into(buf, arg)
+            else:
+                pos = begin_array(buf)
+                for arg in args:
+                    forge_micheline_into(buf, arg)
+                end_array(buf, pos)
+
+            if annots:
+                annots_data = ' '.join(annots).encode()
+                buf.extend(len(annots_data).to_bytes(4, 'big'))
+                buf.extend(annots_data)
+            elif len(args) >= 3:
+                buf.extend(b'\x00' * 4)
 
         elif data.get('bytes') is not None:
-            res.append(b'\x0A')
-            res.append(forge_array(bytes.fromhex(data['bytes'])))
+            forge_bytes_value_into(buf, bytes.fromhex(data['bytes']))
 
         elif data.get('int') is not None:
-            res.append(b'\x00')
-            res.append(forge_int(int(data['int'])))
+            forge_int_value_into(buf, int(data['int']))
 
         elif data.get('string') is not None:
-            res.append(b'\x01')
-            res.append(forge_array(data['string'].encode()))
+            forge_string_value_into(buf, data['string'])
         else:
             raise AssertionError(data)
     else:
         raise AssertionError(data)
 
-    return b''.join(res)
+
+def forge_micheline(data: Union[List, Dict]) -> bytes:
+    """Encode a Micheline expression into the byte form.
+
+    :param data: Micheline expression
+    """
+    buf = bytearray()
+    forge_micheline_into(buf, data)
+    return bytes(buf)
 
 
-def unforge_micheline(data: bytes) -> Union[List, Dict]:
+def _unforge_sequence(data: memoryview, ptr: int) -> Tuple[List, int]:
+    _, offset = unforge_array(data, offset=ptr)
+    end, res = ptr + offset, []
+    ptr += 4
+    while ptr < end:
+        expr, ptr = _unforge_expr(data, ptr)
+        res.append(expr)
+    assert ptr == end, f'out of sequence boundaries'
+    return res, ptr
+
+
+def _unforge_prim_expr(data: memoryview, ptr: int, args_len: int, annots: bool) -> Tuple[Dict, int]:
+    expr: Dict[str, Any] = {'prim': prim_int[data[ptr]]}
+    ptr += 1
+
+    if 0 < args_len < 3:
+        args = []
+        for _ in range(args_len):
+            arg, ptr = _unforge_expr(data, ptr)
+            args.append(arg)
+        expr['args'] = args
+    elif args_len == 3:
+        expr['args'], ptr = _unforge_sequence(data, ptr)
+    else:
+        assert args_len == 0, f'unexpected args len {args_len}'
+
+    if annots or args_len == 3:
+        value, offset = unforge_array(data, offset=ptr)
+        ptr += offset
+        if len(value) > 0:
+            expr['annots'] = str(value, 'utf-8').split(' ')
+
+    return expr, ptr
+
+
+def _unforge_expr(data: memoryview, ptr: int) -> Tuple[Union[List, Dict], int]:
+    tag = data[ptr]
+    ptr += 1
+    if tag == 0:
+        value, offset = unforge_int(data, offset=ptr)
+        return {'int': str(value)}, ptr + offset
+    elif tag == 1:
+        value, offset = unforge_array(data, offset=ptr)
+        return {'string': str(value, 'utf-8')}, ptr + offset
+    elif tag == 2:
+        return _unforge_sequence(data, ptr)
+    elif 2 < tag < 10:
+        args_len, annots = read_tag(tag)
+        return _unforge_prim_expr(data, ptr, args_len, annots)
+    elif tag == 10:
+        value, offset = unforge_array(data, offset=ptr)
+        return {'bytes': value.hex()}, ptr + offset
+    else:
+        raise AssertionError(f'unkonwn tag {tag} at position {ptr}')
+
+
+def unforge_micheline(data: BytesLike) -> Union[List, Dict]:
     """Parse Micheline JSON from bytes.
 
     :param data: Forged Micheline expression
     :returns: Micheline JSON
     """
-    ptr = 0
-
-    def unforge_sequence():
-        nonlocal ptr
-        _, offset = unforge_array(data[ptr:])
-        end, res = ptr + offset, []
-        ptr += 4
-        while ptr < end:
-            res.append(unforge())
-        assert ptr == end, f'out of sequence boundaries'
-        return res
-
-    def unforge_prim_expr(args_len=0, annots=False):
-        nonlocal ptr
-        prim_tag = data[ptr]
-        ptr += 1
-        expr = {'prim': prim_int[prim_tag]}
-
-        if 0 < args_len < 3:
-            expr['args'] = [unforge() for _ in range(args_len)]
-        elif args_len == 3:
-            expr['args'] = unforge_sequence()
-        else:
-            assert args_len == 0, f'unexpected args len {args_len}'
-
-        if annots or args_len == 3:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            if len(value) > 0:
-                expr['annots'] = value.decode().split(' ')
-
-        return expr
-
-    def unforge():
-        nonlocal ptr
-        tag = data[ptr]
-        ptr += 1
-        if tag == 0:
-            value, offset = unforge_int(data[ptr:])
-            ptr += offset
-            return {'int': str(value)}
-        elif tag == 1:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'string': value.decode()}
-        elif tag == 2:
-            return unforge_sequence()
-        elif 2 < tag < 10:
-            args_len, annots = read_tag(tag)
-            return unforge_prim_expr(args_len, annots)
-        elif tag == 10:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'bytes': value.hex()}
-        else:
-            raise AssertionError(f'unkonwn tag {tag} at position {ptr}')
-
-    result = unforge()
-    assert ptr == len(data), f'have not reach EOS (pos {ptr}/{len(data)})'
+    view = memoryview(data)
+    result, ptr = _unforge_expr(view, 0)
+    assert ptr == len(view), f'have not reach EOS (pos {ptr}/{len(view)})'
     return result
 
 
+def iter_unforge_micheline(data: BytesLike, offset: int = 0) -> Iterator[Union[List, Dict]]:
+    """Parse concatenated Micheline expressions one by one.
+
+    :param data: Forged Micheline expressions, back to back
+    :param offset: position of the first expression in data
+    :returns: generator of Micheline JSON
+    """
+    view = memoryview(data)
+    ptr = offset
+    while ptr < len(view):
+        result, ptr = _unforge_expr(view, ptr)
+        yield result
+
+
 def forge_script(script: Dict[str, Any]) -> bytes:
     """Encode an origination script into the byte form.
 
     :param script: {"code": "$Micheline_expression", "storage": "$Micheline_expression"}
     """
-    code = forge_micheline(script['code'])
-    storage = forge_micheline(script['storage'])
-    return forge_array(code) + forge_array(storage)
+    buf = bytearray()
+    for section in (script['code'], script['storage']):
+        pos = begin_array(buf)
+        forge_micheline_into(buf, section)
+        end_array(buf, pos)
+    return bytes(buf)
 
 
 def forge_script_expr(packed_key: bytes) -> str:
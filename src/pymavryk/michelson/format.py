@@ -1,5 +1,7 @@
 import json
 from datetime import datetime
+from typing import IO
+from typing import List
 
 from pymavryk.logging import logger
 
@@ -87,83 +89,171 @@ def is_script(node):
     )
 
 
-def format_node(node, indent='', inline=False, is_root=False, wrapped=False):
-    if isinstance(node, list):
+class MichelsonFormatter:
+    """Formats Micheline expression in a single pass: text pieces are collected in order of appearance,
+    separators are filled in once the layout of the enclosing node is decided (based on lengths only).
+
+    :param inline: produce single line
+    :param compact: produce single line without optional spaces (e.g. for logging)
+    """
+
+    def __init__(self, inline: bool = False, compact: bool = False) -> None:
+        self.inline = inline or compact
+        self.compact = compact
+        self.pieces: List[str] = []
+
+    def placeholder(self) -> int:
+        self.pieces.append('')
+        return len(self.pieces) - 1
+
+    def format(self, node, indent: int = 0, is_root: bool = False, wrapped: bool = False) -> int:
+        """Append formatted node to `pieces`.
+
+        :param node: Micheline expression
+        :param indent: current indentation (number of spaces)
+        :returns: length of the formatted text (including line breaks)
+        """
+        if isinstance(node, list):
+            return self.format_sequence(node, indent, is_root)
+        if isinstance(node, dict):
+            if node.get('prim'):
+                return self.format_prim(node, indent, is_root, wrapped)
+            return self.format_literal(node)
+        raise AssertionError(f'unexpected node {node}')
+
+    def format_sequence(self, node: list, indent: int, is_root: bool) -> int:
+        if not node:
+            self.pieces.append('{}')
+            return 2
+
         is_script_root = is_root and is_script(node)
-        seq_indent = indent if is_script_root else indent + ' ' * 2
-        items = list(map(lambda x: format_node(x, seq_indent, inline, wrapped=True), node))
-        if items:
-            length = len(indent) + sum(map(len, items)) + 4
-            space = '' if is_script_root else ' '
-            if inline or length < line_size:
-                seq = f'{space}; '.join(items)
-            else:
-                seq = f'{space};\n{seq_indent}'.join(items)
-            return seq if is_script_root else f'{{ {seq} }}'
+        seq_indent = indent if is_script_root else indent + 2
+        if not is_script_root:
+            self.pieces.append('{' if self.compact else '{ ')
+
+        separators, length = [], 0
+        for i, item in enumerate(node):
+            if i:
+                separators.append(self.placeholder())
+            length += self.format(item, seq_indent, wrapped=True)
+
+        space = '' if is_script_root or self.compact else ' '
+        if self.compact:
+            sep = ';'
+        elif self.inline or indent + length + 4 < line_size:
+            sep = f'{space}; '
         else:
-            return '{}'
-
-    elif isinstance(node, dict):
-        if node.get('prim'):
-            expr = ' '.join([node['prim']] + node.get('annots', []))
-            args = node.get('args', [])
-
-            if is_complex(node):
-                arg_indent = indent + ' ' * 2
-                items = list(map(lambda x: format_node(x, arg_indent, inline), args))
-                length = len(indent) + len(expr) + sum(map(len, items)) + len(items) + 1
-                if inline or length < line_size:
-                    expr = f'{expr} {" ".join(items)}'
-                else:
-                    expr = f'\n{arg_indent}'.join([expr] + items)
-
-            elif len(args) == 1:
-                arg_indent = indent + ' ' * (len(expr) + 1)
-                expr = f'{expr} {format_node(args[0], arg_indent, inline)}'
-
-            elif len(args) > 1:
-                arg_indent = indent + ' ' * 2
-                alt_indent = indent + ' ' * (len(expr) + 2)
-                for arg in args:
-                    item = format_node(arg, arg_indent, inline)
-                    length = len(indent) + len(expr) + len(item) + 1
-                    if inline or is_inline(node) or length < line_size:
-                        arg_indent = alt_indent
-                        expr = f'{expr} {item}'
-                    else:
-                        expr = f'{expr}\n{arg_indent}{item}'
-
-            if is_framed(node) and not is_root and not wrapped:
-                return f'({expr})'
+            sep = f'{space};\n' + ' ' * seq_indent
+        for i in separators:
+            self.pieces[i] = sep
+        length += len(sep) * len(separators)
+
+        if is_script_root:
+            return length
+        self.pieces.append('}' if self.compact else ' }')
+        return length + (2 if self.compact else 4)
+
+    def format_prim(self, node: dict, indent: int, is_root: bool, wrapped: bool) -> int:
+        expr = ' '.join([node['prim']] + node.get('annots', []))
+        args = node.get('args', [])
+        framed = is_framed(node) and not is_root and not wrapped
+        if framed:
+            self.pieces.append('(')
+        self.pieces.append(expr)
+        length = len(expr)
+
+        if is_complex(node):
+            arg_indent = indent + 2
+            separators, items_length = [], 0
+            for arg in args:
+                separators.append(self.placeholder())
+                items_length += self.format(arg, arg_indent)
+            if self.inline or indent + length + items_length + len(args) + 1 < line_size:
+                sep = ' '
+                if not args:
+                    self.pieces.append(' ')
+                    length += 1
             else:
-                return expr
+                sep = '\n' + ' ' * arg_indent
+            for i in separators:
+                self.pieces[i] = sep
+            length += items_length + len(sep) * len(separators)
+
+        elif len(args) == 1:
+            self.pieces.append(' ')
+            length += 1 + self.format(args[0], indent + len(expr) + 1)
+
+        elif len(args) > 1:
+            arg_indent = indent + 2
+            alt_indent = indent + len(expr) + 2
+            for arg in args:
+                pos = self.placeholder()
+                item_length = self.format(arg, arg_indent)
+                if self.inline or is_inline(node) or indent + length + item_length + 1 < line_size:
+                    arg_indent = alt_indent
+                    sep = ' '
+                else:
+                    sep = '\n' + ' ' * arg_indent
+                self.pieces[pos] = sep
+                length += len(sep) + item_length
+
+        if framed:
+            self.pieces.append(')')
+            length += 2
+        return length
+
+    def format_literal(self, node: dict) -> int:
+        core_type, value = next((k, v) for k, v in node.items() if k[0] != '_' and k != 'annots')
+        if core_type == 'int':
+            text = value
+        elif core_type == 'bytes':
+            text = f'0x{value}'
+        elif core_type == 'string':
+            text = json.dumps(value)
         else:
-            core_type, value = next((k, v) for k, v in node.items() if k[0] != '_' and k != 'annots')
-            if core_type == 'int':
-                return value
-            elif core_type == 'bytes':
-                return f'0x{value}'
-            elif core_type == 'string':
-                return json.dumps(value)
-            else:
-                raise AssertionError(f'unexpected core node {node}')
-    else:
-        raise AssertionError(f'unexpected node {node}')
+            raise AssertionError(f'unexpected core node {node}')
+        self.pieces.append(text)
+        return len(text)
+
+
+def format_node(node, indent='', inline=False, is_root=False, wrapped=False):
+    formatter = MichelsonFormatter(inline=inline)
+    formatter.format(node, len(indent), is_root=is_root, wrapped=wrapped)
+    return ''.join(formatter.pieces)
+
+
+def format_pieces(data, inline=False, wrap=False, compact=False) -> List[str]:
+    try:
+        formatter = MichelsonFormatter(inline=inline, compact=compact)
+        formatter.format(data, is_root=True)
+    except (KeyError, IndexError, TypeError) as e:
+        logger.info(data)
+        raise MichelsonFormatterError(e.args) from e
+
+    pieces = formatter.pieces
+    if wrap and any(map(pieces[0].startswith, ['Left', 'Right', 'Some', 'Pair'])):
+        return ['(', *pieces, ')']
+    return pieces
 
 
-def micheline_to_michelson(data, inline=False, wrap=False) -> str:
+def micheline_to_michelson(data, inline=False, wrap=False, compact=False) -> str:
     """Converts micheline expression into formatted Michelson source.
 
     :param data: Micheline expression
     :param inline: produce single line, used for octez-client arguments (False by default)
     :param wrap: ensure expression is wrapped in brackets
+    :param compact: produce single line without optional spaces, e.g. for logging (False by default)
     """
-    try:
-        res = format_node(data, inline=inline, is_root=True)
-        if wrap and any(map(res.startswith, ['Left', 'Right', 'Some', 'Pair'])):
-            return f'({res})'
-        else:
-            return res
-    except (KeyError, IndexError, TypeError) as e:
-        logger.info(data)
-        raise MichelsonFormatterError(e.args)
+    return ''.join(format_pieces(data, inline=inline, wrap=wrap, compact=compact))
+
+
+def write_michelson(data, stream: IO[str], inline=False, wrap=False, compact=False) -> None:
+    """Same as `micheline_to_michelson`, but writes the result to a text stream.
+
+    :param data: Micheline expression
+    :param stream: writable text stream
+    :param inline: produce single line (False by default)
+    :param wrap: ensure expression is wrapped in brackets
+    :param compact: produce single line without optional spaces (False by default)
+    """
+    stream.writelines(format_pieces(data, inline=inline, wrap=wrap, compact=compact))
@@ -0,0 +1,270 @@
+import math
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from pymavryk.michelson.micheline import Micheline
+from pymavryk.michelson.micheline import MichelsonRuntimeError
+from pymavryk.michelson.stack import MichelsonStack
+from pymavryk.michelson.types import BigMapType
+from pymavryk.michelson.types import BytesType
+from pymavryk.michelson.types import IntType
+from pymavryk.michelson.types import ListType
+from pymavryk.michelson.types import MapType
+from pymavryk.michelson.types import MichelsonType
+from pymavryk.michelson.types import OptionType
+from pymavryk.michelson.types import OrType
+from pymavryk.michelson.types import PairType
+from pymavryk.michelson.types import SetType
+from pymavryk.michelson.types import StringType
+
+MILLIGAS_PER_GAS = 1000
+
+# NOTE: all costs are in milligas; this is a rough heuristic, NOT the protocol gas model: constants are hand-picked
+# approximations and sizes are estimated cheaply (see `value_size`), so results can be off in both directions.
+# Use it to compare code paths or catch runaway loops locally, get the actual gas from a node (`run_operation`)
+TRANSACTION_BASE_COST = 100_000
+DEFAULT_INSTRUCTION_COST = 10
+DECODING_NODE_COST = 100
+DECODING_BYTE_COST = 10
+SERIALIZATION_NODE_COST = 40
+BIG_MAP_READ_COST = 100_000
+SIGNATURE_CHECK_COSTS = {
+    'edpk': 65_800,
+    'sppk': 51_600,
+    'p2pk': 341_000,
+    'BLpk': 1_570_000,
+}
+
+CostFunction = Callable[[Type[Micheline], List[MichelsonType]], int]
+
+
+class GasExhaustedError(MichelsonRuntimeError):
+    pass
+
+
+def int_size(value: int) -> int:
+    """Size of an integer in bytes"""
+    return (abs(value).bit_length() + 7) // 8
+
+
+def value_size(item: MichelsonType) -> int:
+    """Estimated size of a value: bytes for scalars, number of elements for collections (not traversed)"""
+    if isinstance(item, IntType):
+        return int_size(int(item))
+    if isinstance(item, (StringType, BytesType)):
+        return len(item.value)
+    if isinstance(item, (PairType, OrType)):
+        return sum(value_size(x) for x in item.items if isinstance(x, MichelsonType))
+    if isinstance(item, OptionType):
+        return 1 + (value_size(item.item) if item.item is not None else 0)
+    if isinstance(item, (ListType, SetType, MapType)):
+        return len(item)
+    return 1
+
+
+def micheline_size(expr) -> Tuple[int, int]:
+    """Number of nodes and total length of literals of a Micheline expression"""
+    nodes, size = 0, 0
+    queue = [expr]
+    while queue:
+        node = queue.pop()
+        nodes += 1
+        if isinstance(node, list):
+            queue.extend(node)
+        elif isinstance(node, dict):
+            if 'prim' in node:
+                queue.extend(node.get('args', []))
+            else:
+                size += sum(len(str(value)) for value in node.values())
+    return nodes, size
+
+
+def log2(size: int) -> int:
+    return int(math.log2(size + 1)) + 1
+
+
+def get_int_arg(instr: Type[Micheline]) -> int:
+    literal = getattr(instr.args[0], 'literal', None) if instr.args else None
+    return literal if isinstance(literal, int) else 1
+
+
+def compare_cost(a: MichelsonType, b: MichelsonType) -> int:
+    return 35 + min(value_size(a), value_size(b)) // 2
+
+
+def access_cost(key: MichelsonType, collection: MichelsonType) -> int:
+    cost = 45 + (10 + value_size(key) // 2) * log2(value_size(collection))
+    if isinstance(collection, BigMapType):
+        # NOTE: key is packed and hashed, value is read from the context storage
+        cost += serialization_cost(key) + hash_cost(key) + BIG_MAP_READ_COST
+    return cost
+
+
+def serialization_cost(item: MichelsonType) -> int:
+    return 10 + SERIALIZATION_NODE_COST * value_size(item)
+
+
+def hash_cost(item: MichelsonType) -> int:
+    size = value_size(item)
+    return 430 + size + (size >> 3)
+
+
+def arithmetic_cost(base: int) -> CostFunction:
+    return lambda instr, items: base + max(map(value_size, items)) // 2
+
+
+def mul_cost(instr: Type[Micheline], items: List[MichelsonType]) -> int:
+    size = sum(map(value_size, items))
+    return 45 + (size * log2(size)) // 2
+
+
+def ediv_cost(instr: Type[Micheline], items: List[MichelsonType]) -> int:
+    a, b = map(value_size, items)
+    return 150 + a * (b + 1) // 4
+
+
+def concat_cost(instr: Type[Micheline], items: List[MichelsonType]) -> int:
+    a = items[0]
+    if isinstance(a, ListType):
+        return 100 + sum(value_size(x) // 2 + 10 for x in a)
+    return 45 + value_size(a) // 2 + (value_size(items[1]) // 2 if len(items) > 1 else 0)
+
+
+def check_signature_cost(instr: Type[Micheline], items: List[MichelsonType]) -> int:
+    key, _, message = items
+    return SIGNATURE_CHECK_COSTS.get(str(key)[:4], 65_800) + value_size(message)
+
+
+def pairing_check_cost(instr: Type[Micheline], items: List[MichelsonType]) -> int:
+    return 450_000 + 342_500 * value_size(items[0])
+
+
+def constant(cost: int) -> CostFunction:
+    return lambda instr, items: cost
+
+
+def depth_cost(base: int) -> CostFunction:
+    return lambda instr, items: base + get_int_arg(instr)
+
+
+# NOTE: prim => (number of stack items the cost depends on, cost function)
+INSTRUCTION_COSTS: Dict[str, Tuple[int, CostFunction]] = {
+    'ABS': (0, constant(20)),
+    'ADD': (2, arithmetic_cost(35)),
+    'APPLY': (0, constant(140)),
+    'BLAKE2B': (1, lambda instr, items: hash_cost(items[0])),
+    'CHAIN_ID': (0, constant(15)),
+    'CHECK_SIGNATURE': (3, check_signature_cost),
+    'COMPARE': (2, lambda instr, items: compare_cost(*items)),
+    'CONCAT': (2, concat_cost),
+    'CONTRACT': (0, constant(30 + BIG_MAP_READ_COST)),
+    'CREATE_CONTRACT': (0, constant(60)),
+    'DIG': (0, depth_cost(10)),
+    'DIP': (0, depth_cost(10)),
+    'DROP': (0, depth_cost(10)),
+    'DUG': (0, depth_cost(10)),
+    'DUP': (0, depth_cost(10)),
+    'EDIV': (2, ediv_cost),
+    'EMPTY_BIG_MAP': (0, constant(300)),
+    'EMPTY_MAP': (0, constant(300)),
+    'EMPTY_SET': (0, constant(300)),
+    'FAILWITH': (0, constant(167)),
+    'GET': (2, lambda instr, items: access_cost(*items) if not instr.args else 15 + get_int_arg(instr) // 2),
+    'GET_AND_UPDATE': (3, lambda instr, items: 35 + access_cost(items[0], items[2])),
+    'HASH_KEY': (0, constant(605)),
+    'ITER': (0, constant(20)),
+    'KECCAK': (1, lambda instr, items: 1350 + 9 * value_size(items[0])),
+    'LSL': (2, arithmetic_cost(50)),
+    'LSR': (2, arithmetic_cost(50)),
+    'MAP': (0, constant(20)),
+    'MEM': (2, lambda instr, items: access_cost(*items)),
+    'MUL': (2, mul_cost),
+    'NEG': (0, constant(25)),
+    'PACK': (1, lambda instr, items: serialization_cost(items[0])),
+    'PAIR': (0, lambda instr, items: 10 if not instr.args else 15 + get_int_arg(instr) // 2),
+    'PAIRING_CHECK': (1, pairing_check_cost),
+    'SET_DELEGATE': (0, constant(30)),
+    'SHA256': (1, lambda instr, items: 600 + 5 * value_size(items[0])),
+    'SHA3': (1, lambda instr, items: 1350 + 9 * value_size(items[0])),
+    'SHA512': (1, lambda instr, items: 680 + 3 * value_size(items[0])),
+    'SLICE': (3, lambda instr, items: 25 + value_size(items[2]) // 2),
+    'SIZE': (0, constant(15)),
+    'SUB': (2, arithmetic_cost(35)),
+    'TOTAL_VOTING_POWER': (0, constant(450)),
+    'TRANSFER_TOKENS': (0, constant(60)),
+    'UNPACK': (1, lambda instr, items: 260 + DECODING_BYTE_COST * value_size(items[0])),
+    'UNPAIR': (0, lambda instr, items: 10 if not instr.args else 15 + get_int_arg(instr) // 2),
+    'UPDATE': (3, lambda instr, items: 80 + access_cost(items[0], items[2]) if not instr.args else 15),
+    'VOTING_POWER': (0, constant(640)),
+}
+
+
+class GasMeter:
+    """Roughly estimates gas consumed by the interpreter, optionally enforcing a limit.
+
+    Costs are heuristic (see the note at the top of this module), do not use them to set operation gas limits.
+    Pass it to `Interpreter.run_code` or `ContractCall.interpret` and check `consumed_gas` afterwards:
+
+    .. code-block:: python
+
+        meter = GasMeter(limit=constants['hard_gas_limit_per_operation'])
+        res = contract.transfer(...).interpret(storage=storage, gas_meter=meter)
+        print(meter.consumed_gas)
+
+    :param limit: gas limit (in gas units), None for no limit
+    :param costs: override instruction cost functions (prim => (number of inputs, cost function))
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        costs: Optional[Dict[str, Tuple[int, CostFunction]]] = None,
+    ) -> None:
+        self.limit = limit
+        self.costs = INSTRUCTION_COSTS if costs is None else {**INSTRUCTION_COSTS, **costs}
+        self.consumed_milligas = 0
+
+    def __repr__(self) -> str:
+        limit = self.limit if self.limit is not None else '-'
+        return f'<GasMeter {self.consumed_gas}/{limit}>'
+
+    @property
+    def consumed_gas(self) -> int:
+        return math.ceil(self.consumed_milligas / MILLIGAS_PER_GAS)
+
+    @property
+    def remaining_gas(self) -> Optional[int]:
+        return None if self.limit is None else max(self.limit - self.consumed_gas, 0)
+
+    def reset(self) -> None:
+        self.consumed_milligas = 0
+
+    def consume(self, milligas: int, reason: str = '') -> None:
+        """Charge gas, raises if the limit is exceeded
+
+        :param milligas: amount of gas in milligas
+        :param reason: what is being charged for (for error message)
+        """
+        self.consumed_milligas += milligas
+        if self.limit is not None and self.consumed_milligas > self.limit * MILLIGAS_PER_GAS:
+            raise GasExhaustedError(f'gas exhausted{" at " + reason if reason else ""}, limit is {self.limit}')
+
+    def consume_instruction(self, instr: Type[Micheline], stack: MichelsonStack) -> None:
+        """Charge for the instruction about to be executed, based on its inputs"""
+        arity, cost = self.costs.get(instr.prim, (0, None))  # type: ignore
+        if cost is None:
+            milligas = DEFAULT_INSTRUCTION_COST
+        else:
+            items = stack.peekn(arity) if arity else []
+            milligas = cost(instr, items) if len(items) == arity else DEFAULT_INSTRUCTION_COST
+        self.consume(milligas, reason=instr.prim or '')
+
+    def consume_micheline(self, expr: Any) -> None:
+        """Charge for decoding (or encoding) a Micheline expression"""
+        nodes, size = micheline_size(expr)
+        self.consume(DECODING_NODE_COST * nodes + DECODING_BYTE_COST * size, reason='decoding')
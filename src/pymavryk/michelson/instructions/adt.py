@@ -4,7 +4,7 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import MichelsonType
 from pymavryk.michelson.types import OrType
@@ -16,7 +16,7 @@ def execute_cxr(prim: str, stack: MichelsonStack, stdout: List[str], idx: int):
     pair.assert_type_in(PairType)
     res = pair.items[idx]
     stack.push(res)
-    stdout.append(format_stdout(prim, [pair], [res]))
+    trace_stdout(stdout, prim, [pair], [res])
 
 
 class CarInstruction(MichelsonInstruction, prim='CAR'):
@@ -41,7 +41,7 @@ class GetnInstruction(MichelsonInstruction, prim='GET', args_len=1):
         index = cls.args[0].get_int()  # type: ignore
         res = pair.access_comb(index)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [pair], [res], index))  # type: ignore
+        trace_stdout(stdout, cls.prim, [pair], [res], index)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -53,7 +53,7 @@ class UpdatenInstruction(MichelsonInstruction, prim='UPDATE', args_len=1):
         index = cls.args[0].get_int()  # type: ignore
         res = pair.update_comb(index, element)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [element, pair], [res], index))  # type: ignore
+        trace_stdout(stdout, cls.prim, [element, pair], [res], index)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -63,7 +63,7 @@ class LeftInstruction(MichelsonInstruction, prim='LEFT', args_len=1):
         left = stack.pop1()
         res = OrType.from_left(left, cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [left], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [left], [res])  # type: ignore
         return cls()
 
 
@@ -73,7 +73,7 @@ class RightInstruction(MichelsonInstruction, prim='RIGHT', args_len=1):
         right = stack.pop1()
         res = OrType.from_right(right, cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [right], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [right], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -83,7 +83,7 @@ class PairInstruction(MichelsonInstruction, prim='PAIR'):
         left, right = stack.pop2()
         res = PairType.from_comb([left, right])
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [left, right], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [left, right], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -95,7 +95,7 @@ class UnpairInstruction(MichelsonInstruction, prim='UNPAIR'):
         left, right = tuple(iter(pair))
         stack.push(right)
         stack.push(left)
-        stdout.append(format_stdout(cls.prim, [pair], [left, right]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [pair], [left, right])  # type: ignore
         return cls(stack_items_added=2)
 
 
@@ -107,7 +107,7 @@ class PairnInstruction(MichelsonInstruction, prim='PAIR', args_len=1):
         leaves = stack.pop(count=count)
         res = PairType.from_comb(leaves)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, leaves, [res], count))  # type: ignore
+        trace_stdout(stdout, cls.prim, leaves, [res], count)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -121,5 +121,5 @@ class UnpairnInstruction(MichelsonInstruction, prim='UNPAIR', args_len=1):
         leaves = list(pair.unpairn_comb(count - 2))
         for leaf in reversed(leaves):
             stack.push(leaf)
-        stdout.append(format_stdout(cls.prim, [pair], leaves, count))  # type: ignore
+        trace_stdout(stdout, cls.prim, [pair], leaves, count)  # type: ignore
         return cls(stack_items_added=len(leaves))
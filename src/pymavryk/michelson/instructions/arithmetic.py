@@ -9,8 +9,9 @@ from py_ecc import optimized_bls12_381 as bls12_381
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
+from pymavryk.michelson.instructions.base import TypeDispatchTable
 from pymavryk.michelson.instructions.base import dispatch_types
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import BLS12_381_FrType
 from pymavryk.michelson.types import BLS12_381_G1Type
@@ -32,10 +33,26 @@ class AbsInstruction(MichelsonInstruction, prim='ABS'):
         a.assert_type_equal(IntType)
         res = NatType.from_value(abs(int(a)))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
+ADD_TYPES = TypeDispatchTable(
+    {
+        (NatType, NatType): (NatType,),
+        (NatType, IntType): (IntType,),
+        (IntType, NatType): (IntType,),
+        (IntType, IntType): (IntType,),
+        (TimestampType, IntType): (TimestampType,),
+        (IntType, TimestampType): (TimestampType,),
+        (MumavType, MumavType): (MumavType,),
+        (BLS12_381_FrType, BLS12_381_FrType): (BLS12_381_FrType,),
+        (BLS12_381_G1Type, BLS12_381_G1Type): (BLS12_381_G1Type,),
+        (BLS12_381_G2Type, BLS12_381_G2Type): (BLS12_381_G2Type,),
+    }
+)
+
+
 class AddInstruction(MichelsonInstruction, prim='ADD'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
@@ -49,18 +66,7 @@ class AddInstruction(MichelsonInstruction, prim='ADD'):
         (res_type,) = dispatch_types(
             type(a),
             type(b),
-            mapping={
-                (NatType, NatType): (NatType,),
-                (NatType, IntType): (IntType,),
-                (IntType, NatType): (IntType,),
-                (IntType, IntType): (IntType,),
-                (TimestampType, IntType): (TimestampType,),
-                (IntType, TimestampType): (TimestampType,),
-                (MumavType, MumavType): (MumavType,),
-                (BLS12_381_FrType, BLS12_381_FrType): (BLS12_381_FrType,),
-                (BLS12_381_G1Type, BLS12_381_G1Type): (BLS12_381_G1Type,),
-                (BLS12_381_G2Type, BLS12_381_G2Type): (BLS12_381_G2Type,),
-            },
+            mapping=ADD_TYPES,
         )
         res_type = cast(
             Union[
@@ -79,10 +85,22 @@ class AddInstruction(MichelsonInstruction, prim='ADD'):
         else:
             res = res_type.from_point(bls12_381.add(a.to_point(), b.to_point()))  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
+EDIV_TYPES = TypeDispatchTable(
+    {
+        (NatType, NatType): (NatType, NatType),
+        (NatType, IntType): (IntType, NatType),
+        (IntType, NatType): (IntType, NatType),
+        (IntType, IntType): (IntType, NatType),
+        (MumavType, NatType): (MumavType, MumavType),
+        (MumavType, MumavType): (NatType, MumavType),
+    }
+)
+
+
 class EdivInstruction(MichelsonInstruction, prim='EDIV'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
@@ -93,14 +111,7 @@ class EdivInstruction(MichelsonInstruction, prim='EDIV'):
         q_type, r_type = dispatch_types(
             type(a),
             type(b),
-            mapping={  # type: ignore
-                (NatType, NatType): (NatType, NatType),
-                (NatType, IntType): (IntType, NatType),
-                (IntType, NatType): (IntType, NatType),
-                (IntType, IntType): (IntType, NatType),
-                (MumavType, NatType): (MumavType, MumavType),
-                (MumavType, MumavType): (NatType, MumavType),
-            },
+            mapping=EDIV_TYPES,  # type: ignore
         )  # type: Tuple[Union[Type[IntType], Type[NatType], Type[TimestampType], Type[MumavType]], Union[Type[IntType], Type[NatType], Type[TimestampType], Type[MumavType]]]
         if int(b) == 0:
             res = OptionType.none(PairType.create_type(args=[q_type, r_type]))
@@ -112,7 +123,7 @@ class EdivInstruction(MichelsonInstruction, prim='EDIV'):
             items: List[MichelsonType] = [q_type.from_value(q), r_type.from_value(r)]
             res = OptionType.from_some(PairType.from_comb(items))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -124,7 +135,7 @@ def execute_shift(prim: str, stack: MichelsonStack, stdout: List[str], shift: Ca
     c = shift((int(a), int(b)))
     res = NatType.from_value(c)
     stack.push(res)
-    stdout.append(format_stdout(prim, [a, b], [res]))
+    trace_stdout(stdout, prim, [a, b], [res])
 
 
 class LslInstruction(MichelsonInstruction, prim='LSL'):
@@ -141,6 +152,25 @@ class LsrInstruction(MichelsonInstruction, prim='LSR'):
         return cls(stack_items_added=1)
 
 
+MUL_TYPES = TypeDispatchTable(
+    {
+        (NatType, NatType): (NatType,),
+        (NatType, IntType): (IntType,),
+        (IntType, NatType): (IntType,),
+        (IntType, IntType): (IntType,),
+        (MumavType, NatType): (MumavType,),
+        (NatType, MumavType): (MumavType,),
+        (NatType, BLS12_381_FrType): (BLS12_381_FrType,),
+        (IntType, BLS12_381_FrType): (BLS12_381_FrType,),
+        (BLS12_381_FrType, NatType): (BLS12_381_FrType,),
+        (BLS12_381_FrType, IntType): (BLS12_381_FrType,),
+        (BLS12_381_FrType, BLS12_381_FrType): (BLS12_381_FrType,),
+        (BLS12_381_G1Type, BLS12_381_FrType): (BLS12_381_G1Type,),
+        (BLS12_381_G2Type, BLS12_381_FrType): (BLS12_381_G2Type,),
+    }
+)
+
+
 class MulInstruction(MichelsonInstruction, prim='MUL'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
@@ -151,21 +181,7 @@ class MulInstruction(MichelsonInstruction, prim='MUL'):
         (res_type,) = dispatch_types(
             type(a),
             type(b),
-            mapping={
-                (NatType, NatType): (NatType,),
-                (NatType, IntType): (IntType,),
-                (IntType, NatType): (IntType,),
-                (IntType, IntType): (IntType,),
-                (MumavType, NatType): (MumavType,),
-                (NatType, MumavType): (MumavType,),
-                (NatType, BLS12_381_FrType): (BLS12_381_FrType,),
-                (IntType, BLS12_381_FrType): (BLS12_381_FrType,),
-                (BLS12_381_FrType, NatType): (BLS12_381_FrType,),
-                (BLS12_381_FrType, IntType): (BLS12_381_FrType,),
-                (BLS12_381_FrType, BLS12_381_FrType): (BLS12_381_FrType,),
-                (BLS12_381_G1Type, BLS12_381_FrType): (BLS12_381_G1Type,),
-                (BLS12_381_G2Type, BLS12_381_FrType): (BLS12_381_G2Type,),
-            },
+            mapping=MUL_TYPES,
         )
         res_type = cast(
             Union[
@@ -184,33 +200,51 @@ class MulInstruction(MichelsonInstruction, prim='MUL'):
         else:
             res = res_type.from_point(bls12_381.multiply(a.to_point(), int(b)))  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
+NEG_TYPES = TypeDispatchTable(
+    {
+        (IntType,): (IntType,),
+        (NatType,): (IntType,),
+        (BLS12_381_FrType,): (BLS12_381_FrType,),
+        (BLS12_381_G1Type,): (BLS12_381_G1Type,),
+        (BLS12_381_G2Type,): (BLS12_381_G2Type,),
+    }
+)
+
+
 class NegInstruction(MichelsonInstruction, prim='NEG'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         a = cast(Union[IntType, NatType, BLS12_381_FrType, BLS12_381_G1Type, BLS12_381_G2Type], stack.pop1())
         (res_type,) = dispatch_types(
             type(a),
-            mapping={
-                (IntType,): (IntType,),
-                (NatType,): (IntType,),
-                (BLS12_381_FrType,): (BLS12_381_FrType,),
-                (BLS12_381_G1Type,): (BLS12_381_G1Type,),
-                (BLS12_381_G2Type,): (BLS12_381_G2Type,),
-            },
+            mapping=NEG_TYPES,
         )
         if issubclass(res_type, IntType):
             res = IntType.from_value(-int(a))  # type: ignore
         else:
             res = res_type.from_point(bls12_381.neg(a.to_point()))  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
+SUB_TYPES = TypeDispatchTable(
+    {
+        (NatType, NatType): (IntType,),
+        (NatType, IntType): (IntType,),
+        (IntType, NatType): (IntType,),
+        (IntType, IntType): (IntType,),
+        (TimestampType, IntType): (TimestampType,),
+        (TimestampType, TimestampType): (IntType,),
+        (MumavType, MumavType): (MumavType,),
+    }
+)
+
+
 class SubInstruction(MichelsonInstruction, prim='SUB'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
@@ -218,19 +252,11 @@ class SubInstruction(MichelsonInstruction, prim='SUB'):
         (res_type,) = dispatch_types(
             type(a),
             type(b),
-            mapping={  # type: ignore
-                (NatType, NatType): (IntType,),
-                (NatType, IntType): (IntType,),
-                (IntType, NatType): (IntType,),
-                (IntType, IntType): (IntType,),
-                (TimestampType, IntType): (TimestampType,),
-                (TimestampType, TimestampType): (IntType,),
-                (MumavType, MumavType): (MumavType,),
-            },
+            mapping=SUB_TYPES,  # type: ignore
         )  # type: Tuple[Union[Type[IntType], Type[NatType], Type[TimestampType], Type[MumavType]]]
         res = res_type.from_value(int(a) - int(b))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -245,7 +271,7 @@ class SubMumavInstruction(MichelsonInstruction, prim='SUB_MUMAV'):
         except OverflowError:
             res = OptionType.none(MumavType)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -260,7 +286,7 @@ class IntInstruction(MichelsonInstruction, prim='INT'):
             a.assert_type_in(NatType, BLS12_381_FrType)
             res = IntType.from_value(int(a))
         stack.push(res)
-        stdout.append(f'{cls.prim} / {repr(a)} => {repr(res)}')
+        trace_stdout(stdout, cls.prim, [a], [res])
         return cls(stack_items_added=1)
 
 
@@ -274,7 +300,7 @@ class IsNatInstruction(MichelsonInstruction, prim='ISNAT'):
         else:
             res = OptionType.none(NatType)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -285,7 +311,7 @@ class NatInstruction(MichelsonInstruction, prim='NAT'):
         a.assert_type_in(BytesType)
         res = NatType.from_value(int.from_bytes(bytes(a), 'big'))
         stack.push(res)
-        stdout.append(f'{cls.prim} / {repr(a)} => {repr(res)}')
+        trace_stdout(stdout, cls.prim, [a], [res])
         return cls(stack_items_added=1)
 
 
@@ -304,5 +330,5 @@ class BytesInstruction(MichelsonInstruction, prim='BYTES'):
         byte_val = int_val.to_bytes(length, 'big', signed=signed).lstrip(b'\x00')
         res = BytesType.from_value(byte_val)
         stack.push(res)
-        stdout.append(f'{cls.prim} / {repr(a)} => {repr(res)}')
+        trace_stdout(stdout, cls.prim, [a], [res])
         return cls(stack_items_added=1)
@@ -10,6 +10,9 @@ from typing import cast
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.stack import MichelsonStack
+from pymavryk.michelson.trace import NullStdout
+from pymavryk.michelson.trace import TraceSink
+from pymavryk.michelson.trace import format_stdout
 
 
 class Wildcard:
@@ -21,19 +24,31 @@ class Wildcard:
         return '*'
 
 
-def format_stdout(prim: str, inputs: list, outputs: list, arg=None):
-    arg = f' {arg}' if arg else ''
-    pop = " : ".join(map(repr, inputs)) if inputs else '_'
-    push = " : ".join(map(repr, outputs)) if outputs else '_'
-    return f'{prim}{arg} / {pop} => {push}'
+def trace_stdout(stdout: List[str], prim: str, inputs: list, outputs: list, arg=None) -> None:
+    # NOTE: formatting (repr of all the values) is skipped if tracing is disabled, and deferred to the sink if any
+    if isinstance(stdout, TraceSink):
+        stdout.record(prim, inputs, outputs, arg)
+    elif not isinstance(stdout, NullStdout):
+        stdout.append(format_stdout(prim, inputs, outputs, arg))
+
+
+class TypeDispatchTable(Dict[Tuple[str, ...], Tuple[Any, ...]]):
+    """Type dispatch mapping keyed by primitives, build it once (e.g. at module level) and pass to `dispatch_types`
+
+    :param mapping: {(Type, ...): (result, ...)}
+    """
+
+    def __init__(self, mapping: Dict[Tuple[Type[Micheline], ...], Tuple[Any, ...]]) -> None:
+        super().__init__({tuple(arg.prim for arg in k): v for k, v in mapping.items()})  # type: ignore
 
 
 def dispatch_types(
     *args: Type[Micheline],
-    mapping: Dict[Tuple[Type[Micheline], ...], Tuple[Any, ...]],
+    mapping: Union[TypeDispatchTable, Dict[Tuple[Type[Micheline], ...], Tuple[Any, ...]]],
 ):
     key = tuple(arg.prim for arg in args)
-    mapping = {tuple(arg.prim for arg in k): v for k, v in mapping.items()}  # type: ignore
+    if not isinstance(mapping, TypeDispatchTable):
+        mapping = TypeDispatchTable(mapping)
     assert key in mapping, f'unexpected types `{" * ".join(key)}`'  # type: ignore
     return mapping[key]  # type: ignore
 
@@ -4,7 +4,7 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import BoolType
 from pymavryk.michelson.types import IntType
@@ -26,7 +26,7 @@ class CompareInstruction(MichelsonInstruction, prim='COMPARE'):
         a.assert_type_equal(type(b))
         res = IntType.from_value(compare(a, b))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -35,7 +35,7 @@ def execute_zero_compare(prim: str, stack: MichelsonStack, stdout: List[str], co
     a.assert_type_equal(IntType)
     res = BoolType(compare(int(a)))
     stack.push(res)
-    stdout.append(format_stdout(prim, [a], [res]))
+    trace_stdout(stdout, prim, [a], [res])
 
 
 class EqInstruction(MichelsonInstruction, prim='EQ'):
@@ -8,7 +8,7 @@ from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.adt import PairInstruction
 from pymavryk.michelson.instructions.base import MichelsonInstruction
 from pymavryk.michelson.instructions.base import Wildcard
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.instructions.stack import PushInstruction
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.micheline import MichelsonRuntimeError
@@ -32,11 +32,11 @@ def execute_dip(
     body: Type[MichelsonInstruction],
     context: AbstractContext,
 ) -> MichelsonInstruction:
-    stdout.append(format_stdout(prim, [*Wildcard.n(count)], []))
+    trace_stdout(stdout, prim, [*Wildcard.n(count)], [])
     stack.protect(count=count)
     item = body.execute(stack, stdout, context=context)
     stack.restore(count=count)
-    stdout.append(format_stdout(prim, [], [*Wildcard.n(count)], count))
+    trace_stdout(stdout, prim, [], [*Wildcard.n(count)], count)
     return item
 
 
@@ -69,7 +69,7 @@ class LambdaInstruction(MichelsonInstruction, prim='LAMBDA', args_len=3):
         lambda_type = LambdaType.create_type(args=cls.args[:2])
         res = lambda_type(cls.args[2])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -88,7 +88,7 @@ class LambdaRecInstruction(MichelsonInstruction, prim='LAMBDA_REC', args_len=3):
         body = MichelineSequence.create_type(args=[inner, cls.args[2]])
         res = lambda_type(body)  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -102,7 +102,7 @@ class ExecInstruction(MichelsonInstruction, prim='EXEC'):
         param, lambda_ = cast(Tuple[MichelsonType, LambdaType], stack.pop2())
         assert isinstance(lambda_, LambdaType), f'expected lambda, got {lambda_.prim}'
         param.assert_type_equal(lambda_.args[0])
-        stdout.append(format_stdout(cls.prim, [param, lambda_], []))  # type: ignore
+        trace_stdout(stdout, cls.prim, [param, lambda_], [])  # type: ignore
         lambda_stack = MichelsonStack.from_items([param])
         lambda_body = cast(MichelsonInstruction, lambda_.value)
         item = lambda_body.execute(lambda_stack, stdout, context=context)
@@ -131,7 +131,7 @@ class ApplyInstruction(MichelsonInstruction, prim='APPLY'):
         )
         res = LambdaType.create_type(args=[right_type, lambda_.args[1]])(new_value)  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [left, lambda_], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [left, lambda_], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -152,7 +152,7 @@ class IfInstruction(MichelsonInstruction, prim='IF', args_len=2):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         cond = cast(BoolType, stack.pop1())
         cond.assert_type_equal(BoolType)
-        stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
+        trace_stdout(stdout, cls.prim, [cond], [])  # type: ignore
         branch = cls.args[0] if bool(cond) else cls.args[1]
         item = branch.execute(stack, stdout, context=context)
         return cls(item)
@@ -171,11 +171,11 @@ class IfConsInstruction(MichelsonInstruction, prim='IF_CONS', args_len=2):
             head, tail = lst.split_head()
             stack.push(tail)
             stack.push(head)
-            stdout.append(format_stdout(cls.prim, [lst], [head, tail]))  # type: ignore
+            trace_stdout(stdout, cls.prim, [lst], [head, tail])  # type: ignore
             branch = cls.args[0]
             stack_items_added = 2
         else:
-            stdout.append(format_stdout(cls.prim, [lst], []))  # type: ignore
+            trace_stdout(stdout, cls.prim, [lst], [])  # type: ignore
             branch = cls.args[1]
             stack_items_added = 0
         item = branch.execute(stack, stdout, context=context)
@@ -194,7 +194,7 @@ class IfLeftInstruction(MichelsonInstruction, prim='IF_LEFT', args_len=2):
         branch = cls.args[0] if or_.is_left() else cls.args[1]
         res = or_.resolve()
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [or_], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [or_], [res])  # type: ignore
         item = branch.execute(stack, stdout, context=context)
         return cls(item)
 
@@ -210,12 +210,12 @@ class IfNoneInstruction(MichelsonInstruction, prim='IF_NONE', args_len=2):
         opt.assert_type_in(OptionType)
         if opt.is_none():
             branch = cls.args[0]
-            stdout.append(format_stdout(cls.prim, [opt], []))  # type: ignore
+            trace_stdout(stdout, cls.prim, [opt], [])  # type: ignore
             stack_items_added = 0
         else:
             some = opt.get_some()
             stack.push(some)
-            stdout.append(format_stdout(cls.prim, [opt], [some]))  # type: ignore
+            trace_stdout(stdout, cls.prim, [opt], [some])  # type: ignore
             branch = cls.args[1]
             stack_items_added = 1
         item = branch.execute(stack, stdout, context=context)
@@ -233,7 +233,7 @@ class LoopInstruction(MichelsonInstruction, prim='LOOP', args_len=1):
         while True:
             cond = cast(BoolType, stack.pop1())
             cond.assert_type_equal(BoolType)
-            stdout.append(format_stdout(cls.prim, [cond], []))  # type: ignore
+            trace_stdout(stdout, cls.prim, [cond], [])  # type: ignore
             if bool(cond):
                 item = cls.args[0].execute(stack, stdout, context=context)
                 items.append(item)
@@ -257,7 +257,7 @@ class LoopLeftInstruction(MichelsonInstruction, prim='LOOP_LEFT', args_len=1):
             var = or_.resolve()
             stack.push(var)
             stack_items_added += 1
-            stdout.append(format_stdout(cls.prim, [or_], [var]))  # type: ignore
+            trace_stdout(stdout, cls.prim, [or_], [var])  # type: ignore
             if or_.is_left():
                 item = cls.args[0].execute(stack, stdout, context=context)
                 items.append(item)
@@ -283,7 +283,7 @@ class MapInstruction(MichelsonInstruction, prim='MAP', args_len=1):
                 elt = PairType.from_comb(list(elt))  # type: ignore
             stack.push(elt)  # type: ignore
             stack_items_added += 1
-            stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
+            trace_stdout(stdout, cls.prim, popped, [elt])  # type: ignore
             execution = cls.args[0].execute(stack, stdout, context=context)
             executions.append(execution)
             new_elt = stack.pop1()
@@ -299,7 +299,7 @@ class MapInstruction(MichelsonInstruction, prim='MAP', args_len=1):
             res = src  # TODO: need to deduce argument types
         stack.push(res)
         stack_items_added += 1
-        stdout.append(format_stdout(cls.prim, popped, [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, popped, [res])  # type: ignore
         return cls(stack_items_added, executions)
 
 
@@ -319,7 +319,7 @@ class IterInstruction(MichelsonInstruction, prim='ITER', args_len=1):
                 elt = PairType.from_comb(list(elt))  # type: ignore
             stack_items_added += 1
             stack.push(elt)  # type: ignore
-            stdout.append(format_stdout(cls.prim, popped, [elt]))  # type: ignore
+            trace_stdout(stdout, cls.prim, popped, [elt])  # type: ignore
             execution = cls.args[0].execute(stack, stdout, context=context)
             executions.append(execution)
             popped = []
@@ -10,11 +10,11 @@ from py_ecc import optimized_bls12_381 as bls12_381
 from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
 
 from pymavryk.context.abstract import AbstractContext
-from pymavryk.crypto.keccak import Keccak256
+from pymavryk.crypto.keccak import keccak256
 from pymavryk.crypto.key import Key
 from pymavryk.crypto.key import blake2b_32
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import BLS12_381_G1Type
 from pymavryk.michelson.types import BLS12_381_G2Type
@@ -33,7 +33,7 @@ def execute_hash(prim: str, stack: MichelsonStack, stdout: List[str], hash_diges
     a.assert_type_equal(BytesType)
     res = BytesType.from_value(hash_digest(bytes(a)))
     stack.push(res)
-    stdout.append(format_stdout(prim, [a], [res]))
+    trace_stdout(stdout, prim, [a], [res])
 
 
 class Blake2bInstruction(MichelsonInstruction, prim='BLAKE2B'):
@@ -67,7 +67,7 @@ class Sha3Instruction(MichelsonInstruction, prim='SHA3'):
 class KeccakInstruction(MichelsonInstruction, prim='KECCAK'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
-        execute_hash(cls.prim, stack, stdout, lambda x: Keccak256(bytes(x)).digest())  # type: ignore
+        execute_hash(cls.prim, stack, stdout, lambda x: keccak256(bytes(x)))  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -87,7 +87,7 @@ class CheckSignatureInstruction(MichelsonInstruction, prim='CHECK_SIGNATURE'):
         else:
             res = BoolType(True)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [pk, sig, msg], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [pk, sig, msg], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -99,7 +99,7 @@ class HashKeyInstruction(MichelsonInstruction, prim='HASH_KEY'):
         key = Key.from_encoded_key(str(a))
         res = KeyHashType.from_value(key.public_key_hash())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -125,7 +125,7 @@ class PairingCheckInstruction(MichelsonInstruction, prim='PAIRING_CHECK'):
             prod = prod * bls12_381.pairing(g2.to_point(), g1.to_point())
         res = BoolType.from_value(FQ12.one() == prod)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [points], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [points], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -136,7 +136,7 @@ class SaplingEmptyStateInstruction(MichelsonInstruction, prim='SAPLING_EMPTY_STA
         res = SaplingStateType.empty(memo_size)
         res.attach_context(context)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res], memo_size))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res], memo_size)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -5,8 +5,9 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
+from pymavryk.michelson.instructions.base import TypeDispatchTable
 from pymavryk.michelson.instructions.base import dispatch_types
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import BytesType
 from pymavryk.michelson.types import ListType
@@ -18,6 +19,21 @@ from pymavryk.michelson.types import SetType
 from pymavryk.michelson.types import StringType
 from pymavryk.michelson.types import UnitType
 
+CONCAT_LIST_TYPES = TypeDispatchTable(
+    {
+        (StringType,): (StringType, str, ''),
+        (BytesType,): (BytesType, bytes, b''),
+    }
+)
+
+
+CONCAT_TYPES = TypeDispatchTable(
+    {
+        (StringType, StringType): (StringType, str),
+        (BytesType, BytesType): (BytesType, bytes),
+    }
+)
+
 
 class ConcatInstruction(MichelsonInstruction, prim='CONCAT'):
     @classmethod
@@ -28,25 +44,19 @@ class ConcatInstruction(MichelsonInstruction, prim='CONCAT'):
             a.assert_type_in(ListType)
             res_type, convert, delim = dispatch_types(
                 a.args[0],
-                mapping={
-                    (StringType,): (StringType, str, ''),
-                    (BytesType,): (BytesType, bytes, b''),
-                },
+                mapping=CONCAT_LIST_TYPES,
             )
             res = res_type.from_value(delim.join(map(convert, a)))
-            stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+            trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         else:
             b = cast(Union[StringType, BytesType], stack.pop1())
             res_type, convert = dispatch_types(
                 type(a),
                 type(b),
-                mapping={
-                    (StringType, StringType): (StringType, str),
-                    (BytesType, BytesType): (BytesType, bytes),
-                },
+                mapping=CONCAT_TYPES,
             )
             res = res_type.from_value(convert(a) + convert(b))
-            stdout.append(format_stdout(cls.prim, [a, b], [res]))  # type: ignore
+            trace_stdout(stdout, cls.prim, [a, b], [res])  # type: ignore
         stack.push(res)
         return cls(stack_items_added=1)
 
@@ -57,7 +67,7 @@ class PackInstruction(MichelsonInstruction, prim='PACK'):
         a = stack.pop1()
         res = BytesType.from_value(a.pack())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -73,7 +83,7 @@ class UnpackInstruction(MichelsonInstruction, prim='UNPACK', args_len=1):
             stdout.append(f'{cls.prim}: {e}')
             res = OptionType.none(cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [a], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -84,7 +94,7 @@ class SizeInstruction(MichelsonInstruction, prim='SIZE'):
         src.assert_type_in(StringType, BytesType, ListType, SetType, MapType)
         res = NatType.from_value(len(src))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [src], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [src], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -101,7 +111,7 @@ class SliceInstruction(MichelsonInstruction, prim='SLICE'):
         else:
             res = OptionType.none(type(s))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [offset, length, s], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [offset, length, s], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -110,7 +120,7 @@ class UnitInstruction(MichelsonInstruction, prim='UNIT'):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = UnitType()
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -119,5 +129,5 @@ class NeverInstruction(MichelsonInstruction, prim='NEVER'):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         never = cast(NeverType, stack.pop1())
         never.assert_type_equal(NeverType)
-        stdout.append(format_stdout(cls.prim, [never], []))  # type: ignore
+        trace_stdout(stdout, cls.prim, [never], [])  # type: ignore
         return cls()
@@ -10,7 +10,7 @@ import strict_rfc3339  # type: ignore
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.context.mixin import nodes
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.micheline import MichelineLiteral
 from pymavryk.michelson.micheline import MichelsonRuntimeError
 from pymavryk.michelson.sections import ParameterSection
@@ -22,7 +22,7 @@ from pymavryk.michelson.types import PairType
 from pymavryk.michelson.types.base import MichelsonType
 from pymavryk.michelson.types.core import FalseLiteral
 from pymavryk.michelson.types.core import TrueLiteral
-from pymavryk.rpc.node import RpcMultiNode
+from pymavryk.rpc.node import RpcBalancedNode
 from pymavryk.rpc.node import RpcNode
 from pymavryk.rpc.shell import ShellQuery
 
@@ -114,7 +114,7 @@ class BeginInstruction(MichelsonInstruction, prim='BEGIN', args_len=2):
         res = PairType.from_comb([parameter.item, storage.item])
         stack.items = []
         stack.push(res)
-        stdout.append(format_stdout(f'BEGIN %default', [], [res]))
+        trace_stdout(stdout, f'BEGIN %default', [], [res])
         return cls(stack_items_added=1)
 
 
@@ -144,7 +144,7 @@ class CommitInstruction(MichelsonInstruction, prim='COMMIT'):
         operations = ListType(items=list(res.items[0]))  # type: ignore
         lazy_diff = []  # type: ignore
         storage = res.items[1].aggregate_lazy_diff(lazy_diff)
-        stdout.append(format_stdout(f'END %default', [res], []))
+        trace_stdout(stdout, f'END %default', [res], [])
 
         result = PairType.from_comb([operations, storage])
         context.debug = debug  # type: ignore
@@ -255,7 +255,7 @@ class ResetValueInstruction(MichelsonInstruction, prim='RESET', args_len=1):
         if shell.endswith('.pool'):
             shell = shell.split('.')[0]
             assert shell in nodes, f'unknown network {shell}'
-            context.shell = ShellQuery(RpcMultiNode(nodes[shell]))  # type: ignore
+            context.shell = ShellQuery(RpcBalancedNode(nodes[shell]))  # type: ignore
         elif shell in nodes:
             context.shell = ShellQuery(RpcNode(nodes[shell][0]))  # type: ignore
         else:
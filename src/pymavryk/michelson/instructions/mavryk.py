@@ -7,7 +7,7 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.micheline import MichelineLiteral
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.micheline import MichelsonRuntimeError
@@ -35,7 +35,7 @@ class AmountInstruction(MichelsonInstruction, prim='AMOUNT'):
         amount = context.get_amount()
         res = MumavType.from_value(amount)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -45,7 +45,7 @@ class BalanceInstruction(MichelsonInstruction, prim='BALANCE'):
         balance = context.get_balance()
         res = MumavType.from_value(balance)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -55,7 +55,7 @@ class ChainIdInstruction(MichelsonInstruction, prim='CHAIN_ID'):
         chain_id = context.get_chain_id()
         res = ChainIdType.from_value(chain_id)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -79,7 +79,7 @@ class SelfInstruction(MichelsonInstruction, prim='SELF'):
         res_type = ContractType.create_type(args=[self_type])
         res = res_type.from_value(f'{self_address}%{entrypoint}')  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -88,7 +88,7 @@ class SelfAddressInstruction(MichelsonInstruction, prim='SELF_ADDRESS'):
     def execute(cls, stack: 'MichelsonStack', stdout: List[str], context: AbstractContext):
         res = AddressType.from_value(context.get_self_address())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -98,7 +98,7 @@ class SenderInstruction(MichelsonInstruction, prim='SENDER'):
         sender = context.get_sender()
         res = AddressType.from_value(sender)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -108,7 +108,7 @@ class SourceInstruction(MichelsonInstruction, prim='SOURCE'):
         source = context.get_source()
         res = AddressType.from_value(source)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -118,7 +118,7 @@ class NowInstruction(MichelsonInstruction, prim='NOW'):
         now = context.get_now()
         res = TimestampType.from_value(now)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -129,7 +129,7 @@ class AddressInstruction(MichelsonInstruction, prim='ADDRESS'):
         contract.assert_type_in(ContractType)
         res = AddressType.from_value(contract.get_address())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [contract], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [contract], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -150,7 +150,7 @@ class ContractInstruction(MichelsonInstruction, prim='CONTRACT', args_len=1):
         except AssertionError:
             res = OptionType.none(contract_type)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [address], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [address], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -161,7 +161,7 @@ class ImplicitAccountInstruction(MichelsonInstruction, prim='IMPLICIT_ACCOUNT'):
         key_hash.assert_type_equal(KeyHashType)
         res = ContractType.create_type(args=[UnitType]).from_value(str(key_hash))  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [key_hash], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [key_hash], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -190,7 +190,7 @@ class CreateContractInstruction(MichelsonInstruction, prim='CREATE_CONTRACT', ar
 
         stack.push(originated_address)
         stack.push(origination)
-        stdout.append(format_stdout(cls.prim, [delegate, amount, initial_storage], [origination, originated_address]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [delegate, amount, initial_storage], [origination, originated_address])  # type: ignore
         return cls(stack_items_added=2)
 
 
@@ -205,7 +205,7 @@ class SetDelegateInstruction(MichelsonInstruction, prim='SET_DELEGATE'):
             delegate=None if delegate.is_none() else str(delegate.get_some()),
         )
         stack.push(delegation)
-        stdout.append(format_stdout(cls.prim, [delegate], [delegation]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [delegate], [delegation])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -231,7 +231,7 @@ class TransferTokensInstruction(MichelsonInstruction, prim='TRANSFER_TOKENS'):
             param_type=param_type,
         )
         stack.push(transaction)
-        stdout.append(format_stdout(cls.prim, [parameter, amount, destination], [transaction]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [parameter, amount, destination], [transaction])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -242,7 +242,7 @@ class VotingPowerInstruction(MichelsonInstruction, prim='VOTING_POWER'):
         address.assert_type_equal(KeyHashType)
         res = NatType.from_value(context.get_voting_power(str(address)))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [address], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [address], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -251,7 +251,7 @@ class TotalVotingPowerInstruction(MichelsonInstruction, prim='TOTAL_VOTING_POWER
     def execute(cls, stack: 'MichelsonStack', stdout: List[str], context: AbstractContext):
         res = NatType.from_value(context.get_total_voting_power())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -260,7 +260,7 @@ class LevelInstruction(MichelsonInstruction, prim='LEVEL'):
     def execute(cls, stack: 'MichelsonStack', stdout: List[str], context: AbstractContext):
         res = NatType.from_value(context.get_level())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -309,7 +309,7 @@ class ViewInstruction(MichelsonInstruction, prim='VIEW', args_len=2):
                 res = OptionType.from_some(view_stack.pop1())
 
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [input_value, view_address], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [input_value, view_address], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -324,7 +324,7 @@ class MinBlockTimeInstruction(MichelsonInstruction, prim='MIN_BLOCK_TIME'):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = NatType.from_value(context.get_min_block_time())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -339,5 +339,5 @@ class EmitInstruction(MichelsonInstruction, prim='EMIT', args_len=1):
             source=context.get_self_address(), event_type=event_type, payload=payload.to_micheline_value(), tag=tag
         )
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [payload], [res], arg=f'%{tag}'))  # type: ignore
+        trace_stdout(stdout, cls.prim, [payload], [res], arg=f'%{tag}')  # type: ignore
         return cls(stack_items_added=0)
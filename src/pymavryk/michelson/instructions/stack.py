@@ -1,4 +1,6 @@
+from contextlib import suppress
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import cast
@@ -6,20 +8,35 @@ from typing import cast
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
 from pymavryk.michelson.instructions.base import Wildcard
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types.base import MichelsonType
 
 
 class PushInstruction(MichelsonInstruction, prim='PUSH', args_len=2):
+    value: Optional[MichelsonType] = None
+
     @classmethod
-    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+    def _compile(cls) -> None:
+        # NOTE: pushable values are immutable, so a single instance can be shared between executions;
+        # errors are left to be raised (with a proper trace) at runtime
+        with suppress(Exception):
+            cls.value = cls.make_value()
+
+    @classmethod
+    def make_value(cls) -> MichelsonType:
         res_type, literal = cast(Tuple[Type[MichelsonType], Type[Micheline]], cls.args)
         assert res_type.is_pushable(), f'{res_type.prim} contains non-pushable arguments'
-        res = res_type.from_literal(literal)
+        return res_type.from_literal(literal)
+
+    @classmethod
+    def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
+        res = cls.value
+        if res is None:
+            res = cls.make_value()
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -28,7 +45,7 @@ class DropnInstruction(MichelsonInstruction, prim='DROP', args_len=1):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         count = cls.args[0].get_int()  # type: ignore
         dropped = stack.pop(count=count)
-        stdout.append(format_stdout(cls.prim, dropped, [], count))  # type: ignore
+        trace_stdout(stdout, cls.prim, dropped, [], count)  # type: ignore
         return cls()
 
 
@@ -36,7 +53,7 @@ class DropInstruction(MichelsonInstruction, prim='DROP'):
     @classmethod
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         dropped = stack.pop1()
-        stdout.append(format_stdout(cls.prim, [dropped], []))  # type: ignore
+        trace_stdout(stdout, cls.prim, [dropped], [])  # type: ignore
         return cls()
 
 
@@ -48,7 +65,7 @@ class DupnInstruction(MichelsonInstruction, prim='DUP', args_len=1):
         res = stack.peek().duplicate()
         stack.restore(count=depth)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [*Wildcard.n(depth), res], [res, *Wildcard.n(depth), res], depth))  # type: ignore
+        trace_stdout(stdout, cls.prim, [*Wildcard.n(depth), res], [res, *Wildcard.n(depth), res], depth)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -57,7 +74,7 @@ class DupInstruction(MichelsonInstruction, prim='DUP'):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = stack.peek().duplicate()
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [res], [res, res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [res], [res, res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -67,7 +84,7 @@ class SwapInstruction(MichelsonInstruction, prim='SWAP'):
         a, b = stack.pop2()
         stack.push(a)
         stack.push(b)
-        stdout.append(format_stdout(cls.prim, [a, b], [b, a]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [a, b], [b, a])  # type: ignore
         return cls(stack_items_added=2)
 
 
@@ -79,7 +96,7 @@ class DigInstruction(MichelsonInstruction, prim='DIG', args_len=1):
         res = stack.pop1()
         stack.restore(count=depth)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [*Wildcard.n(depth), res], [res, *Wildcard.n(depth)], depth))  # type: ignore
+        trace_stdout(stdout, cls.prim, [*Wildcard.n(depth), res], [res, *Wildcard.n(depth)], depth)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -91,7 +108,7 @@ class DugInstruction(MichelsonInstruction, prim='DUG', args_len=1):
         stack.protect(count=depth)
         stack.push(res)
         stack.restore(count=depth)
-        stdout.append(format_stdout(cls.prim, [res, *Wildcard.n(depth)], [*Wildcard.n(depth), res], depth))  # type: ignore
+        trace_stdout(stdout, cls.prim, [res, *Wildcard.n(depth)], [*Wildcard.n(depth), res], depth)  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -103,7 +120,7 @@ class CastIntruction(MichelsonInstruction, prim='CAST', args_len=1):
         # cast_type = cast(Type[MichelsonType], cls.args[0])
         # res = cast_type.from_micheline_value(top.to_micheline_value())
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [res], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [res], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -5,7 +5,7 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import BigMapType
 from pymavryk.michelson.types import BoolType
@@ -23,7 +23,7 @@ class ConsInstruction(MichelsonInstruction, prim='CONS'):
         lst.assert_type_in(ListType)
         res = lst.prepend(elt)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [elt, lst], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [elt, lst], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -32,7 +32,7 @@ class NilInstruction(MichelsonInstruction, prim='NIL', args_len=1):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = ListType.empty(cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -42,7 +42,7 @@ class EmptyBigMapInstruction(MichelsonInstruction, prim='EMPTY_BIG_MAP', args_le
         res = BigMapType.empty(key_type=cls.args[0], val_type=cls.args[1])  # type: ignore
         res.attach_context(context)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -51,7 +51,7 @@ class EmptyMapInstruction(MichelsonInstruction, prim='EMPTY_MAP', args_len=2):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = MapType.empty(key_type=cls.args[0], val_type=cls.args[1])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -60,7 +60,7 @@ class EmptySetInstruction(MichelsonInstruction, prim='EMPTY_SET', args_len=1):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = SetType.empty(item_type=cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -75,7 +75,7 @@ class GetInstruction(MichelsonInstruction, prim='GET'):
         else:
             res = OptionType.from_some(val)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [key, src], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [key, src], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -88,7 +88,7 @@ class GetAndUpdateInstruction(MichelsonInstruction, prim='GET_AND_UPDATE'):
         res = OptionType.none(src.args[1]) if prev_val is None else OptionType.from_some(prev_val)
         stack.push(dst)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [key, val, src], [res, dst]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [key, val, src], [res, dst])  # type: ignore
         return cls(stack_items_added=2)
 
 
@@ -111,7 +111,7 @@ class UpdateInstruction(MichelsonInstruction, prim='UPDATE'):
             src.assert_type_in(MapType, BigMapType)
             _, dst = src.update(key, None if val.is_none() else val.get_some())  # type: ignore
         stack.push(dst)
-        stdout.append(format_stdout(cls.prim, [key, val, src], [dst]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [key, val, src], [dst])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -122,7 +122,7 @@ class MemInstruction(MichelsonInstruction, prim='MEM'):
         src.assert_type_in(MapType, BigMapType, SetType)
         res = BoolType.from_value(src.contains(key))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [key, src], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [key, src], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -131,7 +131,7 @@ class NoneInstruction(MichelsonInstruction, prim='NONE', args_len=1):
     def execute(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
         res = OptionType.none(cls.args[0])  # type: ignore
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -141,5 +141,5 @@ class SomeInstruction(MichelsonInstruction, prim='SOME'):
         some = stack.pop1()
         res = OptionType.from_some(some)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [some], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [some], [res])  # type: ignore
         return cls(stack_items_added=1)
@@ -4,7 +4,7 @@ from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.stack import MichelsonStack
 from pymavryk.michelson.types import MichelsonType
 from pymavryk.michelson.types import NatType
@@ -27,7 +27,7 @@ class JoinTicketsInstruction(MichelsonInstruction, prim='JOIN_TICKETS'):
         else:
             res = OptionType.from_some(res)  # type: ignore
         stack.push(res)  # type: ignore
-        stdout.append(format_stdout(cls.prim, [pair], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [pair], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -39,7 +39,7 @@ class ReadTicketInstruction(MichelsonInstruction, prim='READ_TICKET'):
         res = ticket.to_comb()
         stack.push(ticket)
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [ticket], [res, ticket]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [ticket], [res, ticket])  # type: ignore
         return cls(stack_items_added=2)
 
 
@@ -58,7 +58,7 @@ class SplitTicketInstruction(MichelsonInstruction, prim='SPLIT_TICKET'):
         else:
             res = OptionType.from_some(PairType.from_comb(list(res)))  # type: ignore
         stack.push(res)  # type: ignore
-        stdout.append(format_stdout(cls.prim, [ticket, amounts], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [ticket, amounts], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -70,7 +70,7 @@ class TicketDeprecatedInstruction(MichelsonInstruction, prim='TICKET_DEPRECATED'
         address = context.get_self_address()
         res = TicketType.create(address, item, int(amount))
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [item, amount], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [item, amount], [res])  # type: ignore
         return cls(stack_items_added=1)
 
 
@@ -89,5 +89,5 @@ class TicketInstruction(MichelsonInstruction, prim='TICKET'):
             res = OptionType.none(ticket_ty)
 
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [item, amount], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [item, amount], [res])  # type: ignore
         return cls(stack_items_added=1)
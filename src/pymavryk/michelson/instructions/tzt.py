@@ -5,7 +5,7 @@ from typing import cast
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.logging import logger
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.micheline import MichelineLiteral
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.stack import MichelsonStack
@@ -35,7 +35,7 @@ class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
             raise Exception(f'`{res_type.prim}` is neither pushable nor big_map')
 
         stack.push(res)
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
 
     @classmethod
     def pull(cls, stack: MichelsonStack, stdout: List[str], context: AbstractContext):
@@ -60,7 +60,7 @@ class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
             logger.debug('actual: %s(%s)', res.__class__.__name__, res.__dict__)
             raise Exception('Stack content is not equal to expected')
 
-        stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [res])  # type: ignore
 
 
 class BigMapInstruction(MichelsonInstruction, prim='Big_map', args_len=4):
@@ -86,4 +86,4 @@ class BigMapInstruction(MichelsonInstruction, prim='Big_map', args_len=4):
             )
         context.tzt_big_maps[big_map.ptr] = big_map  # type: ignore
 
-        stdout.append(format_stdout(cls.prim, [], [literal]))  # type: ignore
+        trace_stdout(stdout, cls.prim, [], [literal])  # type: ignore
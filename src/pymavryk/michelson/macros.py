@@ -1,6 +1,12 @@
 import functools
 import re
 from collections import namedtuple
+from typing import Any
+from typing import Callable
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Set
 from typing import Tuple
 
 from pymavryk.michelson.tags import prim_tags
@@ -17,11 +23,23 @@ CDR__ = {'prim': 'CDR', 'annots': ['@%%']}
 DROP = {'prim': 'DROP'}
 FAIL = [[UNIT, FAILWITH]]
 
+MACRO_CACHE_SIZE = 4096
+
 macros = []
 
 PxrNode = namedtuple('PxrNode', ['depth', 'annots', 'args', 'is_root'])
 
 
+class MacroArg:
+    """Placeholder for a macro argument in a cached expansion"""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f'<MacroArg {self.index}>'
+
+
 def macro(regexp):
     def register_macro(func):
         macros.append((re.compile(regexp), func))
@@ -58,14 +76,82 @@ def expand_macro(prim, annots, args, internal=False):
     if prim in prim_tags:
         return expr(prim=prim, annots=annots, args=args)
 
-    for regexp, handler in macros:
-        groups = regexp.findall(prim)
-        if groups:
-            assert len(groups) == 1
-            res = handler(groups[0], annots, args)
-            return res if internal else seq(res)
+    template, containers = expand_template(prim, tuple(annots), len(args))
+    res = instantiate(template, args, containers)
+    # NOTE: top level is always a fresh object, nested parts without arguments are shared between expansions
+    if res is template:
+        res = template.copy()
+    return res if internal else seq(res)
+
 
-    raise AssertionError(f'unknown primitive `{prim}`')
+@functools.lru_cache(maxsize=1)
+def compile_macros(count: int) -> 're.Pattern[str]':
+    """Combine patterns of the first `count` registered macros into a single one (first match wins)"""
+    return re.compile('|'.join(f'(?P<m{i}>{regexp.pattern})' for i, (regexp, _) in enumerate(macros[:count])))
+
+
+def match_macro(prim: str) -> Optional[Tuple[Callable, str]]:
+    """Find macro handler and the part of the name it takes (captured group).
+
+    :returns: tuple (handler, captured group) or None if there's no such macro
+    """
+    combined = compile_macros(len(macros))
+    match = combined.match(prim)
+    if match is None or match.lastgroup is None:
+        return None
+    regexp, handler = macros[int(match.lastgroup[1:])]
+    group = combined.groupindex[match.lastgroup]
+    return handler, match.group(group + 1) if regexp.groups else match.group(group)
+
+
+def find_args(template: Any, containers: Set[int]) -> bool:
+    """Collect ids of placeholders and of lists and dicts having them inside"""
+    if isinstance(template, MacroArg):
+        containers.add(id(template))
+        return True
+    if isinstance(template, (list, dict)):
+        items = template if isinstance(template, list) else template.values()
+        # NOTE: no short circuit, all placeholders have to be found
+        found = [find_args(item, containers) for item in items]
+        if any(found):
+            containers.add(id(template))
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=MACRO_CACHE_SIZE)
+def expand_template(prim: str, annots: Tuple[str, ...], args_len: int) -> Tuple[Any, FrozenSet[int]]:
+    """Expand macro with placeholders instead of the arguments, results are cached (see `macro_cache_info`).
+
+    :returns: tuple (expansion, ids of containers to be copied when putting arguments in place)
+    """
+    res = match_macro(prim)
+    if res is None:
+        raise AssertionError(f'unknown primitive `{prim}`')
+    handler, group = res
+    template = handler(group, list(annots), [MacroArg(i) for i in range(args_len)])
+    containers: Set[int] = set()
+    find_args(template, containers)
+    return template, frozenset(containers)
+
+
+def instantiate(template: Any, args: List[Any], containers: FrozenSet[int]) -> Any:
+    """Put actual arguments in place of placeholders, copying only the containers having them"""
+    if id(template) not in containers:
+        return template
+    if isinstance(template, MacroArg):
+        return args[template.index]
+    if isinstance(template, list):
+        return [instantiate(item, args, containers) if id(item) in containers else item for item in template]
+    return {
+        key: instantiate(value, args, containers) if id(value) in containers else value
+        for key, value in template.items()
+    }
+
+
+def macro_cache_info():
+    """Macro expansion cache statistics (hits, misses, maxsize, currsize)"""
+    return expand_template.cache_info()
 
 
 def get_field_annots(annots):
@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from contextlib import suppress
 from functools import wraps
 from pprint import pformat
+from threading import Lock
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -20,6 +23,9 @@ from pymavryk.michelson.forge import unforge_micheline
 from pymavryk.michelson.forge import unforge_public_key
 from pymavryk.michelson.forge import unforge_signature
 from pymavryk.michelson.format import micheline_to_michelson
+from pymavryk.michelson.trace import TraceSink
+
+DEFAULT_TYPE_CACHE_SIZE = 16384
 
 
 class MichelsonRuntimeError(Exception):
@@ -137,7 +143,7 @@ def blind_unpack(data: bytes):
 
     if len(data) > 0 and data.startswith(b'\x05'):
         with suppress(ValueError, AssertionError):
-            res = unforge_micheline(data[1:])
+            res = unforge_micheline(memoryview(data)[1:])
             return micheline_value_to_python_object(res)
 
     with suppress(ValueError):
@@ -146,6 +152,76 @@ def blind_unpack(data: bytes):
     return data
 
 
+class TypeCache:
+    """Bounded LRU cache of classes built by `Micheline.match`.
+
+    Keys are structural: primitive class, annotations and (already cached) argument classes,
+    so that identical type/code subtrees resolve to the same class.
+    Matched classes are treated as immutable, do not set attributes on them.
+
+    :param max_size: max number of cached classes, 0 to disable caching
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TYPE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Any, Type[Micheline]]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def get(self, key) -> Optional[Type['Micheline']]:
+        with self._lock:
+            res = self._entries.get(key)
+            if res is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return res
+
+    def put(self, key, value: Type['Micheline']) -> Type['Micheline']:
+        """Store class unless there's one already (built concurrently), return the cached one."""
+        if self.max_size <= 0:
+            return value
+        with self._lock:
+            res = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return res
+
+    def resize(self, max_size: int) -> None:
+        """Change max number of cached classes, evicting the least recently used ones."""
+        with self._lock:
+            self.max_size = max_size
+            while len(self._entries) > max(max_size, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached classes and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+type_cache = TypeCache()
+
+
+def create_cached_type(key, factory: Callable[[], Type['Micheline']]) -> Type['Micheline']:
+    res = type_cache.get(key)
+    if res is None:
+        res = type_cache.put(key, factory())
+    return res
+
+
 class Micheline(metaclass=ErrorTrace):
     prim: Optional[str] = None
     args: List[Type['Micheline']] = []
@@ -159,6 +235,8 @@ class Micheline(metaclass=ErrorTrace):
             assert (prim, args_len) not in cls.classes, f'duplicate key {prim} ({args_len} args)'
             cls.classes[(prim, args_len)] = cls
             cls.prim = prim
+            # NOTE: cached classes might be built from the overridden primitive
+            type_cache.clear()
 
     def __str__(self):
         raise AssertionError('__str__ has to be explicitly defined')
@@ -170,7 +248,10 @@ class Micheline(metaclass=ErrorTrace):
     def match(expr) -> Type['Micheline']:
         if isinstance(expr, list):
             args = [Micheline.match(arg) for arg in expr]
-            return MichelineSequence.create_type(args=args)
+            return create_cached_type(
+                (MichelineSequence, tuple(args)),
+                lambda: MichelineSequence.create_type(args=args),
+            )
         elif isinstance(expr, dict):
             if expr.get('prim'):
                 prim, args, annots = parse_micheline_prim(expr)
@@ -189,7 +270,11 @@ class Micheline(metaclass=ErrorTrace):
                 assert (prim, args_len) in Micheline.classes, f'unregistered primitive {prim} ({args_len} args)'
                 cls = Micheline.classes[prim, args_len]
                 try:
-                    return cls.create_type(args=list(map(Micheline.match, args)), annots=annots)
+                    arg_types = list(map(Micheline.match, args))
+                    return create_cached_type(
+                        (cls, tuple(annots), tuple(arg_types)),
+                        lambda: cls.create_type(args=arg_types, annots=annots),
+                    )
                 except Exception as e:
                     raise MichelsonRuntimeError(cls.prim, *e.args) from e
             else:
@@ -201,7 +286,10 @@ class Micheline(metaclass=ErrorTrace):
                         'bytes': bytes.fromhex,
                     },
                 )
-                return MichelineLiteral.create(literal=literal)
+                return create_cached_type(
+                    (MichelineLiteral, type(literal), literal),
+                    lambda: MichelineLiteral.create(literal=literal),
+                )
         else:
             raise MichelsonRuntimeError(f'malformed expression `{expr}`')
 
@@ -244,6 +332,24 @@ class Micheline(metaclass=ErrorTrace):
     def execute(cls, stack, stdout, context) -> 'Micheline':
         raise AssertionError(f'`execute` has to be explicitly defined ({cls.prim})')
 
+    @classmethod
+    def compile(cls) -> None:
+        """Pre-resolve constant operands of this node and all the nested ones, so that they are not re-derived
+        on every execution. Done once per class (classes are shared via type cache), compiled and non-compiled
+        nodes behave the same.
+        """
+        if cls.__dict__.get('_compiled'):
+            return
+        for arg in cls.args:
+            if isinstance(arg, type) and issubclass(arg, Micheline):
+                arg.compile()
+        cls._compile()
+        cls._compiled = True
+
+    @classmethod
+    def _compile(cls) -> None:
+        pass
+
 
 MichelineT = TypeVar('MichelineT', bound=Micheline)
 
@@ -259,7 +365,24 @@ class MichelineSequence(Micheline):
 
     @classmethod
     def execute(cls, stack, stdout, context) -> Micheline:
-        return cls([arg.execute(stack, stdout, context) for arg in cls.args])
+        if isinstance(stdout, TraceSink):
+            stdout.enter()
+            try:
+                return cls._execute(stack, stdout, context)
+            finally:
+                stdout.exit()
+        return cls._execute(stack, stdout, context)
+
+    @classmethod
+    def _execute(cls, stack, stdout, context) -> Micheline:
+        gas_meter = getattr(context, 'gas_meter', None)
+        if gas_meter is None:
+            return cls([arg.execute(stack, stdout, context) for arg in cls.args])
+        items = []
+        for arg in cls.args:
+            gas_meter.consume_instruction(arg, stack)
+            items.append(arg.execute(stack, stdout, context))
+        return cls(items)
 
 
 class GlobalConstant(Micheline, prim='constant', args_len=1):
@@ -1,12 +1,19 @@
 # Inspired by https://github.com/jansorg/tezos-intellij/blob/master/grammar/michelson.bnf
 import json
 import re
+import types
+from contextlib import suppress
+from threading import Lock
+from threading import local
+from typing import Any
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from ply.lex import Lexer  # type: ignore
 from ply.lex import LexToken
 from ply.lex import lex
+from ply.yacc import __tabversion__ as ply_tabversion  # type: ignore
 from ply.yacc import yacc  # type: ignore
 
 from pymavryk.michelson.macros import expand_macro
@@ -38,6 +45,9 @@ class Sequence(list):
     pass
 
 
+build_lock = Lock()
+
+
 class SimpleMichelsonLexer(Lexer):
     tokens = ('INT', 'BYTE', 'STR', 'ANNOT', 'PRIM', 'LEFT_CURLY', 'RIGHT_CURLY', 'LEFT_PAREN', 'RIGHT_PAREN', 'SEMI')
 
@@ -56,9 +66,15 @@ class SimpleMichelsonLexer(Lexer):
     t_ignore_COMMENT = r'#[^\n]*'
     t_ignore = ' \t\r\n\f'
 
+    _master: Optional[Lexer] = None
+
     def __init__(self):
         super(SimpleMichelsonLexer, self).__init__()
-        self.lexer = lex(module=self, reflags=re.MULTILINE)
+        # NOTE: regular expressions are compiled once, every instance gets its own copy of the lexer state
+        with build_lock:
+            if type(self).__dict__.get('_master') is None:
+                type(self)._master = lex(module=self, reflags=re.MULTILINE)
+        self.lexer = type(self)._master.clone()  # type: ignore
 
     def t_error(self, t):
         t.type = t.value[0]
@@ -201,20 +217,43 @@ class MichelsonParser:
     def p_error(self, p):
         raise MichelsonParserError(p)
 
-    def __init__(self, debug=False, write_tables=False, extra_primitives: Optional[List[str]] = None):
+    def __init__(
+        self,
+        debug=False,
+        write_tables=False,
+        extra_primitives: Optional[List[str]] = None,
+        fast=True,
+    ):
         """Initialize Michelson parser
 
         :param debug: Verbose output
         :param write_tables: Store PLY output
         :param extra_primitives: List of words to be ignored
+        :param fast: Use hand-written parser for valid input, PLY is still used for error reporting \
+            (ignored if grammar rules are overridden)
         """
         self.lexer = SimpleMichelsonLexer()
-        self.parser = yacc(
-            module=self,
-            debug=debug,
-            write_tables=write_tables,
-        )
+        cls = type(self)
+        # NOTE: LALR tables depend on the grammar (i.e. class) only, they are generated once per process
+        # (unless debug output is requested)
+        with build_lock:
+            tables = None if debug else cls.__dict__.get('_tables')
+            self.parser = yacc(
+                module=self,
+                debug=debug,
+                write_tables=write_tables and tables is None,
+                tabmodule=tables,
+                optimize=tables is not None,
+            )
+            if tables is None:
+                cls._tables = export_tables(self.parser)
         self.extra_primitives = extra_primitives or []
+        self.fast = fast and cls.has_default_grammar()
+
+    @classmethod
+    def has_default_grammar(cls) -> bool:
+        rules = [name for name in dir(cls) if name.startswith('p_')]
+        return all(getattr(cls, name) is getattr(MichelsonParser, name, None) for name in rules)
 
     def parse(self, code):
         """Parse Michelson source.
@@ -224,7 +263,174 @@ class MichelsonParser:
         """
         if len(code) > 0 and code[0] == '(' and code[-1] == ')':
             code = code[1:-1]
-        return self.parser.parse(code)
+        if self.fast:
+            # NOTE: on failure PLY parser is used to report errors the usual way
+            with suppress(Exception):
+                return FastMichelsonParser(code, self.extra_primitives).parse()
+        return self.parser.parse(code, lexer=self.lexer.lexer)
+
+
+def export_tables(parser) -> types.ModuleType:
+    """Wrap generated LALR tables into a module object PLY can load them from"""
+    tables = types.ModuleType('parsetab')
+    tables.__file__ = __file__
+    tables._tabversion = ply_tabversion  # type: ignore
+    tables._lr_method = 'LALR'  # type: ignore
+    tables._lr_signature = None  # type: ignore
+    tables._lr_action = parser.action  # type: ignore
+    tables._lr_goto = parser.goto  # type: ignore
+    tables._lr_productions = [(str(p), p.name, p.len, p.func, p.file, p.line) for p in parser.productions]  # type: ignore
+    return tables
+
+
+token_re = re.compile(
+    '|'.join(
+        [
+            r'(?P<SKIP>[ \t\r\n\f]+|/\*[^*]*\*/|#[^\n]*)',
+            r'(?P<ANNOT>[:@%]+(?:[_0-9a-zA-Z\.]*)?)',
+            r'(?P<PRIM>[A-Za-z][A-Za-z0-9_]+)',
+            r'(?P<STR>\"(?:\\.|[^\"])*\")',
+            r'(?P<BYTE>0x[A-Fa-f0-9]*)',
+            r'(?P<INT>-?[0-9]+)',
+            r'(?P<PUNCT>[{}();])',
+        ]
+    )
+)
+arg_tokens = {'PRIM', 'INT', 'BYTE', 'STR', '{', '('}
+
+
+def tokenize(code: str) -> List[Tuple[str, str, int]]:
+    """Split Michelson source into tokens (same as `SimpleMichelsonLexer`).
+
+    :returns: list of (token type, value, position), punctuation tokens have the same type and value
+    """
+    tokens = []
+    pos, end = 0, len(code)
+    while pos < end:
+        match = token_re.match(code, pos)
+        if match is None:
+            raise ValueError(f'unexpected character at {pos}: {code[pos]}')
+        kind, value = match.lastgroup, match.group()
+        if kind == 'PUNCT':
+            tokens.append((value, value, pos))
+        elif kind != 'SKIP':
+            tokens.append((kind, value, pos))  # type: ignore
+        pos = match.end()
+    tokens.append(('$end', '', end))
+    return tokens
+
+
+class FastMichelsonParser:
+    """Recursive descent parser producing the same output as `MichelsonParser` for valid input,
+    raises on the first unexpected token without reporting details.
+
+    :param code: Michelson source
+    :param extra_primitives: List of words to be ignored
+    """
+
+    def __init__(self, code: str, extra_primitives: Optional[List[str]] = None) -> None:
+        self.tokens = tokenize(code)
+        self.extra_primitives = extra_primitives or []
+        self.pos = 0
+
+    def parse(self) -> Any:
+        return self.parse_instr('$end')
+
+    def expect(self, kind: str) -> str:
+        token_kind, value, _ = self.tokens[self.pos]
+        if token_kind != kind:
+            raise ValueError(f'expected {kind}, got {token_kind}')
+        self.pos += 1
+        return value
+
+    def parse_instr(self, stop: str) -> Any:
+        """instr [; instr]* until the stop token (not consumed)"""
+        items: List[Any] = []
+        semi = False
+        while True:
+            kind, value, _ = self.tokens[self.pos]
+            if kind == 'PRIM':
+                items.append(self.parse_expr())
+            elif kind == 'INT':
+                self.pos += 1
+                items.append({'int': value})
+            elif kind == 'BYTE':
+                self.pos += 1
+                items.append({'bytes': value[2:]})
+            elif kind == 'STR':
+                self.pos += 1
+                items.append({'string': json.loads(value)})
+            elif kind == '{':
+                self.pos += 1
+                items.append(Sequence(self.parse_block()))
+            elif kind in (';', stop):
+                items.append(None)
+            else:
+                raise ValueError(f'unexpected token {kind}')
+
+            kind = self.tokens[self.pos][0]
+            if kind == ';':
+                self.pos += 1
+                semi = True
+            elif kind == stop:
+                break
+            else:
+                raise ValueError(f'unexpected token {kind}')
+
+        if not semi:
+            return items[0]
+        return [item for item in items if item is not None]
+
+    def parse_block(self) -> List[Any]:
+        """Inner part of { instr }, closing curly brace is consumed"""
+        res = self.parse_instr('}')
+        self.expect('}')
+        if type(res) is list:
+            return res
+        return [] if res is None else [res]
+
+    def parse_expr(self) -> Any:
+        prim = self.expect('PRIM')
+        annots, args = [], []
+        while self.tokens[self.pos][0] == 'ANNOT':
+            annots.append(self.tokens[self.pos][1])
+            self.pos += 1
+        while self.tokens[self.pos][0] in arg_tokens:
+            args.append(self.parse_arg())
+
+        if prim in prim_tags or prim in self.extra_primitives:
+            expr = make_expr(prim=prim, annots=annots, args=args)
+        else:
+            expr = expand_macro(prim=prim, annots=annots, args=args)
+        return Sequence(expr) if isinstance(expr, list) else expr
+
+    def parse_arg(self) -> Any:
+        kind, value, _ = self.tokens[self.pos]
+        self.pos += 1
+        if kind == 'PRIM':
+            return {'prim': value}
+        if kind == 'INT':
+            return {'int': value}
+        if kind == 'BYTE':
+            return {'bytes': value[2:]}
+        if kind == 'STR':
+            return {'string': json.loads(value)}
+        if kind == '{':
+            return self.parse_block()
+        expr = self.parse_expr()
+        self.expect(')')
+        return expr
+
+
+parsers = local()
+
+
+def get_default_parser() -> MichelsonParser:
+    """Default parser instance (one per thread)"""
+    parser = getattr(parsers, 'default', None)
+    if parser is None:
+        parser = parsers.default = MichelsonParser()
+    return parser
 
 
 def michelson_to_micheline(data, parser=None):
@@ -235,5 +441,5 @@ def michelson_to_micheline(data, parser=None):
     :returns: Micheline expression
     """
     if parser is None:
-        parser = MichelsonParser()
+        parser = get_default_parser()
     return parser.parse(data)
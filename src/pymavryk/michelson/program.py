@@ -9,7 +9,7 @@ from typing import cast
 from pymavryk.context.impl import ExecutionContext
 from pymavryk.crypto.encoding import base58_encode
 from pymavryk.michelson.instructions.base import MichelsonInstruction
-from pymavryk.michelson.instructions.base import format_stdout
+from pymavryk.michelson.instructions.base import trace_stdout
 from pymavryk.michelson.instructions.tzt import BigMapInstruction
 from pymavryk.michelson.instructions.tzt import StackEltInstruction
 from pymavryk.michelson.micheline import MichelineSequence
@@ -64,6 +64,7 @@ class MichelsonProgram:
                 'views': [ViewSection.match(expr) for expr in context.get_views_expr()] if with_code else [],
             },
         )
+        cls.compile()
         return cast(Type['MichelsonProgram'], cls)
 
     @staticmethod
@@ -87,6 +88,7 @@ class MichelsonProgram:
                 'views': get_script_sections(sequence, cls=ViewSection),  # type: ignore
             },
         )
+        cls.compile()
         return cast(Type['MichelsonProgram'], cls)
 
     @staticmethod
@@ -105,6 +107,13 @@ class MichelsonProgram:
             *[view.as_micheline_expr() for view in cls.views],
         ]
 
+    @classmethod
+    def compile(cls) -> None:
+        """Pre-resolve constant operands of the contract code and views (see `Micheline.compile`)"""
+        cls.code.compile()
+        for view in cls.views:
+            view.compile()
+
     @classmethod
     def get_view(cls, name: str) -> Type[ViewSection]:
         return next(view for view in cls.views if view.name == name)
@@ -130,7 +139,7 @@ class MichelsonProgram:
         self.storage_value.attach_context(context)
         res = PairType.from_comb([self.parameter_value.item, self.storage_value.item])
         stack.push(res)
-        stdout.append(format_stdout(f'BEGIN %{self.name}', [], [res]))
+        trace_stdout(stdout, f'BEGIN %{self.name}', [], [res])
 
     def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> MichelsonInstruction:
         """Execute contract in interpreter"""
@@ -161,7 +170,7 @@ class MichelsonProgram:
         operations = [op.content for op in res.items[0]]  # type: ignore
         lazy_diff = []  # type: ignore
         storage = res.items[1].aggregate_lazy_diff(lazy_diff).to_micheline_value(mode=output_mode)
-        stdout.append(format_stdout(f'END %{self.name}', [res], []))
+        trace_stdout(stdout, f'END %{self.name}', [res], [])
         return operations, storage, lazy_diff, res
 
     @try_catch('RET')
@@ -176,7 +185,7 @@ class MichelsonProgram:
         if len(stack):
             raise Exception(f'Stack is not empty: {repr(stack)}')
         res.assert_type_equal(view.args[2], message='view return type')
-        stdout.append(format_stdout(f'RET %{self.name}', [res], []))
+        trace_stdout(stdout, f'RET %{self.name}', [res], [])
         return view.args[2].from_micheline_value(res.to_micheline_value(mode=output_mode))
 
 
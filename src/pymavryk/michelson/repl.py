@@ -1,13 +1,19 @@
-from copy import deepcopy
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
+from typing import Union
 from typing import cast
 
 from attr import dataclass
 
 from pymavryk.context.impl import ExecutionContext
+from pymavryk.michelson.gas import TRANSACTION_BASE_COST
+from pymavryk.michelson.gas import GasMeter
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.micheline import MichelsonRuntimeError
 from pymavryk.michelson.parse import MichelsonParser
@@ -17,6 +23,8 @@ from pymavryk.michelson.program import MichelsonProgram
 from pymavryk.michelson.program import TztMichelsonProgram
 from pymavryk.michelson.sections import CodeSection
 from pymavryk.michelson.stack import MichelsonStack
+from pymavryk.michelson.trace import TraceSink
+from pymavryk.michelson.trace import make_stdout
 from pymavryk.michelson.types import OperationType
 
 
@@ -33,6 +41,45 @@ class InterpreterResult:
     stack: Optional[MichelsonStack] = None
 
 
+BatchCall = Tuple[Any, ...]
+BatchResult = Tuple[List[dict], Any, List[dict], Optional[Exception]]
+
+_batch_script: Any = None
+_batch_options: Dict[str, Any] = {}
+
+
+def _init_batch_worker(script, options: Dict[str, Any]) -> None:
+    global _batch_script, _batch_options
+    _batch_script, _batch_options = script, options
+
+
+def _portable_error(error: Exception) -> MichelsonRuntimeError:
+    """Copy of the error that can be sent back from a worker process (arguments converted to strings)"""
+    args = [arg if isinstance(arg, str) else str(arg) for arg in error.args]
+    if not isinstance(error, MichelsonRuntimeError):
+        args = [type(error).__name__, *args]
+    return MichelsonRuntimeError(*args)
+
+
+def _run_batch_call(call: BatchCall) -> BatchResult:
+    entrypoint, parameter, storage, *rest = call
+    options = {**_batch_options, **(rest[0] if rest else {})}
+    # NOTE: stdout is not sent back, so there's no point in collecting trace unless a custom sink is passed
+    options.setdefault('trace', False)
+    try:
+        operations, storage, lazy_diff, _, error = Interpreter.run_code(
+            parameter=parameter,
+            storage=storage,
+            script=_batch_script,
+            entrypoint=entrypoint,
+            **options,
+        )
+    except Exception as e:
+        # NOTE: one broken call must not fail the whole batch
+        return [], None, [], _portable_error(e)
+    return operations, storage, lazy_diff, None if error is None else _portable_error(error)
+
+
 class Interpreter:
     """Michelson interpreter reimplemented in Python.
     Based on the following reference: https://tezos.gitlab.io/michelson-reference/
@@ -54,8 +101,8 @@ class Interpreter:
         :param code: Michelson code
         """
         result = InterpreterResult(stdout=[])
-        stack_backup = deepcopy(self.stack)
-        context_backup = deepcopy(self.context)
+        stack_snapshot = self.stack.snapshot()
+        context_snapshot = self.context.snapshot()
 
         try:
             code_section = CodeSection.match(michelson_to_micheline(code))
@@ -66,8 +113,8 @@ class Interpreter:
             if self.context.debug:
                 raise
 
-            self.stack = stack_backup
-            self.context = context_backup
+            self.stack.rollback(stack_snapshot)
+            self.context.rollback(context_snapshot)
             result.stdout.append(e.format_stdout())
             result.error = e
 
@@ -91,6 +138,8 @@ class Interpreter:
         sender=None,
         balance=None,
         block_id=None,
+        trace: Union[bool, TraceSink] = True,
+        gas_meter: Optional[GasMeter] = None,
         **kwargs,
     ) -> Tuple[List[dict], Any, List[dict], List[str], Optional[Exception]]:
         """Execute contract in interpreter
@@ -106,6 +155,8 @@ class Interpreter:
         :param sender: patch SENDER
         :param balance: patch BALANCE
         :param block_id: set block ID
+        :param trace: collect execution trace (stdout), disable to speed up execution, or pass a custom `TraceSink`
+        :param gas_meter: count gas consumed by the call (see `GasMeter`), execution fails if its limit is exceeded
         """
         context = ExecutionContext(
             amount=amount,
@@ -115,11 +166,15 @@ class Interpreter:
             balance=balance,
             block_id=block_id,
             script={'code': script, 'storage': storage},
+            gas_meter=gas_meter,
             **kwargs,
         )
         stack = MichelsonStack()
-        stdout = []  # type: ignore
+        stdout = make_stdout(trace)  # type: ignore
         try:
+            if gas_meter is not None:
+                gas_meter.consume(TRANSACTION_BASE_COST, reason='BEGIN')
+                gas_meter.consume_micheline([script, parameter, storage])
             program = MichelsonProgram.load(context, with_code=True)
             res = program.instantiate(
                 entrypoint=entrypoint,
@@ -129,11 +184,53 @@ class Interpreter:
             res.begin(stack, stdout, context)
             res.execute(stack, stdout, context)
             operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
+            if gas_meter is not None:
+                gas_meter.consume_micheline([storage, lazy_diff])
             return operations, storage, lazy_diff, stdout, None
         except MichelsonRuntimeError as e:
             stdout.append(e.format_stdout())
             return [], None, [], stdout, e
 
+    @staticmethod
+    def run_batch(
+        script,
+        calls: Sequence[BatchCall],
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        mp_context=None,
+        **kwargs,
+    ) -> List[BatchResult]:
+        """Execute many independent contract calls in parallel using a pool of processes.
+
+        The script is sent to each worker once (and parsed there once), calls are distributed in chunks.
+
+        :param script: contract's Michelson code (Micheline expression)
+        :param calls: list of (entrypoint, parameter, storage) or (entrypoint, parameter, storage, overrides) \
+            where parameter and storage are Micheline expressions and overrides are `run_code` keyword arguments \
+            (amount, sender, balance, now, etc.)
+        :param max_workers: number of processes, defaults to the number of CPUs
+        :param chunksize: number of calls sent to a worker at once, by default calls are split evenly
+        :param mp_context: multiprocessing context (e.g. to use `spawn` start method)
+        :param kwargs: `run_code` keyword arguments common for all the calls \
+            (except `gas_meter`: meters are not sent back from worker processes)
+        :returns: list of [operations, storage, lazy_diff, error] in the order of calls, \
+            error is `MichelsonRuntimeError` with string arguments (prefixed with the exception type name \
+            if the call has failed with some other exception)
+        """
+        if 'gas_meter' in kwargs or any(len(call) > 3 and 'gas_meter' in call[3] for call in calls):
+            raise ValueError('Gas meter is not supported by batch calls, use run_code to count gas')
+        if not calls:
+            return []
+        if chunksize is None:
+            chunksize = max(1, len(calls) // ((max_workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_batch_worker,
+            initargs=(script, kwargs),
+        ) as executor:
+            return list(executor.map(_run_batch_call, calls, chunksize=chunksize))
+
     @staticmethod
     def run_callback(
         entrypoint: str,
@@ -179,7 +276,13 @@ class Interpreter:
             return None, None, stdout, e
 
     @staticmethod
-    def run_view(name: str, parameter, storage, context: ExecutionContext) -> Tuple[Any, Any, Optional[Exception]]:
+    def run_view(
+        name: str,
+        parameter,
+        storage,
+        context: ExecutionContext,
+        trace: Union[bool, TraceSink] = True,
+    ) -> Tuple[Any, Any, Optional[Exception]]:
         ctx = ExecutionContext(
             shell=context.shell,
             key=context.key,
@@ -189,7 +292,7 @@ class Interpreter:
             view_results=context.view_results,
         )
         stack = MichelsonStack()
-        stdout = []  # type: ignore
+        stdout = make_stdout(trace)  # type: ignore
         try:
             program = MichelsonProgram.load(ctx, with_code=True)
             res = program.instantiate_view(name=name, parameter=parameter, storage=storage)
@@ -3,44 +3,96 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 
+from pymavryk.michelson.micheline import MichelsonRuntimeError
 from pymavryk.michelson.types.base import MichelsonType
 
+StackSnapshot = Tuple[List[MichelsonType], List[MichelsonType]]
+
 
 class MichelsonStack:
+    """Michelson stack with a protected window on top (used by DIP and alike).
+
+    :param items: stack items, top first
+    """
+
     def __init__(self, items: Optional[List[MichelsonType]] = None) -> None:
-        self.items = items or []
-        self.protected = 0
+        # NOTE: working items are stored bottom first (top at the tail), so that push/pop are O(1),
+        # protected items are stored top first (the one closest to the working top at the tail),
+        # so that protect/restore are O(count)
+        self._items: List[MichelsonType] = list(reversed(items)) if items else []
+        self._protected: List[MichelsonType] = []
 
     @classmethod
     def from_items(cls, items: List[MichelsonType]) -> 'MichelsonStack':
         return cls(items)
 
+    @property
+    def items(self) -> List[MichelsonType]:
+        """All stack items (including protected ones), top first.
+
+        NOTE: this is a copy built on every access, so in-place changes (e.g. `stack.items[0] = x`) are not applied
+        to the stack; assign the whole list instead, which also drops the protected window (see `protect`).
+        """
+        return self._protected + self._items[::-1]
+
+    @items.setter
+    def items(self, items: List[MichelsonType]) -> None:
+        """Replace all stack items (top first), protected items become regular ones"""
+        self._items = list(reversed(items))
+        self._protected = []
+
+    @property
+    def protected(self) -> int:
+        return len(self._protected)
+
     def protect(self, count: int) -> None:
-        if len(self.items) < count:
-            raise Exception(f'got {len(self.items)} items on the stack, want to protect {count}')
-        self.protected += count
+        if len(self._items) < count:
+            raise MichelsonRuntimeError(f'got {len(self._items)} items on the stack, want to protect {count}')
+        if count > 0:
+            self._protected.extend(self._items[: -count - 1 : -1])
+            del self._items[-count:]
 
     def restore(self, count: int) -> None:
-        if self.protected < count:
-            raise Exception(f'want to restore {count} items, but only {self.protected} are protected')
-        self.protected -= count
+        if len(self._protected) < count:
+            raise MichelsonRuntimeError(f'want to restore {count} items, but only {len(self._protected)} are protected')
+        if count > 0:
+            self._items.extend(self._protected[: -count - 1 : -1])
+            del self._protected[-count:]
+
+    def snapshot(self) -> StackSnapshot:
+        """Capture current state, O(number of items): values are immutable and shared with the snapshot"""
+        return list(self._items), list(self._protected)
+
+    def rollback(self, snapshot: StackSnapshot) -> None:
+        """Return to a previously captured state (the snapshot can be reused)"""
+        items, protected = snapshot
+        self._items, self._protected = list(items), list(protected)
 
     def push(self, item: MichelsonType):
-        self.items.insert(self.protected, item)
+        self._items.append(item)
 
     def peek(self) -> MichelsonType:
-        if not self.items:
-            raise Exception('stack is empty')
-        return self.items[self.protected]
+        if not self._items:
+            raise MichelsonRuntimeError('stack is empty')
+        return self._items[-1]
+
+    def peekn(self, count: int) -> List[MichelsonType]:
+        """Up to `count` items from the top of the working part of the stack, top first (not removed)"""
+        return self._items[: -count - 1 : -1]
 
     def pop(self, count: int) -> List[MichelsonType]:
-        if len(self.items) - self.protected < count:
-            raise Exception(f'got {len(self.items) - self.protected} items on the stack, want to pop {count}')
-        return [self.items.pop(self.protected) for _ in range(count)]
+        if len(self._items) < count:
+            raise MichelsonRuntimeError(f'got {len(self._items)} items on the stack, want to pop {count}')
+        if count <= 0:
+            return []
+        res = self._items[: -count - 1 : -1]
+        del self._items[-count:]
+        return res
 
     def pop1(self) -> MichelsonType:
-        (a,) = self.pop(count=1)
-        return a
+        if not self._items:
+            raise MichelsonRuntimeError('got 0 items on the stack, want to pop 1')
+        return self._items.pop()
 
     def pop2(self) -> Tuple[MichelsonType, MichelsonType]:
         a, b = self.pop(count=2)
@@ -51,17 +103,19 @@ class MichelsonStack:
         return a, b, c
 
     def clear(self) -> None:
-        self.items.clear()
-        self.protected = 0
+        self._items.clear()
+        self._protected.clear()
 
     def dump(self, count: int) -> Optional[List[MichelsonType]]:
-        if not self.items:
+        if not len(self):
             return None
-        count = min(count, len(self.items))
-        return self.items[:count]
+        res = self._protected[:count]
+        if len(res) < count:
+            res.extend(self._items[: -(count - len(res)) - 1 : -1])
+        return res
 
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._items) + len(self._protected)
 
     def __repr__(self) -> str:
         return pformat(self.items)
@@ -0,0 +1,439 @@
+from functools import partial
+from io import StringIO
+from typing import IO
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import simplejson as json
+from ply.lex import LexToken  # type: ignore
+
+from pymavryk.michelson.forge import begin_array
+from pymavryk.michelson.forge import end_array
+from pymavryk.michelson.forge import forge_micheline_into
+from pymavryk.michelson.forge import get_tag
+from pymavryk.michelson.macros import expand_macro
+from pymavryk.michelson.parse import MichelsonParserError
+from pymavryk.michelson.parse import arg_tokens
+from pymavryk.michelson.parse import token_re
+from pymavryk.michelson.tags import prim_tags
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Token = Tuple[str, str, int]
+Source = Union[str, IO[str], Iterable[str]]
+
+
+def make_token(token: Token) -> LexToken:
+    res = LexToken()
+    res.type, res.value, res.lexpos = token
+    res.lineno = 1
+    return res
+
+
+def iter_chunks(source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Read Michelson source piece by piece.
+
+    :param source: string, text file object or iterable of string chunks
+    :param chunk_size: number of characters to read from file at a time
+    """
+    if isinstance(source, str):
+        return iter([source])
+    if hasattr(source, 'read'):
+        return iter(partial(source.read, chunk_size), '')  # type: ignore
+    return iter(source)  # type: ignore
+
+
+def iter_tokens(chunks: Iterable[str]) -> Iterator[Token]:
+    """Split Michelson source into tokens (same as `tokenize`), tokens might span multiple chunks.
+
+    :param chunks: source chunks
+    :returns: generator of (token type, value, position)
+    """
+    chunks = iter(chunks)
+    buf, offset, pos, eof = '', 0, 0, False
+    while True:
+        if pos == len(buf) and eof:
+            break
+        match = token_re.match(buf, pos)
+        # NOTE: token might continue in the next chunk, read at least as much as we have to keep memory usage linear
+        if not eof and (match is None or match.end() == len(buf)):
+            tail, pending = buf[pos:], []
+            while not eof and sum(map(len, pending)) <= len(tail):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    eof = True
+                else:
+                    pending.append(chunk)
+            buf, offset, pos = ''.join([tail, *pending]), offset + pos, 0
+            continue
+        if match is None:
+            raise MichelsonParserError(make_token((buf[pos], buf[pos], offset + pos)))
+        kind, value = match.lastgroup, match.group()
+        if kind == 'PUNCT':
+            yield value, value, offset + pos
+        elif kind != 'SKIP':
+            yield kind, value, offset + pos  # type: ignore
+        pos = match.end()
+    yield '$end', '', offset + pos
+
+
+class MichelineWriter:
+    """Receives Micheline expression piece by piece, in the order of appearance in the source."""
+
+    def begin_sequence(self) -> None:
+        raise NotImplementedError
+
+    def end_sequence(self) -> None:
+        raise NotImplementedError
+
+    def begin_prim(self, prim: str, annots: List[str]) -> None:
+        """Primitive application, arguments follow (if any)"""
+        raise NotImplementedError
+
+    def end_prim(self) -> None:
+        raise NotImplementedError
+
+    def write(self, expr: Any) -> None:
+        """Complete expression: literal, argument-less primitive or expanded macro"""
+        raise NotImplementedError
+
+    def wrap_sequence(self) -> None:
+        """Turn top level into a sequence starting with the expression written so far (if any), keep it open"""
+        raise NotImplementedError
+
+    def result(self) -> Any:
+        raise NotImplementedError
+
+
+class TreeWriter(MichelineWriter):
+    """Builds Micheline expression in memory (same as `michelson_to_micheline`)"""
+
+    def __init__(self) -> None:
+        self.root: List[Any] = []
+        self.stack: List[Any] = [self.root]
+
+    def append(self, expr: Any) -> None:
+        parent = self.stack[-1]
+        if isinstance(parent, dict):
+            parent.setdefault('args', []).append(expr)
+        else:
+            parent.append(expr)
+
+    def begin_sequence(self) -> None:
+        expr: List[Any] = []
+        self.append(expr)
+        self.stack.append(expr)
+
+    def end_sequence(self) -> None:
+        self.stack.pop()
+
+    def begin_prim(self, prim: str, annots: List[str]) -> None:
+        expr = {'prim': prim, 'annots': annots} if annots else {'prim': prim}
+        self.append(expr)
+        self.stack.append(expr)
+
+    def end_prim(self) -> None:
+        self.stack.pop()
+
+    def write(self, expr: Any) -> None:
+        self.append(expr)
+
+    def wrap_sequence(self) -> None:
+        self.root[:] = [list(self.root)]
+        self.stack.append(self.root[0])
+
+    def result(self) -> Any:
+        return self.root[0] if self.root else None
+
+
+class JsonWriter(MichelineWriter):
+    """Writes Micheline JSON to a text stream as it is parsed (same as `json.dumps` of the whole expression).
+
+    Whether the top level is a sequence is known only after its first item, so seekable streams get a one character
+    placeholder (a space, or the opening bracket patched in place), otherwise the first top level item is kept in
+    memory until it is complete.
+
+    :param stream: writable text stream
+    """
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        self.seekable = getattr(stream, 'seekable', lambda: False)()
+        self.placeholder: Optional[int] = None
+        self.buffer: Optional[StringIO] = None
+        self.out: IO[str] = stream
+        self.stack: List[List[Any]] = [['root', 0]]
+
+    def begin_child(self) -> None:
+        parent = self.stack[-1]
+        if parent[0] == 'root' and parent[1] == 0:
+            if self.seekable:
+                self.placeholder = self.stream.tell()
+                self.stream.write(' ')
+            else:
+                self.buffer = self.out = StringIO()
+        elif parent[0] == 'prim':
+            self.out.write(', "args": [' if parent[1] == 0 else ', ')
+        elif parent[1]:
+            self.out.write(', ')
+        parent[1] += 1
+
+    def begin_sequence(self) -> None:
+        self.begin_child()
+        self.out.write('[')
+        self.stack.append(['seq', 0])
+
+    def end_sequence(self) -> None:
+        self.stack.pop()
+        self.out.write(']')
+
+    def begin_prim(self, prim: str, annots: List[str]) -> None:
+        self.begin_child()
+        header = json.dumps({'prim': prim, 'annots': annots} if annots else {'prim': prim})
+        self.out.write(header[:-1])
+        self.stack.append(['prim', 0])
+
+    def end_prim(self) -> None:
+        _, count = self.stack.pop()
+        self.out.write(']}' if count else '}')
+
+    def write(self, expr: Any) -> None:
+        self.begin_child()
+        self.out.write(json.dumps(expr))
+
+    def flush_buffer(self, prefix: str) -> None:
+        assert self.buffer is not None
+        self.stream.write(prefix + self.buffer.getvalue())
+        self.buffer = None
+        self.out = self.stream
+
+    def wrap_sequence(self) -> None:
+        if self.buffer is not None:
+            self.flush_buffer('[')
+        elif self.placeholder is not None:
+            end = self.stream.tell()
+            self.stream.seek(self.placeholder)
+            self.stream.write('[')
+            self.stream.seek(end)
+        else:
+            self.stream.write('[')
+        self.stack[0][0] = 'seq'
+
+    def result(self) -> None:
+        if self.buffer is not None:
+            self.flush_buffer('')
+        elif self.stack == [['root', 0]]:
+            self.stream.write('null')
+
+
+class ForgeWriter(MichelineWriter):
+    """Encodes Micheline expression into the byte form as it is parsed (same as `forge_micheline`)"""
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+        self.stack: List[Tuple[int, List[str], int]] = []
+        self.counts = [0]
+
+    def begin_child(self) -> None:
+        self.counts[-1] += 1
+
+    def begin_sequence(self) -> None:
+        self.begin_child()
+        self.buf.append(2)
+        self.stack.append((begin_array(self.buf), [], -1))
+        self.counts.append(0)
+
+    def end_sequence(self) -> None:
+        pos, _, _ = self.stack.pop()
+        self.counts.pop()
+        end_array(self.buf, pos)
+
+    def begin_prim(self, prim: str, annots: List[str]) -> None:
+        self.begin_child()
+        # NOTE: tag depends on the number of arguments, it is patched when all of them are written
+        tag_pos = len(self.buf)
+        self.buf.append(0)
+        self.buf.extend(prim_tags[prim])
+        self.stack.append((len(self.buf), annots, tag_pos))
+        self.counts.append(0)
+
+    def end_prim(self) -> None:
+        args_pos, annots, tag_pos = self.stack.pop()
+        args_len = self.counts.pop()
+        self.buf[tag_pos : tag_pos + 1] = get_tag(args_len, len(annots))
+        if args_len >= 3:
+            self.buf[args_pos:args_pos] = (len(self.buf) - args_pos).to_bytes(4, 'big')
+        if annots:
+            data = ' '.join(annots).encode()
+            self.buf.extend(len(data).to_bytes(4, 'big'))
+            self.buf.extend(data)
+        elif args_len >= 3:
+            self.buf.extend(b'\x00' * 4)
+
+    def write(self, expr: Any) -> None:
+        self.begin_child()
+        forge_micheline_into(self.buf, expr)
+
+    def wrap_sequence(self) -> None:
+        self.buf[0:0] = b'\x02\x00\x00\x00\x00'
+        self.stack.append((1, [], -1))
+        self.counts[0] = 1
+        self.counts.append(0)
+
+    def result(self) -> bytes:
+        assert self.counts[0], 'empty expression'
+        return bytes(self.buf)
+
+
+class StreamingMichelsonParser:
+    """Parses Michelson source of arbitrary size without holding it (or the resulting expression) in memory.
+
+    Primitive applications are passed to the writer as soon as they are read,
+    only macro arguments are collected before expansion.
+
+    :param source: string, text file object or iterable of string chunks
+    :param extra_primitives: List of words to be ignored
+    :param chunk_size: number of characters to read from file at a time
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        extra_primitives: Optional[List[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.tokens = iter_tokens(iter_chunks(source, chunk_size))
+        self.extra_primitives = extra_primitives or []
+        self.token: Token = next(self.tokens)
+
+    def advance(self) -> Token:
+        token = self.token
+        if token[0] != '$end':
+            self.token = next(self.tokens)
+        return token
+
+    def expect(self, kind: str) -> Token:
+        if self.token[0] != kind:
+            raise MichelsonParserError(make_token(self.token))
+        return self.advance()
+
+    def parse_into(self, writer: MichelineWriter) -> Any:
+        """Parse the whole source, pass the expression to the writer.
+
+        :returns: writer result
+        """
+        wrapped = self.token[0] == '(' and self.token[2] == 0
+        if wrapped:
+            self.advance()
+        stop = ')' if wrapped else '$end'
+
+        self.write_item(writer, stop)
+        if self.token[0] == ';':
+            writer.wrap_sequence()
+            while self.token[0] == ';':
+                self.advance()
+                self.write_item(writer, stop)
+            closing = self.expect(stop)
+            writer.end_sequence()
+        else:
+            closing = self.expect(stop)
+
+        # NOTE: same as stripping parentheses around the whole source: closing one has to be the last character
+        if wrapped and (self.token[0] != '$end' or self.token[2] != closing[2] + 1):
+            raise MichelsonParserError(make_token(self.token))
+        return writer.result()
+
+    def write_item(self, writer: MichelineWriter, stop: str) -> None:
+        kind = self.token[0]
+        if kind == 'PRIM':
+            self.write_expr(writer)
+        elif kind in ('INT', 'BYTE', 'STR'):
+            self.write_literal(writer)
+        elif kind == '{':
+            self.advance()
+            self.write_block(writer)
+        elif kind not in (';', stop):
+            raise MichelsonParserError(make_token(self.token))
+
+    def write_literal(self, writer: MichelineWriter) -> None:
+        kind, value, _ = self.advance()
+        if kind == 'INT':
+            writer.write({'int': value})
+        elif kind == 'BYTE':
+            writer.write({'bytes': value[2:]})
+        else:
+            writer.write({'string': json.loads(value)})
+
+    def write_block(self, writer: MichelineWriter) -> None:
+        writer.begin_sequence()
+        self.write_item(writer, '}')
+        while self.token[0] == ';':
+            self.advance()
+            self.write_item(writer, '}')
+        self.expect('}')
+        writer.end_sequence()
+
+    def write_expr(self, writer: MichelineWriter) -> None:
+        prim_token = self.expect('PRIM')
+        prim, annots = prim_token[1], []
+        while self.token[0] == 'ANNOT':
+            annots.append(self.advance()[1])
+
+        if prim in prim_tags or prim in self.extra_primitives:
+            writer.begin_prim(prim, annots)
+            while self.token[0] in arg_tokens:
+                self.write_arg(writer)
+            writer.end_prim()
+        else:
+            args = []
+            while self.token[0] in arg_tokens:
+                arg_writer = TreeWriter()
+                self.write_arg(arg_writer)
+                args.append(arg_writer.result())
+            try:
+                writer.write(expand_macro(prim=prim, annots=annots, args=args))
+            except AssertionError as e:
+                raise MichelsonParserError(make_token(prim_token), str(e)) from e
+
+    def write_arg(self, writer: MichelineWriter) -> None:
+        kind, value, _ = self.token
+        if kind == 'PRIM':
+            self.advance()
+            writer.write({'prim': value})
+        elif kind == '{':
+            self.advance()
+            self.write_block(writer)
+        elif kind == '(':
+            self.advance()
+            self.write_expr(writer)
+            self.expect(')')
+        else:
+            self.write_literal(writer)
+
+
+def michelson_to_micheline_stream(
+    source: Source,
+    writer: Optional[MichelineWriter] = None,
+    extra_primitives: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Any:
+    """Converts Michelson source of arbitrary size, e.g. straight from file to Micheline JSON:
+
+    .. code-block:: python
+
+        with open('contract.tz') as src, open('contract.json', 'w') as dst:
+            michelson_to_micheline_stream(src, JsonWriter(dst))
+
+    :param source: string, text file object or iterable of string chunks
+    :param writer: where to put the result, `TreeWriter` by default (returns Micheline expression)
+    :param extra_primitives: List of words to be ignored
+    :param chunk_size: number of characters to read from file at a time
+    :returns: writer result: Micheline expression for `TreeWriter`, bytes for `ForgeWriter`, None for `JsonWriter`
+    """
+    parser = StreamingMichelsonParser(source, extra_primitives=extra_primitives, chunk_size=chunk_size)
+    return parser.parse_into(writer or TreeWriter())
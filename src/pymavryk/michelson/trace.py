@@ -0,0 +1,175 @@
+from collections import deque
+from time import perf_counter
+from typing import IO
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Union
+
+import simplejson as json
+from attr import dataclass
+
+
+def format_stdout(prim: str, inputs: list, outputs: list, arg=None):
+    arg = f' {arg}' if arg else ''
+    pop = " : ".join(map(repr, inputs)) if inputs else '_'
+    push = " : ".join(map(repr, outputs)) if outputs else '_'
+    return f'{prim}{arg} / {pop} => {push}'
+
+
+class NullStdout(list):
+    """Execution trace that discards everything, used to run code without tracing"""
+
+    def append(self, line: str) -> None:
+        pass
+
+
+@dataclass(kw_only=True)
+class TraceRecord:
+    """Single instruction step.
+
+    :param prim: instruction name
+    :param inputs: consumed stack items
+    :param outputs: produced stack items
+    :param arg: instruction argument, if any (e.g. DIP depth)
+    :param depth: code block nesting level
+    :param elapsed: time since the previous step (in seconds)
+    """
+
+    prim: str
+    inputs: List[Any]
+    outputs: List[Any]
+    arg: Any = None
+    depth: int = 0
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        return format_stdout(self.prim, self.inputs, self.outputs, self.arg)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'prim': self.prim,
+            'arg': None if self.arg is None else str(self.arg),
+            'inputs': list(map(repr, self.inputs)),
+            'outputs': list(map(repr, self.outputs)),
+            'depth': self.depth,
+            'elapsed': self.elapsed,
+        }
+
+
+TraceEntry = Union[TraceRecord, str]
+
+
+class TraceSink:
+    """Base class for execution trace consumers, can be passed to the interpreter instead of a plain list.
+
+    Instruction steps are received as structured records, free-form messages (errors, section updates)
+    as strings. Iterating over a sink yields the retained entries as text lines (same as the list of strings).
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self._last_time = perf_counter()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def emit(self, entry: TraceEntry) -> None:
+        """Handle trace entry, to be implemented in subclasses"""
+        raise NotImplementedError
+
+    def append(self, line: str) -> None:
+        self.emit(line)
+
+    def record(self, prim: str, inputs: list, outputs: list, arg=None) -> None:
+        now = perf_counter()
+        record = TraceRecord(
+            prim=prim,
+            inputs=inputs,
+            outputs=outputs,
+            arg=arg,
+            depth=self.depth,
+            elapsed=now - self._last_time,
+        )
+        self._last_time = now
+        self.emit(record)
+
+    def enter(self) -> None:
+        self.depth += 1
+
+    def exit(self) -> None:
+        self.depth -= 1
+
+
+class ListTraceSink(TraceSink):
+    """Collects formatted text lines, same as passing a plain list"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: List[str] = []
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lines)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def emit(self, entry: TraceEntry) -> None:
+        self.lines.append(str(entry))
+
+
+class RingBufferTraceSink(TraceSink):
+    """Keeps the last N entries only, formatting is deferred until they are read.
+
+    :param max_size: number of entries to keep
+    """
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.entries: Deque[TraceEntry] = deque(maxlen=max_size)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(str, self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def records(self) -> List[TraceRecord]:
+        return [entry for entry in self.entries if isinstance(entry, TraceRecord)]
+
+    def emit(self, entry: TraceEntry) -> None:
+        self.entries.append(entry)
+
+
+class JsonLinesTraceSink(TraceSink):
+    """Writes entries to a text stream as they come, one JSON object per line.
+
+    :param stream: writable text stream (file, socket wrapper, etc.)
+    :param autoflush: flush the stream after every entry
+    """
+
+    def __init__(self, stream: IO[str], autoflush: bool = False) -> None:
+        super().__init__()
+        self.stream = stream
+        self.autoflush = autoflush
+        self.count = 0
+
+    def emit(self, entry: TraceEntry) -> None:
+        data = entry.to_dict() if isinstance(entry, TraceRecord) else {'message': entry}
+        self.stream.write(json.dumps(data) + '\n')
+        if self.autoflush:
+            self.stream.flush()
+        self.count += 1
+
+
+def make_stdout(trace: Union[bool, TraceSink, None]) -> Union[List[str], TraceSink]:
+    """Create execution trace container.
+
+    :param trace: True for a list of strings, False to disable tracing, or a custom sink
+    """
+    if isinstance(trace, TraceSink):
+        return trace
+    return [] if trace else NullStdout()
@@ -11,7 +11,7 @@ from typing import Union
 from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
-from pymavryk.michelson.forge import forge_micheline
+from pymavryk.michelson.forge import forge_micheline_into
 from pymavryk.michelson.forge import unforge_micheline
 from pymavryk.michelson.micheline import Micheline
 
@@ -73,6 +73,13 @@ class MichelsonType(Micheline):
     def __eq__(self, other: 'MichelsonType'):  # type: ignore
         assert not self.is_comparable(), f'must be implemented for comparable types'
 
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # NOTE: fast forging path of the parent class would ignore the overridden value representation
+        if 'to_micheline_value' in cls.__dict__ and 'forge_into' not in cls.__dict__:
+            cls.forge_into = MichelsonType.forge_into  # type: ignore
+
     def __getitem__(self, key):
         raise AssertionError(f'forbidden')
 
@@ -210,7 +217,7 @@ class MichelsonType(Micheline):
     def unpack(cls, data: bytes) -> 'MichelsonType':
         assert cls.is_packable(), f'{cls.prim} cannot be packed'
         assert data.startswith(b'\x05'), f'packed data should start with 05'
-        val_expr = unforge_micheline(data[1:])
+        val_expr = unforge_micheline(memoryview(data)[1:])
         return cls.from_micheline_value(val_expr)
 
     @classmethod
@@ -261,14 +268,20 @@ class MichelsonType(Micheline):
                         return res
         return None
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        """Append value in the byte form to the buffer, override for faster forging (no intermediate Micheline)"""
+        forge_micheline_into(buf, self.to_micheline_value(mode=mode))
+
     def forge(self, mode='readable') -> bytes:
-        val_expr = self.to_micheline_value(mode=mode)
-        return forge_micheline(val_expr)
+        buf = bytearray()
+        self.forge_into(buf, mode=mode)
+        return bytes(buf)
 
     def pack(self, legacy=False) -> bytes:
         assert self.is_packable(), f'{self.prim} cannot be packed'
-        data = self.forge(mode='legacy_optimized' if legacy else 'optimized')
-        return b'\x05' + data
+        buf = bytearray(b'\x05')
+        self.forge_into(buf, mode='legacy_optimized' if legacy else 'optimized')
+        return bytes(buf)
 
     def duplicate(self):
         assert self.is_duplicable(), f'{self.prim} is not duplicable'
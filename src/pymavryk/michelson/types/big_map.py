@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from copy import copy
 from copy import deepcopy
 from typing import Callable
@@ -15,7 +16,6 @@ from pymavryk.michelson.micheline import MichelineLiteral
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.micheline import parse_micheline_literal
 from pymavryk.michelson.types.base import MichelsonType
-from pymavryk.michelson.types.base import Undefined
 from pymavryk.michelson.types.map import EltLiteral
 from pymavryk.michelson.types.map import MapType
 
@@ -29,7 +29,7 @@ class BigMapType(MapType, prim='big_map', args_len=2):
     ):
         super(BigMapType, self).__init__(items=items)
         self.ptr = ptr
-        self.removed_keys = removed_keys or []
+        self.removed_keys = sorted(removed_keys) if removed_keys else []
         self.context: Optional[AbstractContext] = None
 
     def __len__(self):
@@ -142,6 +142,7 @@ class BigMapType(MapType, prim='big_map', args_len=2):
                     items.append((key, value))
                 else:
                     removed_keys.append(key)
+            items.sort(key=lambda x: x[0])
             res = type(self)(ptr=self.ptr, items=items, removed_keys=removed_keys)
             res.context = self.context
             return res
@@ -201,38 +202,66 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         if context.tzt:  # type: ignore
             context.tzt_big_maps[self.ptr] = self  # type: ignore
 
+    def _find_removed(self, key: MichelsonType) -> Tuple[int, bool]:
+        idx = bisect_left(self.removed_keys, key)
+        return idx, idx < len(self.removed_keys) and self.removed_keys[idx] == key
+
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
-        val = next((v for k, v in self if k == key), Undefined)  # search in diff
-        if val is Undefined:
-            assert self.context, f'context is not attached'
-            key_hash = forge_script_expr(key.pack(legacy=True))
-            val_expr = self.context.get_big_map_value(self.ptr, key_hash)  # type: ignore
-            if val_expr is None:
-                return None
-            else:
-                return self.args[1].from_micheline_value(val_expr)
+        idx, found = self._find(key)  # search in diff
+        if found:
+            return self.items[idx][1]
+        if self._find_removed(key)[1]:
+            return None
+        assert self.context, f'context is not attached'
+        key_hash = forge_script_expr(key.pack(legacy=True))
+        val_expr = self.context.get_big_map_value(self.ptr, key_hash)  # type: ignore
+        if val_expr is None:
+            return None
         else:
-            return val  # type: ignore
+            return self.args[1].from_micheline_value(val_expr)
+
+    def get_many(self, keys: List[MichelsonType]) -> List[Optional[MichelsonType]]:
+        for key in keys:
+            self.args[0].assert_type_equal(type(key))
+        values = dict(self)  # search in diff
+        missing = list(dict.fromkeys(key for key in keys if key not in values))
+        if missing:
+            assert self.context, f'context is not attached'
+            key_hashes = [forge_script_expr(key.pack(legacy=True)) for key in missing]
+            val_exprs = self.context.get_big_map_values(self.ptr, key_hashes)  # type: ignore
+            for i, key in enumerate(missing):
+                val_expr = val_exprs[i]
+                values[key] = None if val_expr is None else self.args[1].from_micheline_value(val_expr)
+        return [values[key] for key in keys]
+
+    def iter_values(self, offset=0, **kwargs) -> Generator[MichelsonType, None, None]:
+        """Iterate over on-chain big_map values (local diff is not taken into account)"""
+        assert self.context, f'context is not attached'
+        for val_expr in self.context.iter_big_map_values(self.ptr, offset=offset, **kwargs):  # type: ignore
+            yield self.args[1].from_micheline_value(val_expr)
+
+    def iter_items(self, offset=0, **kwargs) -> Generator[Tuple[str, Optional[MichelsonType]], None, None]:
+        """Iterate over on-chain big_map entries (key hash, value), local diff is not taken into account.
+        Value is None if the key has been removed since listing, such entries are kept so that offset stays valid.
+        """
+        assert self.context, f'context is not attached'
+        for key_hash, val_expr in self.context.iter_big_map_items(self.ptr, offset=offset, **kwargs):  # type: ignore
+            yield key_hash, None if val_expr is None else self.args[1].from_micheline_value(val_expr)
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        removed_keys = set(self.removed_keys)
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self]
-            else:  # remove
-                items = [(k, v) for k, v in self if k != key]
-                removed_keys.add(key)
-        else:
-            if val is not None:
-                items = sorted(self.items + [(key, val)], key=lambda x: x[0])
-                if key in removed_keys:
-                    removed_keys.remove(key)
-            else:  # do nothing
-                items = self.items  # type: ignore
-        res = type(self)(items=items, ptr=self.ptr, removed_keys=list(removed_keys))  # type: ignore
-        res.context = self.context
+        _, res = super(BigMapType, self).update(key, val)
+        removed_keys = self.removed_keys
+        idx, removed = self._find_removed(key)
+        if prev_val is not None and val is None:
+            if not removed:
+                removed_keys = [*removed_keys[:idx], key, *removed_keys[idx:]]
+        elif removed:
+            removed_keys = removed_keys[:idx] + removed_keys[idx + 1 :]
+        res.ptr = self.ptr  # type: ignore
+        res.removed_keys = removed_keys  # type: ignore
+        res.context = self.context  # type: ignore
         return prev_val, res
 
     def get_key_hash(self, key_obj):
@@ -1,6 +1,10 @@
 from typing import Type
 
 from pymavryk.context.abstract import AbstractContext
+from pymavryk.michelson.forge import forge_bytes_value_into
+from pymavryk.michelson.forge import forge_int_value_into
+from pymavryk.michelson.forge import forge_prim_into
+from pymavryk.michelson.forge import forge_string_value_into
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.micheline import MichelineLiteral
 from pymavryk.michelson.micheline import blind_unpack
@@ -85,6 +89,9 @@ class StringType(MichelsonType, prim='string'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'string': self.value}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        forge_string_value_into(buf, self.value)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -141,6 +148,9 @@ class IntType(MichelsonType, prim='int'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'int': str(self.value)}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        forge_int_value_into(buf, self.value)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -218,6 +228,9 @@ class BytesType(MichelsonType, prim='bytes'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'bytes': self.value.hex()}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        forge_bytes_value_into(buf, self.value)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         if try_unpack:
             return blind_unpack(self.value)
@@ -281,6 +294,9 @@ class BoolType(MichelsonType, prim='bool'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'prim': 'True' if self.value else 'False'}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        forge_prim_into(buf, 'True' if self.value else 'False')
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -321,6 +337,9 @@ class UnitType(MichelsonType, prim='unit'):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return {'prim': 'Unit'}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        forge_prim_into(buf, 'Unit')
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return unit()
 
@@ -14,8 +14,11 @@ from pymavryk.crypto.encoding import is_sig
 from pymavryk.crypto.encoding import is_txr_address
 from pymavryk.michelson.forge import forge_address
 from pymavryk.michelson.forge import forge_base58
+from pymavryk.michelson.forge import forge_bytes_value_into
 from pymavryk.michelson.forge import forge_contract
+from pymavryk.michelson.forge import forge_int_value_into
 from pymavryk.michelson.forge import forge_public_key
+from pymavryk.michelson.forge import forge_string_value_into
 from pymavryk.michelson.forge import optimize_timestamp
 from pymavryk.michelson.forge import unforge_address
 from pymavryk.michelson.forge import unforge_chain_id
@@ -62,6 +65,12 @@ class TimestampType(IntType, prim='timestamp'):  # type: ignore
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        if mode in ['optimized', 'legacy_optimized']:
+            forge_int_value_into(buf, self.value)
+        else:
+            forge_string_value_into(buf, format_timestamp(self.value))
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -136,6 +145,12 @@ class AddressType(StringType, prim='address'):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        if mode in ['optimized', 'legacy_optimized']:
+            forge_bytes_value_into(buf, forge_contract(self.value))
+        else:
+            forge_string_value_into(buf, self.value)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -285,6 +300,12 @@ class KeyHashType(StringType, prim='key_hash'):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        if mode in ['optimized', 'legacy_optimized']:
+            forge_bytes_value_into(buf, forge_address(self.value, tz_only=True))
+        else:
+            forge_string_value_into(buf, self.value)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         return self.value
 
@@ -4,6 +4,8 @@ from typing import Tuple
 from typing import Type
 
 from pymavryk.context.abstract import AbstractContext
+from pymavryk.michelson.forge import begin_array
+from pymavryk.michelson.forge import end_array
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.micheline import MichelineSequence
 from pymavryk.michelson.types.base import MichelsonType
@@ -70,6 +72,13 @@ class ListType(MichelsonType, prim='list', args_len=1):
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return list(map(lambda x: x.to_micheline_value(mode=mode, lazy_diff=lazy_diff), self))
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        buf.append(2)
+        pos = begin_array(buf)
+        for item in self:
+            item.forge_into(buf, mode=mode)
+        end_array(buf, pos)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         assert not comparable, f'list is not comparable'
         return list(
@@ -1,9 +1,11 @@
+from bisect import bisect_left
 from typing import Callable
 from typing import Generator
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
+from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
 from pymavryk.michelson.micheline import Micheline
@@ -20,6 +22,7 @@ class MapType(MichelsonType, prim='map', args_len=2):
     def __init__(self, items: List[Tuple[MichelsonType, MichelsonType]]):
         super(MapType, self).__init__()
         self.items = items
+        self._keys: Optional[List[MichelsonType]] = None
 
     def __repr__(self):
         elements = [f'{repr(k)}: {repr(v)}' for k, v in self.items]
@@ -54,9 +57,10 @@ class MapType(MichelsonType, prim='map', args_len=2):
 
     @classmethod
     def check_constraints(cls, items: List[Tuple[MichelsonType, MichelsonType]]):
-        keys = list(map(lambda x: x[0], items))
-        assert len(set(keys)) == len(keys), f'duplicate keys found'
-        assert keys == sorted(keys), f'keys are unsorted'
+        for (prev_key, _), (key, _) in zip(items, items[1:]):
+            if not prev_key < key:
+                assert prev_key != key, f'duplicate keys found'
+                raise AssertionError(f'keys are unsorted')
 
     @classmethod
     def generate_pydoc(cls, definitions: List[Tuple[str, str]], inferred_name=None, comparable=False):
@@ -157,28 +161,50 @@ class MapType(MichelsonType, prim='map', args_len=2):
         for _, val in self.items:
             val.attach_context(context, big_map_copy=big_map_copy)
 
+    def _find(self, key: MichelsonType) -> Tuple[int, bool]:
+        # NOTE: items are sorted by key and never modified in place, so keys can be cached for binary search
+        if self._keys is None:
+            self._keys = [k for k, _ in self.items]
+        idx = bisect_left(self._keys, key)
+        return idx, idx < len(self._keys) and self._keys[idx] == key
+
+    def _spawn(
+        self, items: List[Tuple[MichelsonType, MichelsonType]], keys: List[MichelsonType], **kwargs
+    ) -> 'MapType':
+        res = type(self)(items, **kwargs)
+        res._keys = keys
+        return res
+
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
         if dup:
             assert self.args[1].is_duplicable(), f'use GET_AND_UPDATE instead'
-        return next((v for k, v in self.items if k == key), None)
+        idx, found = self._find(key)
+        return self.items[idx][1] if found else None
+
+    def get_many(self, keys: List[MichelsonType]) -> List[Optional[MichelsonType]]:
+        return [self.get(key, dup=False) for key in keys]
 
     def contains(self, key: MichelsonType):
         return self.get(key, dup=False) is not None
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        prev_val = self.get(key, dup=False)
-        if prev_val is not None:
+        self.args[0].assert_type_equal(type(key))
+        idx, found = self._find(key)
+        keys = cast(List[MichelsonType], self._keys)
+        if found:
+            prev_val = self.items[idx][1]
             if val is not None:
-                items = [(k, v if k != key else val) for k, v in self.items]
+                res = self._spawn([*self.items[:idx], (keys[idx], val), *self.items[idx + 1 :]], keys)
             else:  # remove
-                items = [(k, v) for k, v in self.items if k != key]
+                res = self._spawn(self.items[:idx] + self.items[idx + 1 :], keys[:idx] + keys[idx + 1 :])
         else:
+            prev_val = None
             if val is not None:
-                items = sorted(self.items + [(key, val)], key=lambda x: x[0])
+                res = self._spawn([*self.items[:idx], (key, val), *self.items[idx:]], [*keys[:idx], key, *keys[idx:]])
             else:  # do nothing
-                items = self.items
-        return prev_val, type(self)(items)
+                res = self._spawn(self.items, keys)
+        return prev_val, res
 
     def __contains__(self, key_obj):
         key = self.args[0].from_python_object(key_obj)
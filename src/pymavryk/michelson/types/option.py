@@ -4,6 +4,7 @@ from typing import Optional
 from typing import Type
 
 from pymavryk.context.abstract import AbstractContext
+from pymavryk.michelson.forge import forge_prim_into
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.micheline import parse_micheline_value
 from pymavryk.michelson.types.base import MichelsonType
@@ -100,6 +101,13 @@ class OptionType(MichelsonType, prim='option', args_len=1):
             arg = self.item.to_micheline_value(mode=mode, lazy_diff=lazy_diff)
             return {'prim': 'Some', 'args': [arg]}
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        if self.is_none():
+            forge_prim_into(buf, 'None')
+        else:
+            forge_prim_into(buf, 'Some', args_len=1)
+            self.item.forge_into(buf, mode=mode)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False):
         if self.is_none():
             return None
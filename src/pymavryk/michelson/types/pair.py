@@ -7,6 +7,7 @@ from typing import Union
 from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
+from pymavryk.michelson.forge import forge_prim_into
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.types.adt import ADTMixin
 from pymavryk.michelson.types.adt import Nested
@@ -29,10 +30,13 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
         return all(item == other.items[i] for i, item in enumerate(self.items))
 
     def __lt__(self, other: 'PairType'):  # type: ignore
-        for i, item in enumerate(self.items):  # noqa: SIM111
-            if item > other.items[i]:
+        # NOTE: lexicographic order
+        for i, item in enumerate(self.items):
+            if item < other.items[i]:
+                return True
+            if other.items[i] < item:
                 return False
-        return True
+        return False
 
     def __hash__(self):
         return hash(self.items)
@@ -204,6 +208,16 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
         else:
             raise AssertionError(f'unsupported mode {mode}')
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        items = self.items if mode == 'legacy_optimized' else list(self.iter_comb())
+        if len(items) != 2:
+            # NOTE: right combs have mode-specific forms, see `to_micheline_value`
+            super().forge_into(buf, mode=mode)
+            return
+        forge_prim_into(buf, 'Pair', args_len=2)
+        for item in items:
+            item.forge_into(buf, mode=mode)
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False) -> Union[dict, tuple]:
         flat_values = self.get_flat_values(force_tuple=comparable)
         if isinstance(flat_values, dict):
@@ -1,6 +1,8 @@
+from bisect import bisect_left
 from copy import copy
 from typing import Generator
 from typing import List
+from typing import Tuple
 from typing import Type
 
 from pymavryk.context.abstract import AbstractContext
@@ -45,8 +47,10 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     @classmethod
     def check_constraints(cls, items: List[MichelsonType]):
-        assert len(set(items)) == len(items), f'duplicate elements found'
-        assert items == sorted(items), f'set elements are not sorted'
+        for prev_item, item in zip(items, items[1:]):
+            if not prev_item < item:
+                assert prev_item != item, f'duplicate elements found'
+                raise AssertionError(f'set elements are not sorted')
 
     @classmethod
     def dummy(cls, context: AbstractContext):
@@ -98,21 +102,29 @@ class SetType(MichelsonType, prim='set', args_len=1):
         )
         return f'{{ {arg_doc}, … }}'
 
+    def _find(self, item: MichelsonType) -> Tuple[int, bool]:
+        # NOTE: items are sorted, binary search
+        idx = bisect_left(self.items, item)
+        return idx, idx < len(self.items) and self.items[idx] == item
+
     def contains(self, item: MichelsonType) -> bool:
         self.args[0].assert_type_equal(type(item))
-        return item in self.items
+        _, found = self._find(item)
+        return found
 
     def add(self, item: MichelsonType) -> 'SetType':
-        if self.contains(item):
+        self.args[0].assert_type_equal(type(item))
+        idx, found = self._find(item)
+        if found:
             return copy(self)
         else:
-            items = [item] + self.items
-            return type(self)(sorted(items))
+            return type(self)([*self.items[:idx], item, *self.items[idx:]])
 
     def remove(self, item: MichelsonType) -> 'SetType':
-        if self.contains(item):
-            items = list(filter(lambda x: x != item, self.items))
-            return type(self)(items)
+        self.args[0].assert_type_equal(type(item))
+        idx, found = self._find(item)
+        if found:
+            return type(self)(self.items[:idx] + self.items[idx + 1 :])
         else:
             return copy(self)
 
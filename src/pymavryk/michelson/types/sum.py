@@ -7,6 +7,7 @@ from typing import Union
 from typing import cast
 
 from pymavryk.context.abstract import AbstractContext
+from pymavryk.michelson.forge import forge_prim_into
 from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.micheline import parse_micheline_value
 from pymavryk.michelson.types.adt import ADTMixin
@@ -187,6 +188,14 @@ class OrType(MichelsonType, ADTMixin, prim='or', args_len=2):
                 return {'prim': prim, 'args': [self.items[i].to_micheline_value(mode=mode, lazy_diff=lazy_diff)]}
         raise AssertionError(f'unexpected value {self.items}')
 
+    def forge_into(self, buf: bytearray, mode='readable') -> None:
+        for i, prim in enumerate(['Left', 'Right']):
+            if isinstance(self.items[i], MichelsonType):
+                forge_prim_into(buf, prim, args_len=1)
+                self.items[i].forge_into(buf, mode=mode)
+                return
+        raise AssertionError(f'unexpected value {self.items}')
+
     def to_python_object(self, try_unpack=False, lazy_diff=False, comparable=False) -> Union[tuple, dict]:
         flat_values = self.get_flat_values(infer_names=True)
         assert (
@@ -1,6 +1,19 @@
+from pymavryk.rpc.cache import RpcCache
 from pymavryk.rpc.helpers import *
+from pymavryk.rpc.node import RpcBalancedNode
 from pymavryk.rpc.node import RpcMultiNode
 from pymavryk.rpc.node import RpcNode
 from pymavryk.rpc.protocol import *
 from pymavryk.rpc.search import *
 from pymavryk.rpc.shell import *
+
+_async_names = {'AsyncRpcNode', 'AsyncRpcQuery', 'AsyncShellQuery'}
+
+
+def __getattr__(name: str):
+    # NOTE: asynchronous client is imported on first access, most users don't need it
+    if name in _async_names:
+        from pymavryk.rpc import aio
+
+        return getattr(aio, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,346 @@
+import asyncio
+import logging
+from datetime import datetime
+from pprint import pformat
+from typing import Any
+from typing import AsyncGenerator
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import simplejson as json
+
+from pymavryk.logging import logger
+from pymavryk.rpc.node import DEFAULT_BACKOFF_FACTOR
+from pymavryk.rpc.node import DEFAULT_POOL_SIZE
+from pymavryk.rpc.node import DEFAULT_RETRIES
+from pymavryk.rpc.node import IDEMPOTENT_METHODS
+from pymavryk.rpc.node import RETRY_STATUS_CODES
+from pymavryk.rpc.node import RpcError
+from pymavryk.rpc.node import _urljoin
+from pymavryk.rpc.query import RpcQuery
+from pymavryk.rpc.shell import MAX_BLOCK_TIMEOUT
+
+
+class AsyncExtraFallback:
+    def __getattr__(self, item):
+        raise ImportError(
+            "Please, install aiohttp Python library (`pip install pymavryk[async]`) in order to use asynchronous RPC client"
+        )
+
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = AsyncExtraFallback()
+
+
+class AsyncRpcNode:
+    """Asynchronous request proxy for a single Mavryk node (requires aiohttp).
+
+    Can be used as an async context manager, otherwise call `close()` when done.
+
+    :param uri: node URI
+    :param headers: extra HTTP headers
+    :param pool_size: max number of simultaneous connections, pending requests wait for a free one
+    :param retries: number of retries for idempotent requests on connection errors and 429/5xx
+    :param backoff_factor: exponential backoff factor between retries (in seconds)
+    :param timeout: default request timeout (in seconds), no timeout by default
+    :param session: externally managed `aiohttp.ClientSession` (optional)
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: Optional[float] = None,
+        session=None,
+    ) -> None:
+        if not uri:
+            raise RuntimeError()
+        if not isinstance(uri, list):
+            uri = [uri]
+        self.uri = uri
+        self.headers = headers or {}
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self._session = session
+        self._own_session = session is None
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nNode address',
+            self.uri[0],
+        ]
+        return '\n'.join(res)
+
+    async def __aenter__(self) -> 'AsyncRpcNode':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session(self):
+        """Pooled HTTP session, created on first use (within a running event loop)."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={'content-type': 'application/json', 'user-agent': 'PyMavryk', **self.headers},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close pooled connections (unless session is managed externally)."""
+        if self._session is not None and self._own_session:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, path: str, **kwargs) -> Any:
+        """Perform HTTP request to node.
+
+        :param method: one of GET/POST/PUT/DELETE
+        :param path: path to endpoint
+        :param kwargs: aiohttp request arguments
+        :raises RpcError: node has returned an error
+        :returns: decoded JSON or text if response is not a valid JSON
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
+        if kwargs.get('params'):
+            kwargs['params'] = _format_params(kwargs['params'])
+        timeout = kwargs.pop('timeout', None) or self.timeout
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        for attempt in range(retries + 1):
+            try:
+                async with self.session.request(method, _urljoin(self.uri[0], path), **kwargs) as res:
+                    status, content_type, text = res.status, res.content_type, await res.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == retries:
+                    raise
+            else:
+                if status not in RETRY_STATUS_CODES or attempt == retries:
+                    break
+            await asyncio.sleep(self.backoff_factor * (2**attempt))
+
+        if status == 401:
+            logger.debug('<<<<< %s\n%s', status, text)
+            raise RpcError(f'Unauthorized: {path}')
+        if status == 404:
+            logger.debug('<<<<< %s\n%s', status, text)
+            raise RpcError(f'Not found: {path}')
+        if status != 200:
+            if debug:
+                logger.debug('<<<<< %s\n%s', status, pformat(text, indent=4))
+            if content_type == 'application/json':
+                try:
+                    errors = json.loads(text)
+                except json.JSONDecodeError:
+                    raise RpcError(text)
+                assert isinstance(errors, list)
+                raise RpcError.from_errors(errors)
+            raise RpcError(text)
+
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return text
+        if debug:
+            logger.debug('<<<<< %s\n%s', status, json.dumps(data, indent=4))
+        return data
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        return await self.request('GET', path, params=params, timeout=timeout)
+
+    async def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Any:
+        return await self.request('POST', path, params=params, json=json)
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self.request('DELETE', path, params=params)
+
+    async def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self.request('PUT', path, params=params)
+
+
+def _format_params(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    # NOTE: mimic requests behavior: skip None values, repeat key for list values, stringify the rest
+    res = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is not None:
+                res.append((key, str(item)))
+    return res
+
+
+class AsyncRpcQuery(RpcQuery, path=None):
+    """Awaitable counterpart of `RpcQuery`, builds paths the same way:
+
+    .. code-block:: python
+
+        await shell.blocks['head'].context.contracts[address].storage()
+
+    NOTE: protocol-specific helpers of synchronous queries are not available.
+    """
+
+    def _spawn_query(self, wild_path, params):
+        return AsyncRpcQuery(
+            path=wild_path,
+            node=self.node,
+            params=params,
+        )
+
+    async def __call__(self, **params):  # type: ignore
+        return await self._get(params=params)
+
+    async def _get(self, params=None):  # type: ignore
+        return await self.node.get(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    async def _post(self, json=None, params=None):  # type: ignore
+        return await self.node.post(
+            path=self.path,
+            params=params,
+            json=json,
+        )
+
+    async def _put(self, params=None):  # type: ignore
+        return await self.node.put(
+            path=self.path,
+            params=params,
+        )
+
+    async def _delete(self, params=None):  # type: ignore
+        return await self.node.delete(
+            path=self.path,
+            params=params,
+        )
+
+    async def post(self, json=None, **params):
+        """Perform POST request.
+
+        :param json: JSON body
+        :param params: query parameters
+        """
+        return await self._post(json=json, params=params)
+
+    async def put(self, **params):
+        """Perform PUT request.
+
+        :param params: query parameters
+        """
+        return await self._put(params=params)
+
+    async def delete(self, **params):
+        """Perform DELETE request.
+
+        :param params: query parameters
+        """
+        return await self._delete(params=params)
+
+
+class AsyncShellQuery(AsyncRpcQuery, path=None):
+    """Asynchronous shell, use it with `AsyncRpcNode`:
+
+    .. code-block:: python
+
+        async with AsyncRpcNode('https://rpc.tzkt.io/mainnet') as node:
+            shell = AsyncShellQuery(node)
+            header = await shell.head.header()
+    """
+
+    @property
+    def blocks(self) -> AsyncRpcQuery:
+        """Shortcut for `chains.main.blocks`"""
+        return self.chains.main.blocks
+
+    @property
+    def head(self) -> AsyncRpcQuery:
+        """Shortcut for `blocks.head`"""
+        return self.blocks.head
+
+    @property
+    def contracts(self) -> AsyncRpcQuery:
+        """Shortcut for `head.context.contracts`"""
+        return self.head.context.contracts
+
+    @property
+    def mempool(self) -> AsyncRpcQuery:
+        """Shortcut for `chains.main.mempool`"""
+        return self.chains.main.mempool
+
+    async def wait_blocks(
+        self,
+        current_block_hash: str,
+        max_blocks: int = 1,
+        yield_current=False,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Iterates over future blocks (waits and yields block hash), handles reorgs
+
+        :param current_block_hash: hash of the current block (head)
+        :param max_blocks: number of blocks to iterate (not including the current one)
+        :param yield_current: yield current block hash at the very beginning
+        :param time_between_blocks: override protocol constant
+        :param block_timeout: set block timeout (by default PyMavryk will wait for a long time)
+        :return: block hashes
+        """
+        if time_between_blocks is None:
+            constants = await self.blocks[current_block_hash].context.constants()
+            time_between_blocks = int(constants.get('minimal_block_delay', 0))
+
+        if block_timeout is None:
+            block_timeout = MAX_BLOCK_TIMEOUT
+
+        if yield_current:
+            yield current_block_hash
+
+        current_header = await self.blocks[current_block_hash].header()
+        max_level = current_header['level'] + max_blocks
+
+        while current_header['level'] < max_level:
+            logger.info('Current level: %d (max %d)', current_header['level'], max_level)
+            prev_block_dt = datetime.strptime(current_header['timestamp'], '%Y-%m-%dT%H:%M:%SZ')
+            elapsed_sec = (datetime.utcnow() - prev_block_dt).seconds
+            sleep_sec = 1 if elapsed_sec > time_between_blocks else (time_between_blocks - elapsed_sec + 1)
+
+            logger.info('Sleep %d seconds until block %s is superseded', sleep_sec, current_block_hash)
+            await asyncio.sleep(sleep_sec)
+
+            next_block_hash: Optional[str] = None
+
+            for delay in range(block_timeout):
+                next_block_hash = await self.head.hash()
+                if current_block_hash == next_block_hash:
+                    await asyncio.sleep(1)
+                else:
+                    logger.info('Found new block %s (%d sec delay)', next_block_hash, delay)
+                    break
+
+            if current_block_hash != next_block_hash:
+                assert next_block_hash
+                yield next_block_hash
+                current_block_hash = next_block_hash
+                current_header = await self.blocks[current_block_hash].header()
+            else:
+                raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', block_timeout)
@@ -0,0 +1,168 @@
+import re
+import sqlite3
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import simplejson as json
+
+DEFAULT_CACHE_SIZE = 4096
+
+block_path_re = re.compile(r'^/?chains/[^/]+/blocks/([^/]+)(/|$)')
+block_hash_re = re.compile(r'^B[1-9A-HJ-NP-Za-km-z]{50}$')
+immutable_path_re = re.compile(r'^/?chains/[^/]+/chain_id/?$')
+
+CacheKey = Tuple[str, str, str]
+CacheEntry = Tuple[bytes, Optional[float]]
+
+
+def get_cache_policy(path: str, ttl: Optional[float] = None) -> Tuple[bool, Optional[float]]:
+    """Decide whether response for this path can be cached.
+
+    :param path: RPC path
+    :param ttl: time-to-live for head-relative paths, None means such paths are not cached
+    :returns: tuple (cacheable, ttl), ttl is None for immutable paths
+    """
+    match = block_path_re.match(path)
+    if match:
+        block_id = match.group(1)
+        if block_hash_re.match(block_id) or block_id == 'genesis':
+            return True, None
+        if ttl is not None and (block_id == 'head' or block_id.startswith('head~')):
+            return True, ttl
+        return False, None
+    if immutable_path_re.match(path):
+        return True, None
+    return False, None
+
+
+class RpcCache:
+    """LRU cache for responses of immutable RPC endpoints (addressed by block hash) and,
+    optionally, for a short time, of the head-relative ones.
+
+    Shared by all queries spawned from the node it is attached to:
+
+    .. code-block:: python
+
+        pymavryk.using(shell=ShellQuery(RpcNode(uri, cache=RpcCache(ttl=5))))
+
+    :param max_size: max number of responses kept in memory
+    :param ttl: time-to-live (in seconds) for responses of `head`-relative paths, None to disable caching them
+    :param db_path: path to SQLite database to persist immutable responses on disk (optional)
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl: Optional[float] = None,
+        db_path: Optional[str] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[CacheKey, CacheEntry]' = OrderedDict()
+        self._lock = Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content BLOB)')
+            self._db.commit()
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nStats',
+            f'.size\t{len(self._entries)}/{self.max_size}',
+            f'.hits\t{self.hits}',
+            f'.misses\t{self.misses}',
+        ]
+        return '\n'.join(res)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __deepcopy__(self, memo) -> 'RpcCache':
+        # NOTE: cache is shared between execution contexts, like the node itself
+        return self
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def make_key(uri: str, path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        return uri.rstrip('/'), '/' + path.strip('/'), json.dumps(params, sort_keys=True) if params else ''
+
+    def get(self, uri: str, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Get cached raw response content if any.
+
+        :returns: None if the path is not cacheable or there's no (valid) entry
+        """
+        cacheable, ttl = get_cache_policy(path, self.ttl)
+        if not cacheable:
+            return None
+
+        key = self.make_key(uri, path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                content, expires_at = entry
+                if expires_at is None or expires_at > monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return content
+                del self._entries[key]
+            elif ttl is None and self._db is not None:
+                row = self._db.execute('SELECT content FROM responses WHERE key = ?', ('\t'.join(key),)).fetchone()
+                if row is not None:
+                    self._put(key, (row[0], None))
+                    self.hits += 1
+                    return row[0]
+            self.misses += 1
+        return None
+
+    def put(self, uri: str, path: str, params: Optional[Dict[str, Any]], content: bytes) -> None:
+        """Store raw response content if the path is cacheable."""
+        cacheable, ttl = get_cache_policy(path, self.ttl)
+        if not cacheable:
+            return
+
+        key = self.make_key(uri, path, params)
+        with self._lock:
+            self._put(key, (content, None if ttl is None else monotonic() + ttl))
+            if ttl is None and self._db is not None:
+                self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?)', ('\t'.join(key), content))
+                self._db.commit()
+
+    def _put(self, key: CacheKey, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self, persistent: bool = False) -> None:
+        """Drop all cached responses and reset counters.
+
+        :param persistent: also clear on-disk storage
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if persistent and self._db is not None:
+                self._db.execute('DELETE FROM responses')
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close on-disk storage."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,22 +1,99 @@
+import atexit
 import json
+import logging
+import sys
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pprint import pformat
+from threading import Lock
+from time import monotonic
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
+from urllib.parse import urlsplit
+from weakref import WeakSet
 
 import requests
 import requests.exceptions
+from attr import dataclass
+from requests.adapters import HTTPAdapter
 from simplejson import JSONDecodeError
+from urllib3.util.retry import Retry
 
 from pymavryk.logging import logger
+from pymavryk.rpc.cache import RpcCache
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.1
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+DEFAULT_HEAD_CHECK_TIMEOUT = 5.0
+
+_sessions: Dict[Tuple[str, int, int, float], requests.Session] = {}
+_sessions_lock = Lock()
+_balanced_nodes: 'WeakSet[RpcBalancedNode]' = WeakSet()
 
 
 def _urljoin(*args: str) -> str:
     return "/".join(map(lambda x: str(x).strip('/'), args))
 
 
+def get_session(
+    uri: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> requests.Session:
+    """Get keep-alive HTTP session for the host, sessions are shared process-wide.
+
+    :param uri: node URI (only scheme and host are taken into account)
+    :param pool_size: max number of connections kept alive for the host
+    :param retries: number of retries for idempotent requests on connection errors and 429/5xx
+    :param backoff_factor: exponential backoff factor between retries (in seconds)
+    """
+    parts = urlsplit(uri)
+    key = (f'{parts.scheme}://{parts.netloc}', pool_size, retries, backoff_factor)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size,
+                    max_retries=Retry(
+                        total=retries,
+                        backoff_factor=backoff_factor,
+                        allowed_methods=IDEMPOTENT_METHODS,
+                        status_forcelist=RETRY_STATUS_CODES,
+                        raise_on_status=False,
+                    ),
+                )
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _sessions[key] = session
+    return session
+
+
+def close_sessions() -> None:
+    """Close all pooled connections and stop background workers of balanced nodes."""
+    for node in list(_balanced_nodes):
+        node.close()
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+atexit.register(close_sessions)
+
+
 def _gen_error_variants(error_id: str) -> List[str]:
     chunks = error_id.split('.')
     variants = [error_id]
@@ -29,6 +106,8 @@ def _gen_error_variants(error_id: str) -> List[str]:
 
 class RpcError(Exception):
     __handlers__ = {}  # type: ignore
+    # NOTE: HTTP status of the response the error was created from, if any
+    status_code: Optional[int] = None
 
     @classmethod
     def __init_subclass__(cls, error_id: Union[str, List[str]]) -> None:
@@ -72,15 +151,41 @@ class RpcError(Exception):
 
 
 class RpcNode:
-    """Request proxy for a single Mavryk node."""
+    """Request proxy for a single Mavryk node.
+
+    Connections are kept alive and pooled per host, so that all queries spawned from the same client
+    (and any other node object pointing to the same host) reuse them.
 
-    def __init__(self, uri: Union[str, List[str]], headers: Optional[Dict[str, str]] = None) -> None:
+    :param uri: node URI
+    :param headers: extra HTTP headers
+    :param pool_size: max number of connections kept alive for the host
+    :param retries: number of retries for idempotent requests on connection errors and 429/5xx
+    :param backoff_factor: exponential backoff factor between retries (in seconds)
+    :param timeout: default request timeout (in seconds), no timeout by default
+    :param cache: cache for responses of immutable (and optionally head-relative) GET requests
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: Optional[float] = None,
+        cache: Optional[RpcCache] = None,
+    ) -> None:
         if not uri:
             raise RuntimeError()
         if not isinstance(uri, list):
             uri = [uri]
         self.uri = uri
         self.headers = headers or {}
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.cache = cache
 
     def __repr__(self) -> str:
         res = [
@@ -90,6 +195,11 @@ class RpcNode:
         ]
         return '\n'.join(res)
 
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session for this node's host."""
+        return get_session(self.uri[0], self.pool_size, self.retries, self.backoff_factor)
+
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Perform HTTP request to node.
 
@@ -99,54 +209,79 @@ class RpcNode:
         :raises RpcError: node has returned an error
         :returns: node response
         """
-        logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
-        res = requests.request(
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        res = self.session.request(
             method=method,
             url=_urljoin(self.uri[0], path),
             headers={'content-type': 'application/json', 'user-agent': 'PyMavryk', **self.headers},
             **kwargs,
         )
-        if res.status_code == 401:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
-            raise RpcError(f'Unauthorized: {path}')
-        if res.status_code == 404:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
-            raise RpcError(f'Not found: {path}')
         if res.status_code != 200:
-            logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
-            raise RpcError.from_response(res)
+            if res.status_code == 401:
+                logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+                error = RpcError(f'Unauthorized: {path}')
+            elif res.status_code == 404:
+                logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+                error = RpcError(f'Not found: {path}')
+            else:
+                if debug:
+                    logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
+                error = RpcError.from_response(res)
+            error.status_code = res.status_code
+            raise error
 
-        logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
         return res
 
+    @staticmethod
+    def _decode(res: requests.Response) -> Any:
+        """Decode response body (exactly once), pretty-print it only if debug logging is enabled."""
+        data = res.json()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(data, indent=4))
+        return data
+
     def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
-    ) -> requests.Response:
-        return self.request('GET', path, params=params, timeout=timeout).json()
+    ) -> Any:
+        if self.cache is None:
+            return self._decode(self.request('GET', path, params=params, timeout=timeout))
+
+        content = self.cache.get(self.uri[0], path, params)
+        if content is not None:
+            return json.loads(content)
+        res = self.request('GET', path, params=params, timeout=timeout)
+        data = self._decode(res)
+        self.cache.put(self.uri[0], path, params, res.content)
+        return data
 
-    def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Union[requests.Response, str]:
+    def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Any:
         response = self.request('POST', path, params=params, json=json)
         try:
-            return response.json()
+            return self._decode(response)
         except JSONDecodeError:
             return response.text
 
-    def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        return self.request('DELETE', path, params=params).json()
+    def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self._decode(self.request('DELETE', path, params=params))
 
-    def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        return self.request('PUT', path, params=params).json()
+    def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self._decode(self.request('PUT', path, params=params))
 
 
 class RpcMultiNode(RpcNode):
     """Request proxy for multiple nodes chosen for each request in round-robin order."""
 
-    def __init__(self, uri: Union[str, List[str]]) -> None:
-        super().__init__(uri)
-        self.nodes = list(map(RpcNode, self.uri))
+    def __init__(self, uri: Union[str, List[str]], headers: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        super().__init__(uri, headers, **kwargs)
+        kwargs.pop('cache', None)
+        self.nodes = [RpcNode(node_uri, headers, **kwargs) for node_uri in self.uri]
         self._next_i = 0
 
     def __repr__(self) -> str:
@@ -162,3 +297,216 @@ class RpcMultiNode(RpcNode):
         res = self.nodes[self._next_i].request(method, path, **kwargs)
         self._next_i = (self._next_i + 1) % len(self.nodes)
         return res
+
+
+@dataclass(kw_only=True)
+class NodeHealth:
+    """Health statistics of a single node"""
+
+    latency: Optional[float] = None
+    failures: int = 0
+    level: Optional[int] = None
+    ejected_until: float = 0.0
+
+
+class RpcBalancedNode(RpcMultiNode):
+    """Request proxy for multiple nodes, prefers the fastest synced ones.
+
+    Tracks per-node latency (moving average), consecutive failures and head level. Nodes that fail repeatedly
+    or lag behind the best known head are ejected for a while. Idempotent requests failed due to connection
+    errors/timeouts or 5xx/429 responses are retried on the next best node; slow GET requests can be hedged
+    (duplicated to another node).
+
+    :param uri: list of node URIs
+    :param headers: extra HTTP headers
+    :param max_failures: number of consecutive failures after which the node is ejected
+    :param eject_time: for how long (in seconds) the node is ejected
+    :param max_lag: max number of levels node can lag behind the best known head
+    :param head_check_interval: how often (in seconds) node head levels are checked (in background), None to disable
+    :param head_check_timeout: timeout (in seconds) of a single head check request
+    :param hedge_after: if GET request takes longer (in seconds), send it to the next best node as well
+    :param kwargs: `RpcNode` arguments
+    """
+
+    latency_decay = 0.3
+    head_path = 'chains/main/blocks/head/header/shell'
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        max_failures: int = 3,
+        eject_time: float = 30.0,
+        max_lag: int = 2,
+        head_check_interval: Optional[float] = 30.0,
+        head_check_timeout: float = DEFAULT_HEAD_CHECK_TIMEOUT,
+        hedge_after: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(uri, headers, **kwargs)
+        self.max_failures = max_failures
+        self.eject_time = eject_time
+        self.max_lag = max_lag
+        self.head_check_interval = head_check_interval
+        self.head_check_timeout = head_check_timeout
+        self.hedge_after = hedge_after
+        self.health = [NodeHealth() for _ in self.nodes]
+        self._head_checked_at: Optional[float] = None
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        _balanced_nodes.add(self)
+
+    def __deepcopy__(self, memo) -> 'RpcBalancedNode':
+        # NOTE: node health and worker threads are shared, there's no point in copying them
+        return self
+
+    def __repr__(self) -> str:
+        res = [super().__repr__(), '\nNode health']
+        for uri, health in zip(self.uri, self.health):
+            latency = '-' if health.latency is None else f'{health.latency * 1000:.0f}ms'
+            res.append(f'{uri}\tlatency {latency}\tlevel {health.level}\tfailures {health.failures}')
+        return '\n'.join(res)
+
+    def __enter__(self) -> 'RpcBalancedNode':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop background workers, pending head checks and hedged requests are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            if sys.version_info >= (3, 9):
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                executor.shutdown(wait=False)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=2 * len(self.nodes), thread_name_prefix='pymavryk')
+        return self._executor
+
+    def rank(self) -> List[int]:
+        """Get node indices ordered by preference: healthy nodes by latency first, then the rest."""
+        now = monotonic()
+        with self._lock:
+            levels = [h.level for h in self.health if h.level is not None]
+            best_level = max(levels) if levels else None
+
+            def is_healthy(health: NodeHealth) -> bool:
+                if health.ejected_until > now:
+                    return False
+                if best_level is not None and health.level is not None:
+                    return best_level - health.level <= self.max_lag
+                return True
+
+            def latency(i: int) -> float:
+                return self.health[i].latency or 0.0
+
+            healthy = [i for i, h in enumerate(self.health) if is_healthy(h)]
+            ejected = [i for i, h in enumerate(self.health) if not is_healthy(h)]
+            return sorted(healthy, key=latency) + sorted(ejected, key=latency)
+
+    @staticmethod
+    def _is_failure(error: Optional[BaseException]) -> bool:
+        """Whether the error means that the node is unavailable (and the request can be retried on another one)."""
+        if isinstance(error, requests.exceptions.RequestException):
+            return True
+        if isinstance(error, RpcError) and error.status_code is not None:
+            return error.status_code >= 500 or error.status_code == 429
+        return False
+
+    def _update_health(self, i: int, elapsed: Optional[float] = None) -> None:
+        with self._lock:
+            health = self.health[i]
+            if elapsed is None:
+                health.failures += 1
+                if health.failures >= self.max_failures:
+                    logger.info('Ejecting node %s after %d failures', self.uri[i], health.failures)
+                    health.ejected_until = monotonic() + self.eject_time
+                    health.failures = 0
+            else:
+                health.failures = 0
+                if health.latency is None:
+                    health.latency = elapsed
+                else:
+                    health.latency += self.latency_decay * (elapsed - health.latency)
+
+    def _check_head(self, i: int) -> None:
+        try:
+            header = self.nodes[i]._decode(
+                self.nodes[i].request('GET', self.head_path, timeout=self.head_check_timeout)
+            )
+        except (RpcError, requests.exceptions.RequestException):
+            self._update_health(i)
+        else:
+            with self._lock:
+                self.health[i].level = header['level']
+
+    def _maybe_check_heads(self) -> None:
+        if self.head_check_interval is None or len(self.nodes) < 2:
+            return
+        now = monotonic()
+        with self._lock:
+            if self._head_checked_at is not None and now - self._head_checked_at < self.head_check_interval:
+                return
+            self._head_checked_at = now
+        for i in range(len(self.nodes)):
+            self.executor.submit(self._check_head, i)
+
+    def _request_node(self, i: int, method: str, path: str, **kwargs) -> requests.Response:
+        started_at = monotonic()
+        try:
+            res = self.nodes[i].request(method, path, **kwargs)
+        except (RpcError, requests.exceptions.RequestException) as e:
+            if self._is_failure(e):
+                self._update_health(i)
+            else:
+                # NOTE: node is alive and has responded with a client error
+                self._update_health(i, monotonic() - started_at)
+            raise
+        self._update_health(i, monotonic() - started_at)
+        return res
+
+    def _request_hedged(self, primary: int, backup: int, method: str, path: str, **kwargs) -> requests.Response:
+        pending = {self.executor.submit(self._request_node, primary, method, path, **kwargs)}
+        done, _ = wait(pending, timeout=self.hedge_after)
+        if not done:
+            logger.debug('Hedging %s %s to %s', method, path, self.uri[backup])
+            pending.add(self.executor.submit(self._request_node, backup, method, path, **kwargs))
+
+        error: Optional[Exception] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self._is_failure(future.exception()):
+                    error = future.exception()
+                else:
+                    return future.result()
+        assert error
+        raise error
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        self._maybe_check_heads()
+        order = self.rank()
+        if method not in IDEMPOTENT_METHODS or kwargs.get('stream'):
+            return self._request_node(order[0], method, path, **kwargs)
+
+        error: Optional[Exception] = None
+        for n, i in enumerate(order):
+            try:
+                if self.hedge_after is not None and method == 'GET' and n + 1 < len(order):
+                    return self._request_hedged(i, order[n + 1], method, path, **dict(kwargs))
+                return self._request_node(i, method, path, **dict(kwargs))
+            except (RpcError, requests.exceptions.RequestException) as e:
+                if not self._is_failure(e):
+                    raise
+                logger.info('Node %s has failed to respond: %s', self.uri[i], e)
+                error = e
+        assert error
+        raise error
@@ -1,13 +1,19 @@
 from os.path import dirname
+from typing import List
+from typing import Optional
+from typing import Union
 
 from pymavryk.jupyter import InlineDocstring
+from pymavryk.jupyter import LazyDocstring
 from pymavryk.jupyter import get_attr_docstring
 from pymavryk.jupyter import get_class_docstring
-from pymavryk.rpc.docs import rpc_docs
 from pymavryk.rpc.node import RpcNode
 
 
 def format_docstring(class_type, query_path):
+    # NOTE: RPC docs are quite heavy, load them on demand
+    from pymavryk.rpc.docs import rpc_docs
+
     res = ['']
     methods = {
         'GET': '()',
@@ -58,10 +64,15 @@ def format_docstring(class_type, query_path):
 
 class RpcQuery(metaclass=InlineDocstring):
     __extensions__ = {}  # type: ignore
+    __doc__ = LazyDocstring(None)  # type: ignore
 
     @classmethod
-    def __init_subclass__(cls, path: str = '', **kwargs):
+    def __init_subclass__(cls, path: Optional[Union[str, List[str]]] = '', **kwargs):
         super().__init_subclass__(**kwargs)  # type: ignore
+        if not isinstance(cls.__dict__.get('__doc__'), LazyDocstring):
+            cls.__doc__ = LazyDocstring(cls.__dict__.get('__doc__'))  # type: ignore
+        if path is None:
+            return
         if isinstance(path, list):
             for sub_path in path:
                 cls.__extensions__[sub_path] = cls
@@ -73,7 +84,6 @@ class RpcQuery(metaclass=InlineDocstring):
         self._wild_path = path
         self._timeout = timeout
         self._params = params or []
-        self.__doc__ = format_docstring(self.__class__, self._wild_path or '/')
 
     def __repr__(self):
         res = [
@@ -85,6 +95,9 @@ class RpcQuery(metaclass=InlineDocstring):
         ]
         return '\n'.join(res)
 
+    def _pydoc(self) -> str:
+        return format_docstring(self.__class__, self._wild_path or '/')
+
     def _spawn_query(self, wild_path, params):
         child_class = self.__extensions__.get(wild_path, RpcQuery)
         return child_class(
@@ -0,0 +1,141 @@
+from threading import Lock
+from time import sleep
+from typing import Dict
+from unittest import TestCase
+from unittest.mock import patch
+
+from pymavryk import ContractInterface
+from pymavryk import MichelsonRuntimeError
+from pymavryk.context.impl import ExecutionContext
+from pymavryk.michelson.forge import forge_script_expr
+from pymavryk.michelson.types import NatType
+from pymavryk.rpc import RpcNode
+from pymavryk.rpc import ShellQuery
+from pymavryk.rpc.errors import RpcError
+from tests.unit_tests.test_rpc import make_response
+
+code = """
+parameter unit;
+storage (big_map nat nat);
+code { CDR ; NIL operation ; PAIR }
+"""
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+
+
+class BigMapGetManyTest(TestCase):
+    def test_get_many(self):
+        balances = {forge_script_expr(NatType.from_value(i).pack(legacy=True)): i * 100 for i in range(0, 50, 2)}
+
+        def request(method, url, **kwargs):
+            self.assertEqual('GET', method)
+            self.assertIn(f'/chains/main/blocks/{block_hash}/context/big_maps/42/', url)
+            key_hash = url.split('/')[-1]
+            if key_hash in balances:
+                return make_response(200, {'int': str(balances[key_hash])})
+            return make_response(404, [])
+
+        node = RpcNode('https://rpc.example.com')
+        context = ExecutionContext(shell=ShellQuery(node))
+        ci = ContractInterface.from_michelson(code, context=context).using(block_id=block_hash)
+        ci.storage_from_michelson('42')
+
+        keys = list(range(50)) + [0]
+        with patch.object(node.session, 'request', side_effect=request) as mock:
+            values = ci.storage.get_many(keys)
+        self.assertEqual([i * 100 if i % 2 == 0 else None for i in keys], values)
+        self.assertEqual(50, mock.call_count)
+
+    def test_get_many_error(self):
+        def request(method, url, **kwargs):
+            if url.endswith('/chains/main/blocks/head/hash'):
+                return make_response(200, block_hash)
+            return make_response(503, [])
+
+        node = RpcNode('https://rpc.example.com', retries=0)
+        context = ExecutionContext(shell=ShellQuery(node))
+        ci = ContractInterface.from_michelson(code, context=context)
+        ci.storage_from_michelson('42')
+
+        with patch.object(node.session, 'request', side_effect=request), self.assertRaises(
+            MichelsonRuntimeError
+        ) as ctx:
+            ci.storage.get_many([1, 2])
+        self.assertIsInstance(ctx.exception.__cause__, RpcError)
+
+    def test_get_many_diff(self):
+        ci = ContractInterface.from_michelson(code)
+        ci.storage_from_michelson('{ Elt 1 10 ; Elt 2 20 }')
+        self.assertEqual([20, None, 10], ci.storage.get_many([2, 3, 1]))
+
+
+class BigMapIterTest(TestCase):
+    def setUp(self) -> None:
+        self.node = RpcNode('https://rpc.example.com', pool_size=4, retries=0)
+        context = ExecutionContext(shell=ShellQuery(self.node))
+        self.ci = ContractInterface.from_michelson(code, context=context).using(block_id=block_hash)
+        self.ci.storage_from_michelson('42')
+        self.values = {forge_script_expr(NatType.from_value(i).pack(legacy=True)): i for i in range(250)}
+        self.key_hashes = sorted(self.values)
+        self.status_codes: Dict[str, int] = {}
+        self.active, self.max_active = 0, 0
+        self.lock = Lock()
+
+    def request(self, method, url, params=None, **kwargs):
+        if url.endswith('/context/big_maps/42'):
+            offset, length = params['offset'], params['length']
+            page = self.key_hashes[offset : offset + length]
+            return make_response(200, [{'int': str(self.values[h])} for h in page])
+        if url.endswith('/context/raw/json/big_maps/index/42/contents'):
+            return make_response(200, list(reversed(self.key_hashes)))
+        key_hash = url.split('/')[-1]
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        sleep(0.001)
+        with self.lock:
+            self.active -= 1
+        if key_hash in self.status_codes:
+            return make_response(self.status_codes[key_hash], [])
+        return make_response(200, {'int': str(self.values[key_hash])})
+
+    def test_iter_values(self):
+        with patch.object(self.node.session, 'request', side_effect=self.request):
+            values = list(self.ci.storage.iter_values(page_size=40))
+            self.assertEqual([self.values[h] for h in self.key_hashes], values)
+
+            resumed = list(self.ci.storage.iter_values(offset=230, page_size=40))
+            self.assertEqual(values[230:], resumed)
+
+    def test_iter_values_early_stop(self):
+        with patch.object(self.node.session, 'request', side_effect=self.request) as mock:
+            gen = self.ci.storage.iter_values(page_size=10)
+            self.assertEqual(5, len([next(gen) for _ in range(5)]))
+            gen.close()
+        self.assertLessEqual(mock.call_count, 4)
+
+    def test_iter_items(self):
+        with patch.object(self.node.session, 'request', side_effect=self.request):
+            items = list(self.ci.storage.iter_items(offset=200, page_size=16))
+        self.assertEqual([(h, self.values[h]) for h in self.key_hashes[200:]], items)
+        self.assertEqual(self.key_hashes[0], self.ci.storage.get_key_hash(self.values[self.key_hashes[0]]))
+
+    def test_iter_items_concurrency(self):
+        with patch.object(self.node.session, 'request', side_effect=self.request):
+            items = list(self.ci.storage.iter_items(page_size=5))
+        self.assertEqual(len(self.key_hashes), len(items))
+        self.assertLessEqual(self.max_active, self.node.pool_size)
+
+    def test_iter_items_missing_key(self):
+        self.status_codes[self.key_hashes[5]] = 404
+        with patch.object(self.node.session, 'request', side_effect=self.request):
+            items = list(self.ci.storage.iter_items(page_size=4))
+        self.assertEqual(len(self.key_hashes), len(items))
+        self.assertEqual((self.key_hashes[5], None), items[5])
+        self.assertEqual((self.key_hashes[6], self.values[self.key_hashes[6]]), items[6])
+
+    def test_iter_items_error(self):
+        self.status_codes[self.key_hashes[5]] = 503
+        with patch.object(self.node.session, 'request', side_effect=self.request):
+            gen = self.ci.storage.iter_items(page_size=4)
+            with self.assertRaises(RpcError):
+                list(gen)
@@ -4,7 +4,12 @@ from unittest import TestCase
 
 from pymavryk import ContractInterface
 from pymavryk import Unit
+from pymavryk.context.impl import ExecutionContext
 from pymavryk.jupyter import is_interactive
+from pymavryk.michelson.format import micheline_to_michelson
+from pymavryk.michelson.parse import michelson_to_micheline
+
+constant_hash = 'exprtzVP3Cr6pMwZW2ZK4Xi6G2Gv5DHRSKVUhNPMmx8hKUBbL5JLr7'
 
 
 class TestInterfaces(TestCase):
@@ -34,6 +39,11 @@ class TestInterfaces(TestCase):
         )
         self.assertEqual(3, res.storage['balances'][alice])
 
+    def test_interpret_without_trace(self):
+        counter = ContractInterface.from_file(join(dirname(__file__), 'contracts', 'macro_counter.tz'))
+        res = counter.increaseCounterBy(5).interpret(storage=1, trace=False)
+        self.assertEqual(res.storage, 6)
+
     def test_increment_decrement(self):
         counter = ContractInterface.from_file(join(dirname(__file__), 'contracts', 'macro_counter.tz'))
         res = counter.increaseCounterBy(5).interpret(storage=0)
@@ -65,3 +75,35 @@ class TestInterfaces(TestCase):
     def test_or_entry(self):
         ci = ContractInterface.from_file(join(dirname(__file__), 'contracts', 'or_entry.tz'))
         ci.collect(collectRequest={'swap_id': 0, 'token_amount': 0})
+
+    def test_program_cache(self):
+        path = join(dirname(__file__), 'contracts', 'token.tz')
+        ci = ContractInterface.from_file(path)
+        other = ContractInterface.from_file(path)
+        self.assertIs(type(ci), type(other))
+        self.assertIs(ci.program, other.program)
+        self.assertIs(ci.entrypoints, other.entrypoints)
+        self.assertIsNot(ci.mint, other.mint)
+        self.assertNotIn('__doc__', ci.mint.__dict__)
+        self.assertIn('mintOwner', ci.mint.__doc__)
+        self.assertIs(ci.mint.__doc__, other.mint.__doc__)
+        self.assertIs(type(ci), type(ci.using(block_id=1)))
+
+    def test_program_cache_global_constants(self):
+        code = michelson_to_micheline(
+            f'parameter unit; storage int; code {{ CDR ; constant "{constant_hash}" ; NIL operation ; PAIR }}'
+        )
+        programs = []
+        for value in [1, 2]:
+            global_constants = {constant_hash: michelson_to_micheline(f'{{ PUSH int {value} ; ADD }}')}
+            ci = ContractInterface.from_context(
+                ExecutionContext(script={'code': code}, global_constants=global_constants)
+            )
+            programs.append(micheline_to_michelson(ci.program.code.as_micheline_expr()))
+        self.assertEqual(
+            [
+                'code { CDR ; { PUSH int 1 ; ADD } ; NIL operation ; PAIR }',
+                'code { CDR ; { PUSH int 2 ; ADD } ; NIL operation ; PAIR }',
+            ],
+            programs,
+        )
@@ -1,8 +1,13 @@
 from typing import List
 from unittest import TestCase
 
+from parameterized import parameterized  # type: ignore
+
 from pymavryk.crypto.hash import block_payload_hash
 from pymavryk.crypto.hash import operation_list_list_hash
+from pymavryk.crypto.keccak import Keccak256
+from pymavryk.crypto.keccak import KeccakHash
+from pymavryk.crypto.keccak import keccak256_backends
 
 # https://rpc.tzkt.io/mainnet/chains/main/blocks/2223648
 operation_hashes_llo = 'LLoaQ8vjCwYooVy6nRSUP9VRBk1YHaHgqWrHw3J9j4VmEvVZCbaYB'
@@ -112,3 +117,35 @@ class TestHashes(TestCase):
             operation_hashes=operation_hashes_1,
         )
         self.assertEqual(block_payload_hash_1, res)
+
+    @parameterized.expand(
+        [
+            (b'', 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'),
+            (b'abc', '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'),
+        ]
+    )
+    def test_keccak256(self, data, expected):
+        for keccak256 in keccak256_backends.values():
+            self.assertEqual(expected, keccak256(data).hex())
+        self.assertEqual(expected.encode(), Keccak256(data).hexdigest())
+
+    def test_keccak256_conformance(self):
+        reference = KeccakHash.preset(1088, 512, 256)
+        for size in [1, 135, 136, 137, 272, 1000]:
+            data = bytes(i % 251 for i in range(size))
+            expected = reference(data).digest()
+            for name, keccak256 in keccak256_backends.items():
+                self.assertEqual(expected, keccak256(data), f'{name}: {size}')
+
+            for backend in keccak256_backends:
+                h = Keccak256(data[:100], backend=backend)
+                self.assertEqual(reference(data[:100]).digest(), h.digest(), backend)
+                h.update(data[100:200])
+                h.update(data[200:])
+                self.assertEqual(expected, h.digest(), backend)
+
+            h = Keccak256(data[:100], backend='python')
+            prefix = h.copy()
+            h.update(data[100:])
+            self.assertEqual(expected, h.digest())
+            self.assertEqual(reference(data[:100]).digest(), prefix.digest())
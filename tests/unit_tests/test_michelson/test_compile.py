@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from pymavryk.context.impl import ExecutionContext
+from pymavryk.michelson.instructions.base import TypeDispatchTable
+from pymavryk.michelson.instructions.base import dispatch_types
+from pymavryk.michelson.instructions.stack import PushInstruction
+from pymavryk.michelson.micheline import Micheline
+from pymavryk.michelson.parse import michelson_to_micheline
+from pymavryk.michelson.program import MichelsonProgram
+from pymavryk.michelson.repl import Interpreter
+from pymavryk.michelson.types import IntType
+from pymavryk.michelson.types import NatType
+from pymavryk.michelson.types import OptionType
+
+script = michelson_to_micheline('''
+    parameter nat;
+    storage (list nat);
+    code { UNPAIR; PUSH nat 10; ADD; CONS; NIL operation; PAIR }
+    ''')
+
+
+class CompileTest(TestCase):
+    def test_push_value_precomputed(self):
+        program = MichelsonProgram.load(ExecutionContext(script={'code': script}), with_code=True)
+        push = program.code.args[0].args[1]
+        self.assertTrue(issubclass(push, PushInstruction))
+        self.assertEqual(NatType(10), push.value)
+
+    def test_compiled_execution_is_repeatable(self):
+        for _ in range(2):
+            _, storage, _, _, error = Interpreter.run_code(
+                parameter={'int': '1'},
+                storage=[{'int': '2'}],
+                script=script,
+            )
+            self.assertIsNone(error)
+            self.assertEqual([{'int': '11'}, {'int': '2'}], storage)
+
+    def test_push_error_deferred(self):
+        ty = Micheline.match({'prim': 'PUSH', 'args': [{'prim': 'int'}, {'string': 'foo'}]})
+        ty.compile()
+        self.assertIsNone(ty.value)
+
+    def test_dispatch_table(self):
+        table = TypeDispatchTable({(IntType, NatType): (IntType,)})
+        self.assertEqual((IntType,), dispatch_types(IntType, NatType, mapping=table))
+        self.assertEqual((IntType,), dispatch_types(IntType, NatType, mapping={(IntType, NatType): (IntType,)}))
+        some_int = OptionType.create_type(args=[IntType])
+        with self.assertRaises(AssertionError):
+            dispatch_types(some_int, NatType, mapping=table)
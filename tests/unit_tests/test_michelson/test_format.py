@@ -0,0 +1,71 @@
+from glob import glob
+from io import StringIO
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pymavryk.michelson.format import MichelsonFormatterError
+from pymavryk.michelson.format import micheline_to_michelson
+from pymavryk.michelson.format import write_michelson
+from pymavryk.michelson.parse import michelson_to_micheline
+
+contracts_dir = join(dirname(dirname(__file__)), 'test_contract', 'contracts')
+
+
+class TestFormat(TestCase):
+    def test_contracts(self):
+        for filename in glob(join(contracts_dir, '*.tz')):
+            with open(filename) as f:
+                expr = michelson_to_micheline(f.read())
+            for kwargs in [{}, {'inline': True}, {'compact': True}]:
+                source = micheline_to_michelson(expr, **kwargs)
+                self.assertEqual(expr, michelson_to_micheline(source), filename)
+                stream = StringIO()
+                write_michelson(expr, stream, **kwargs)
+                self.assertEqual(source, stream.getvalue())
+
+    @parameterized.expand(
+        [
+            ('{}', '{}', '{}'),
+            ('{ DROP ; UNIT }', '{ DROP ; UNIT }', '{DROP;UNIT}'),
+            ('Pair 1 (Some "a")', 'Pair 1 (Some "a")', 'Pair 1 (Some "a")'),
+            (
+                'parameter unit ; storage (pair %s nat (option %o int)) ; code { CDR ; NIL operation ; PAIR }',
+                'parameter unit; storage (pair %s nat (option %o int)); code { CDR ; NIL operation ; PAIR }',
+                'parameter unit;storage (pair %s nat (option %o int));code {CDR;NIL operation;PAIR}',
+            ),
+            (
+                'IF_LEFT { DIP { DROP } } { PUSH bytes 0x00 }',
+                'IF_LEFT { DIP { DROP } } { PUSH bytes 0x00 }',
+                'IF_LEFT {DIP {DROP}} {PUSH bytes 0x00}',
+            ),
+        ]
+    )
+    def test_format(self, source, expected, compact):
+        expr = michelson_to_micheline(source)
+        self.assertEqual(expected, micheline_to_michelson(expr))
+        self.assertEqual(compact, micheline_to_michelson(expr, compact=True))
+
+    def test_line_breaks(self):
+        expr = [{'prim': 'PUSH', 'args': [{'prim': 'string'}, {'string': 'x' * 40}]}] * 3
+        push = f'PUSH string "{"x" * 40}"'
+        expected = f'{{ {push} ;\n  {push} ;\n  {push} }}'
+        self.assertEqual(expected, micheline_to_michelson(expr))
+
+    def test_deep_nesting(self):
+        expr = [{'prim': 'UNIT'}]
+        for _ in range(200):
+            expr = [{'prim': 'DUP'}, {'prim': 'IF', 'args': [expr, []]}]
+        source = micheline_to_michelson(expr)
+        self.assertEqual(expr, michelson_to_micheline(source))
+
+    def test_wrap(self):
+        expr = {'prim': 'Left', 'args': [{'int': '1'}]}
+        self.assertEqual('(Left 1)', micheline_to_michelson(expr, wrap=True))
+        self.assertEqual('Left 1', micheline_to_michelson(expr))
+
+    def test_invalid(self):
+        with self.assertRaises(MichelsonFormatterError):
+            micheline_to_michelson({'prim': 'PAIR', 'args': [{'int': 1}, {'int': 2}]})
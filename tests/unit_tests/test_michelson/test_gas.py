@@ -0,0 +1,67 @@
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from pymavryk.contract.interface import ContractInterface
+from pymavryk.michelson.gas import GasMeter
+from pymavryk.michelson.gas import value_size
+from pymavryk.michelson.micheline import MichelsonRuntimeError
+from pymavryk.michelson.parse import michelson_to_micheline
+from pymavryk.michelson.repl import Interpreter
+from pymavryk.michelson.types import IntType
+from pymavryk.michelson.types import ListType
+from pymavryk.michelson.types import PairType
+from pymavryk.michelson.types import StringType
+
+script = michelson_to_micheline('''
+    parameter nat;
+    storage nat;
+    code { UNPAIR; DUP; PUSH nat 0; COMPARE; LT;
+           LOOP { PUSH nat 1; SWAP; SUB; ABS; DIP { PUSH nat 1; ADD }; DUP; PUSH nat 0; COMPARE; LT };
+           DROP; NIL operation; PAIR }
+    ''')
+
+
+class GasMeterTest(TestCase):
+    def run_code(self, parameter: int, gas_meter: GasMeter):
+        return Interpreter.run_code(
+            parameter={'int': str(parameter)},
+            storage={'int': '0'},
+            script=script,
+            trace=False,
+            gas_meter=gas_meter,
+        )
+
+    def test_consumed_gas_grows_with_iterations(self):
+        small, large = GasMeter(), GasMeter()
+        self.assertIsNone(self.run_code(1, small)[4])
+        self.assertIsNone(self.run_code(10, large)[4])
+        self.assertGreater(small.consumed_gas, 100)
+        self.assertGreater(large.consumed_milligas, small.consumed_milligas)
+
+    def test_gas_limit(self):
+        meter = GasMeter()
+        self.run_code(10, meter)
+        _, storage, _, _, error = self.run_code(10, GasMeter(limit=meter.consumed_gas - 1))
+        self.assertIsInstance(error, MichelsonRuntimeError)
+        self.assertIn('gas exhausted', str(error))
+        self.assertIsNone(storage)
+        _, storage, _, _, error = self.run_code(10, GasMeter(limit=meter.consumed_gas))
+        self.assertIsNone(error)
+        self.assertEqual({'int': '10'}, storage)
+
+    def test_value_size(self):
+        self.assertEqual(2, value_size(IntType(-256)))
+        self.assertEqual(3, value_size(StringType('foo')))
+        self.assertEqual(3, value_size(ListType.from_items([IntType(1), IntType(2), IntType(3)])))
+        self.assertEqual(4, value_size(PairType.from_comb([IntType(1), StringType('foo')])))
+
+    def test_interpret_consumed_gas(self):
+        counter = ContractInterface.from_file(
+            join(dirname(__file__), '..', 'test_contract', 'contracts', 'macro_counter.tz')
+        )
+        meter = GasMeter()
+        res = counter.increaseCounterBy(5).interpret(storage=1, gas_meter=meter)
+        self.assertEqual(6, res.storage)
+        self.assertGreater(meter.consumed_gas, 100)
+        self.assertFalse(hasattr(res, 'estimated_gas'))
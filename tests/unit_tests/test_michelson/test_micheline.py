@@ -4,8 +4,13 @@ from parameterized import parameterized  # type: ignore
 
 from pymavryk.michelson.forge import forge_micheline
 from pymavryk.michelson.forge import forge_script_expr
+from pymavryk.michelson.forge import iter_unforge_micheline
+from pymavryk.michelson.forge import unforge_address
 from pymavryk.michelson.forge import unforge_micheline
+from pymavryk.michelson.micheline import Micheline
 from pymavryk.michelson.micheline import blind_unpack
+from pymavryk.michelson.micheline import type_cache
+from pymavryk.michelson.parse import michelson_to_micheline
 from pymavryk.michelson.types.base import MichelsonType
 from pymavryk.operation.forge import forge_operation_group
 
@@ -185,3 +190,79 @@ class TestPacking(TestCase):
         self.assertListEqual(result, expected_result)
 
         self.assertListEqual(expected_result, unforge_micheline(forge_micheline(expected_result)))
+
+    @parameterized.expand(
+        [
+            (
+                'pair (option (or nat bytes)) (list timestamp) address key_hash bool unit',
+                'Pair (Some (Right 0xbeef)) {1; 2} "KT1BEqzn5Wx8uJrZNvuS9DVHmLvG9td3fDLi%foo" "mv1BSa64fX1MaY4f4B5JaShtftiwbjAfr2ko" True Unit',
+            ),
+            ('pair int nat string', 'Pair -1 2 "3"'),
+            (
+                'option (pair key chain_id)',
+                'Some (Pair "edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav" "NetXdQprcVkpaWU")',
+            ),
+        ]
+    )
+    def test_forge_value(self, type_expr, val_expr):
+        ty = MichelsonType.match(michelson_to_micheline(type_expr))
+        value = ty.from_micheline_value(michelson_to_micheline(val_expr))
+        for mode in ['readable', 'optimized', 'legacy_optimized']:
+            expected = forge_micheline(value.to_micheline_value(mode=mode))
+            self.assertEqual(expected, value.forge(mode=mode))
+        self.assertEqual(value, ty.unpack(value.pack()))
+
+    def test_unforge_memoryview(self):
+        expr = [{'prim': 'Pair', 'args': [{'int': '-42'}, {'string': 'abc'}], 'annots': ['%x']}, {'bytes': 'cafe'}]
+        data = b'\x05' + forge_micheline(expr)
+        self.assertEqual(expr, unforge_micheline(memoryview(data)[1:]))
+        address = bytes.fromhex('000025a63145dba82ce3935324407fe36d791ea6206a')
+        self.assertEqual(unforge_address(address), unforge_address(memoryview(address)))
+
+    def test_iter_unforge_micheline(self):
+        exprs = [{'int': '1'}, [], {'prim': 'Unit'}, {'string': 'end'}]
+        data = b''.join(map(forge_micheline, exprs))
+        self.assertEqual(exprs, list(iter_unforge_micheline(data)))
+        self.assertEqual(exprs[1:], list(iter_unforge_micheline(data, offset=2)))
+        with self.assertRaises(AssertionError):
+            list(iter_unforge_micheline(data + b'\x0b'))
+
+
+class TypeCacheTest(TestCase):
+    def setUp(self):
+        self.addCleanup(type_cache.resize, type_cache.max_size)
+        type_cache.clear()
+
+    def test_identical_subtrees_share_class(self):
+        expr = {
+            'prim': 'pair',
+            'args': [
+                {'prim': 'map', 'args': [{'prim': 'address'}, {'prim': 'nat'}], 'annots': ['%a']},
+                {'prim': 'map', 'args': [{'prim': 'address'}, {'prim': 'nat'}], 'annots': ['%b']},
+            ],
+        }
+        ty = MichelsonType.match(expr)
+        self.assertIs(ty, MichelsonType.match(expr))
+        self.assertIs(ty.args[0].args[0], ty.args[1].args[0])
+        self.assertIsNot(ty.args[0], ty.args[1])
+        self.assertEqual('a', ty.args[0].field_name)
+        self.assertEqual('b', ty.args[1].field_name)
+        self.assertGreater(type_cache.hits, 0)
+
+    def test_literals_distinguished_by_type(self):
+        self.assertIsNot(Micheline.match({'int': '1'}), Micheline.match({'string': '1'}))
+        self.assertEqual(1, Micheline.match({'int': '1'}).literal)
+
+    def test_bounded_size(self):
+        type_cache.resize(2)
+        for i in range(10):
+            Micheline.match({'int': str(i)})
+        self.assertEqual(2, len(type_cache))
+        type_cache.resize(0)
+        self.assertIsNot(Micheline.match({'int': '42'}), Micheline.match({'int': '42'}))
+
+    def test_clear(self):
+        ty = MichelsonType.match({'prim': 'nat'})
+        type_cache.clear()
+        self.assertEqual(0, len(type_cache))
+        self.assertIsNot(ty, MichelsonType.match({'prim': 'nat'}))
@@ -1,8 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from os.path import dirname
+from os.path import join
 from unittest import TestCase
 
+from parameterized import parameterized  # type: ignore
+
+from pymavryk.michelson.macros import expand_macro
+from pymavryk.michelson.macros import macro_cache_info
+from pymavryk.michelson.macros import match_macro
+from pymavryk.michelson.macros import seq
 from pymavryk.michelson.parse import MichelsonParser
+from pymavryk.michelson.parse import MichelsonParserError
+from pymavryk.michelson.parse import doc
+from pymavryk.michelson.parse import get_default_parser
+from pymavryk.michelson.parse import michelson_to_micheline
 from pymavryk.michelson.types import TimestampType
 
+contracts_dir = join(dirname(dirname(__file__)), 'test_contract', 'contracts')
+
+
+def shape(expr):
+    if isinstance(expr, list):
+        return type(expr).__name__, [shape(x) for x in expr]
+    if isinstance(expr, dict):
+        return {k: shape(v) for k, v in expr.items()}
+    return expr
+
 
 class TestParsing(TestCase):
     def test_wrapped_expr(self):
@@ -16,3 +40,85 @@ class TestParsing(TestCase):
     def test_timestamp_with_millis(self):
         res = TimestampType.from_micheline_value({'string': '2021-01-06T14:57:27.821Z'})
         self.assertEqual(1609945047, int(res))
+
+    @parameterized.expand(
+        [
+            ('',),
+            (';',),
+            ('{ {} ; UNIT } ;',),
+            ('PUSH (pair int nat) (Pair -1 2) ; DIP 2 { DROP } # comment',),
+            ('CAR @x {UNIT; {}} {} (CDR @a) /* comment */',),
+            ('{ Elt "a\\"b" 0x ; Elt "" 0xAB }',),
+            ('DUUP ; ASSERT_CMPEQ ; MAP_CDR { UNIT } ; PAPAIR',),
+        ]
+    )
+    def test_fast_parser(self, code):
+        expected = MichelsonParser(fast=False).parse(code)
+        self.assertEqual(shape(expected), shape(MichelsonParser().parse(code)))
+
+    @parameterized.expand([('1 2',), ('PUSH int )',), ('a',), ('CAR @x 1 @y',), ('UNKNOWN',)])
+    def test_fast_parser_errors(self, code):
+        with self.assertRaises(MichelsonParserError) as ctx:
+            MichelsonParser(fast=False).parse(code)
+        with self.assertRaises(MichelsonParserError) as fast_ctx:
+            MichelsonParser().parse(code)
+        self.assertEqual(ctx.exception.format_stdout(), fast_ctx.exception.format_stdout())
+
+    def test_fast_parser_contracts(self):
+        slow, fast = MichelsonParser(fast=False), MichelsonParser()
+        for filename in glob(join(contracts_dir, '*.tz')):
+            with open(filename) as f:
+                source = f.read()
+            self.assertEqual(shape(slow.parse(source)), shape(fast.parse(source)), filename)
+
+    def test_custom_grammar(self):
+        class CustomParser(MichelsonParser):
+            start = 'instr'
+
+            @doc('arg : INT')
+            def p_arg_int(self, p):
+                p[0] = {'int': str(int(p[1]) + 1)}
+
+        self.assertTrue(MichelsonParser().fast)
+        self.assertFalse(CustomParser().fast)
+        self.assertEqual({'prim': 'PUSH', 'args': [{'prim': 'int'}, {'int': '2'}]}, CustomParser().parse('PUSH int 1'))
+
+    def test_default_parser_per_thread(self):
+        self.assertIs(get_default_parser(), get_default_parser())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda i: michelson_to_micheline(f'PUSH nat {i}'), range(100)))
+            parsers = set(executor.map(lambda _: id(get_default_parser()), range(4)))
+        self.assertEqual([{'prim': 'PUSH', 'args': [{'prim': 'nat'}, {'int': str(i)}]} for i in range(100)], results)
+        self.assertNotIn(id(get_default_parser()), parsers)
+
+    @parameterized.expand(
+        [
+            ('PAPPAIIR', ['%a', '%b', '%c', '%d', '@p'], []),
+            ('UNPAPAIR', [], []),
+            ('CDADDR', [], []),
+            ('SET_CADR', ['%x'], []),
+            ('MAP_CDADR', ['%y'], [[{'prim': 'DROP'}]]),
+            ('DIIIP', [], [[{'prim': 'DROP'}]]),
+            ('IF_SOME', [], [[{'prim': 'DROP'}], []]),
+            ('ASSERT_CMPLE', [], []),
+        ]
+    )
+    def test_macro_cache(self, prim, annots, args):
+        handler, group = match_macro(prim)
+        expected = seq(handler(group, annots, args))
+        hits = macro_cache_info().hits
+        first = expand_macro(prim, annots, args)
+        second = expand_macro(prim, annots, args)
+        self.assertEqual(expected, first)
+        self.assertEqual(expected, second)
+        self.assertIsNot(first, second)
+        self.assertLess(hits, macro_cache_info().hits)
+
+        other_args = [[{'prim': 'UNIT'}] for _ in args]
+        self.assertEqual(seq(handler(group, annots, other_args)), expand_macro(prim, annots, other_args))
+
+    def test_macro_errors(self):
+        self.assertIsNone(match_macro('DUP_'))
+        for _ in range(2):
+            with self.assertRaises(AssertionError):
+                expand_macro('DIIP', [], [])
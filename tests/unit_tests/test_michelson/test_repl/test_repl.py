@@ -1,9 +1,12 @@
+import pickle
 from unittest.case import TestCase
 from unittest.case import skip
 
 from pymavryk import MichelsonRuntimeError
+from pymavryk.michelson.gas import GasMeter
 from pymavryk.michelson.instructions import CommitInstruction
 from pymavryk.michelson.repl import Interpreter
+from pymavryk.michelson.repl import _portable_error
 from pymavryk.michelson.types import BigMapType
 from pymavryk.michelson.types import IntType
 from pymavryk.michelson.types import ListType
@@ -33,6 +36,101 @@ class InterpreterTest(TestCase):
         )
         self.assertEqual([PairType((IntType(2), IntType(1)))], interpreter.stack.items)
 
+    def test_run_code_without_trace(self) -> None:
+        script = [
+            {'prim': 'parameter', 'args': [{'prim': 'int'}]},
+            {'prim': 'storage', 'args': [{'prim': 'int'}]},
+            {
+                'prim': 'code',
+                'args': [
+                    [
+                        {'prim': 'UNPAIR'},
+                        {'prim': 'ADD'},
+                        {'prim': 'NIL', 'args': [{'prim': 'operation'}]},
+                        {'prim': 'PAIR'},
+                    ]
+                ],
+            },
+        ]
+        _, storage, _, stdout, error = Interpreter.run_code(parameter={'int': '1'}, storage={'int': '2'}, script=script)
+        self.assertIsNone(error)
+        self.assertEqual({'int': '3'}, storage)
+        self.assertIn('ADD / 1 : 2 => 3', stdout)
+
+        _, storage, _, stdout, error = Interpreter.run_code(
+            parameter={'int': '1'},
+            storage={'int': '2'},
+            script=script,
+            trace=False,
+        )
+        self.assertIsNone(error)
+        self.assertEqual({'int': '3'}, storage)
+        self.assertEqual([], stdout)
+
+    def test_run_batch(self) -> None:
+        script = [
+            {'prim': 'parameter', 'args': [{'prim': 'int'}]},
+            {'prim': 'storage', 'args': [{'prim': 'int'}]},
+            {
+                'prim': 'code',
+                'args': [
+                    [
+                        {'prim': 'UNPAIR'},
+                        {'prim': 'DUP'},
+                        {'prim': 'GT'},
+                        {'prim': 'IF', 'args': [[{'prim': 'ADD'}], [{'prim': 'FAILWITH'}]]},
+                        {'prim': 'NIL', 'args': [{'prim': 'operation'}]},
+                        {'prim': 'PAIR'},
+                    ]
+                ],
+            },
+        ]
+        calls = [('default', {'int': str(i)}, {'int': '10'}) for i in range(-1, 20)]
+        results = Interpreter.run_batch(script, calls, max_workers=2)
+        self.assertEqual(len(calls), len(results))
+        self.assertIsInstance(results[0][3], MichelsonRuntimeError)
+        self.assertIsInstance(results[1][3], MichelsonRuntimeError)
+        for i, (operations, storage, _lazy_diff, error) in enumerate(results[2:], start=1):
+            self.assertIsNone(error)
+            self.assertEqual([], operations)
+            self.assertEqual({'int': str(10 + i)}, storage)
+
+    def test_run_batch_overrides(self) -> None:
+        script = [
+            {'prim': 'parameter', 'args': [{'prim': 'unit'}]},
+            {'prim': 'storage', 'args': [{'prim': 'mumav'}]},
+            {
+                'prim': 'code',
+                'args': [
+                    [
+                        {'prim': 'DROP'},
+                        {'prim': 'BALANCE'},
+                        {'prim': 'NIL', 'args': [{'prim': 'operation'}]},
+                        {'prim': 'PAIR'},
+                    ]
+                ],
+            },
+        ]
+        calls = [
+            ('default', {'prim': 'Unit'}, {'int': '0'}),
+            ('default', {'prim': 'Unit'}, {'int': '0'}, {'balance': 5, 'trace': True}),
+            ('default', {'prim': 'Unit'}, {'int': '0'}, {'unknown_option': 1}),
+        ]
+        results = Interpreter.run_batch(script, calls, max_workers=1, balance=1)
+        self.assertEqual([{'int': '1'}, {'int': '5'}, None], [res[1] for res in results])
+        self.assertIsNone(results[1][3])
+        self.assertIsInstance(results[2][3], MichelsonRuntimeError)
+        self.assertEqual('TypeError', results[2][3].args[0])
+
+        with self.assertRaises(ValueError):
+            Interpreter.run_batch(script, calls, gas_meter=GasMeter())
+        with self.assertRaises(ValueError):
+            Interpreter.run_batch(script, [('default', {'prim': 'Unit'}, {'int': '0'}, {'gas_meter': GasMeter()})])
+
+    def test_batch_error_is_picklable(self) -> None:
+        error = _portable_error(ValueError('bad value', lambda: None))
+        self.assertEqual(['ValueError', 'bad value'], list(pickle.loads(pickle.dumps(error)).args[:2]))
+
     def test_execute_rollback(self) -> None:
         # Arrange
         interpreter = Interpreter()
@@ -55,6 +153,20 @@ class InterpreterTest(TestCase):
         )
         self.assertEqual([PairType((IntType(2), IntType(1)))], interpreter.stack.items)
 
+    def test_execute_rollback_context(self) -> None:
+        # Arrange
+        interpreter = Interpreter()
+        interpreter.execute('PUSH int 1')
+        counter = interpreter.context.tmp_big_map_index
+
+        # Act
+        result = interpreter.execute('DROP; EMPTY_BIG_MAP int int; DUP; PAIR; FAILWITH')
+
+        # Assert
+        self.assertIsInstance(result.error, MichelsonRuntimeError)
+        self.assertEqual(counter, interpreter.context.tmp_big_map_index)
+        self.assertEqual([IntType(1)], interpreter.stack.items)
+
     def test_execute_contract(self) -> None:
         # Arrange
         interpreter = Interpreter()
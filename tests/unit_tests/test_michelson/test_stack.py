@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from pymavryk.michelson.micheline import MichelsonRuntimeError
+from pymavryk.michelson.stack import MichelsonStack
+from pymavryk.michelson.types import IntType
+
+
+def ints(*values):
+    return [IntType.from_value(x) for x in values]
+
+
+class MichelsonStackTest(TestCase):
+    def setUp(self):
+        self.stack = MichelsonStack.from_items(ints(1, 2, 3, 4))
+
+    def test_push_pop(self):
+        self.stack.push(IntType.from_value(0))
+        self.assertEqual(ints(0, 1, 2, 3, 4), self.stack.items)
+        self.assertEqual(IntType.from_value(0), self.stack.peek())
+        self.assertEqual(ints(0, 1), self.stack.pop(count=2))
+        self.assertEqual(IntType.from_value(2), self.stack.pop1())
+        self.assertEqual([], self.stack.pop(count=0))
+        self.assertEqual(2, len(self.stack))
+        with self.assertRaises(MichelsonRuntimeError):
+            self.stack.pop(count=3)
+
+    def test_protect_restore(self):
+        self.stack.protect(count=2)
+        self.assertEqual(2, self.stack.protected)
+        self.assertEqual(IntType.from_value(3), self.stack.peek())
+        self.stack.push(IntType.from_value(0))
+        self.assertEqual(ints(1, 2, 0, 3, 4), self.stack.items)
+        self.stack.protect(count=1)
+        self.assertEqual(ints(1, 2, 0, 3), self.stack.dump(4))
+        self.assertEqual(IntType.from_value(3), self.stack.pop1())
+        self.stack.restore(count=3)
+        self.assertEqual(0, self.stack.protected)
+        self.assertEqual(ints(1, 2, 0, 4), self.stack.items)
+        with self.assertRaises(MichelsonRuntimeError):
+            self.stack.restore(count=1)
+        with self.assertRaises(MichelsonRuntimeError):
+            self.stack.protect(count=5)
+
+    def test_dump(self):
+        self.assertEqual(ints(1, 2), self.stack.dump(2))
+        self.assertEqual(ints(1, 2, 3, 4), self.stack.dump(10))
+        self.stack.clear()
+        self.assertIsNone(self.stack.dump(1))
+        self.assertEqual('[]', repr(self.stack))
+
+    def test_snapshot_rollback(self):
+        self.stack.protect(count=1)
+        snapshot = self.stack.snapshot()
+        self.stack.pop(count=2)
+        self.stack.restore(count=1)
+        self.stack.push(IntType.from_value(0))
+        self.stack.rollback(snapshot)
+        self.assertEqual(1, self.stack.protected)
+        self.assertEqual(ints(1, 2, 3, 4), self.stack.items)
+        self.stack.clear()
+        self.stack.rollback(snapshot)
+        self.assertEqual(ints(1, 2, 3, 4), self.stack.items)
+
+    def test_items(self):
+        self.stack.protect(count=1)
+        self.stack.items[0] = IntType.from_value(0)
+        self.assertEqual(ints(1, 2, 3, 4), self.stack.items)
+        self.stack.items = ints(0, 1)
+        self.assertEqual(0, self.stack.protected)
+        self.assertEqual(IntType.from_value(0), self.stack.pop1())
@@ -0,0 +1,118 @@
+from glob import glob
+from io import StringIO
+from os.path import dirname
+from os.path import join
+from tempfile import TemporaryFile
+from unittest import TestCase
+
+import simplejson as json
+from parameterized import parameterized  # type: ignore
+
+from pymavryk.michelson.forge import forge_micheline
+from pymavryk.michelson.parse import MichelsonParserError
+from pymavryk.michelson.parse import michelson_to_micheline
+from pymavryk.michelson.stream import ForgeWriter
+from pymavryk.michelson.stream import JsonWriter
+from pymavryk.michelson.stream import iter_tokens
+from pymavryk.michelson.stream import michelson_to_micheline_stream
+
+contracts_dir = join(dirname(dirname(__file__)), 'test_contract', 'contracts')
+
+
+class PipeStream(StringIO):
+    def seekable(self) -> bool:
+        return False
+
+
+class TestStreamParsing(TestCase):
+    def test_contracts(self):
+        for filename in glob(join(contracts_dir, '*.tz')):
+            with open(filename) as f:
+                expected = michelson_to_micheline(f.read())
+            with open(filename) as f:
+                self.assertEqual(expected, michelson_to_micheline_stream(f, chunk_size=7), filename)
+
+    @parameterized.expand(
+        [
+            ('',),
+            ('()',),
+            ('(UNIT)',),
+            ('(DUUP)',),
+            (';UNIT',),
+            ('UNIT;',),
+            ('{}',),
+            ('{ {} }',),
+            ('{ DUUP }',),
+            ('{UNIT};{}',),
+            ('PAIR %a %b; DIP {DROP}',),
+            ('Pair 1 (Pair "a;b" 0x00) ; -3',),
+            ('PUSH (pair int nat) (Pair 1 2)',),
+            ('IF_SOME {} {FAIL} # comment',),
+            ('DIP 3 {} ; CMPEQ /* comment */',),
+        ]
+    )
+    def test_same_as_parser(self, code):
+        expected = michelson_to_micheline(code)
+        for chunk_size in [1, 3, 64]:
+            chunks = [code[i : i + chunk_size] for i in range(0, len(code), chunk_size)]
+            self.assertEqual(expected, michelson_to_micheline_stream(chunks))
+
+            stream = StringIO()
+            michelson_to_micheline_stream(chunks, JsonWriter(stream))
+            self.assertEqual(json.dumps(expected), stream.getvalue().lstrip())
+
+            stream = PipeStream()
+            michelson_to_micheline_stream(chunks, JsonWriter(stream))
+            self.assertEqual(json.dumps(expected), stream.getvalue())
+
+            if expected is not None:
+                self.assertEqual(forge_micheline(expected), michelson_to_micheline_stream(chunks, ForgeWriter()))
+
+    def test_json_written_incrementally(self):
+        stream = StringIO()
+
+        def chunks():
+            yield '{ PUSH int 1 ; '
+            yield 'DROP ; '
+            self.assertTrue(stream.getvalue().startswith(' [{"prim": "PUSH", "args": [{"prim": "int"}, {"int": "1"}]}'))
+            yield 'UNIT }'
+
+        michelson_to_micheline_stream(chunks(), JsonWriter(stream))
+        self.assertEqual(michelson_to_micheline('{ PUSH int 1 ; DROP ; UNIT }'), json.loads(stream.getvalue()))
+
+    def test_json_to_file(self):
+        for code in ['{ UNIT ; DROP }', '{ UNIT } ; DROP', 'parameter unit ; storage unit']:
+            with TemporaryFile('w+') as f:
+                f.write('#')
+                michelson_to_micheline_stream(code, JsonWriter(f))
+                f.seek(0)
+                self.assertEqual('#', f.read(1))
+                self.assertEqual(michelson_to_micheline(code), json.load(f))
+
+    def test_forge_many_args(self):
+        for code in ['LAMBDA unit unit {}', 'LAMBDA @f unit unit { DROP ; UNIT }']:
+            expected = forge_micheline(michelson_to_micheline(code))
+            self.assertEqual(expected, michelson_to_micheline_stream(code, ForgeWriter()))
+
+    def test_tokens_across_chunks(self):
+        tokens = list(iter_tokens(['PU', 'SH str', 'ing "a', ' b" 0x', '00']))
+        self.assertEqual(
+            [('PRIM', 'PUSH', 0), ('PRIM', 'string', 5), ('STR', '"a b"', 12), ('BYTE', '0x00', 18), ('$end', '', 22)],
+            tokens,
+        )
+
+    @parameterized.expand(
+        [
+            ('UNIT }',),
+            ('{ UNIT )',),
+            ('(UNIT) ',),
+            ('(UNIT);(UNIT)',),
+            ('PUSH "a',),
+            ('DUUUUP 1 2',),
+        ]
+    )
+    def test_errors(self, code):
+        with self.assertRaises(MichelsonParserError):
+            michelson_to_micheline(code)
+        with self.assertRaises(MichelsonParserError):
+            michelson_to_micheline_stream(StringIO(code), chunk_size=2)
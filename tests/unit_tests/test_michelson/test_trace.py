@@ -0,0 +1,72 @@
+from io import StringIO
+from unittest import TestCase
+
+import simplejson as json
+
+from pymavryk.michelson.repl import Interpreter
+from pymavryk.michelson.trace import JsonLinesTraceSink
+from pymavryk.michelson.trace import ListTraceSink
+from pymavryk.michelson.trace import RingBufferTraceSink
+
+script = [
+    {'prim': 'parameter', 'args': [{'prim': 'int'}]},
+    {'prim': 'storage', 'args': [{'prim': 'int'}]},
+    {
+        'prim': 'code',
+        'args': [
+            [
+                {'prim': 'UNPAIR'},
+                {
+                    'prim': 'DIP',
+                    'args': [[{'prim': 'PUSH', 'args': [{'prim': 'int'}, {'int': '10'}]}, {'prim': 'ADD'}]],
+                },
+                {'prim': 'ADD'},
+                {'prim': 'NIL', 'args': [{'prim': 'operation'}]},
+                {'prim': 'PAIR'},
+            ]
+        ],
+    },
+]
+
+
+class TraceSinkTest(TestCase):
+    def run_code(self, trace):
+        _, storage, _, stdout, error = Interpreter.run_code(
+            parameter={'int': '1'},
+            storage={'int': '2'},
+            script=script,
+            trace=trace,
+        )
+        self.assertIsNone(error)
+        self.assertEqual({'int': '13'}, storage)
+        return stdout
+
+    def test_list_sink(self):
+        expected = self.run_code(True)
+        stdout = self.run_code(ListTraceSink())
+        self.assertEqual(expected, list(stdout))
+
+    def test_ring_buffer_sink(self):
+        expected = self.run_code(True)
+        sink = RingBufferTraceSink(max_size=3)
+        stdout = self.run_code(sink)
+        self.assertIs(sink, stdout)
+        self.assertEqual(expected[-3:], list(sink))
+
+    def test_record_depth(self):
+        sink = RingBufferTraceSink(max_size=100)
+        self.run_code(sink)
+        depths = {record.prim: record.depth for record in sink.records}
+        self.assertEqual(depths['UNPAIR'] + 1, depths['PUSH'])
+        self.assertEqual(depths['UNPAIR'], depths['NIL'])
+        self.assertTrue(all(record.elapsed >= 0 for record in sink.records))
+
+    def test_json_lines_sink(self):
+        stream = StringIO()
+        sink = JsonLinesTraceSink(stream)
+        self.run_code(sink)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(sink.count, len(records))
+        push = next(record for record in records if record.get('prim') == 'PUSH')
+        self.assertEqual(['10'], push['outputs'])
+        self.assertEqual([], push['inputs'])
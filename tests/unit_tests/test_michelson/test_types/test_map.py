@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from pymavryk.context.impl import ExecutionContext
+from pymavryk.michelson.micheline import MichelsonRuntimeError
+from pymavryk.michelson.types import BigMapType
+from pymavryk.michelson.types import IntType
+from pymavryk.michelson.types import MapType
+from pymavryk.michelson.types import MichelsonType
+from pymavryk.michelson.types import PairType
+from pymavryk.michelson.types import SetType
+from pymavryk.michelson.types import StringType
+
+
+def key(x):
+    return IntType.from_value(x)
+
+
+def val(x):
+    return StringType.from_value(x)
+
+
+class SortedMapTest(TestCase):
+    def setUp(self):
+        self.map = MapType.from_items([(key(i), val(str(i))) for i in range(0, 20, 2)])
+
+    def test_get(self):
+        self.assertEqual(val('4'), self.map.get(key(4)))
+        self.assertIsNone(self.map.get(key(5)))
+        self.assertIsNone(self.map.get(key(100)))
+        self.assertIsNone(self.map.get(key(-1)))
+
+    def test_update(self):
+        prev, res = self.map.update(key(5), val('5'))
+        self.assertIsNone(prev)
+        self.assertEqual([key(x) for x in [0, 2, 4, 5, 6, 8, 10, 12, 14, 16, 18]], [k for k, _ in res])
+        self.assertEqual(val('5'), res.get(key(5)))
+        self.assertIsNone(self.map.get(key(5)))
+
+        prev, res = res.update(key(4), val('x'))
+        self.assertEqual(val('4'), prev)
+        self.assertEqual(val('x'), res.get(key(4)))
+
+        prev, res = res.update(key(0), None)
+        self.assertEqual(val('0'), prev)
+        self.assertFalse(res.contains(key(0)))
+        self.assertEqual(10, len(res))
+        MapType.check_constraints(res.items)
+
+    def test_check_constraints(self):
+        with self.assertRaises(MichelsonRuntimeError):
+            MapType.check_constraints([(key(1), val('')), (key(1), val(''))])
+        with self.assertRaises(MichelsonRuntimeError):
+            MapType.check_constraints([(key(2), val('')), (key(1), val(''))])
+
+    def test_pair_keys(self):
+        ty = MichelsonType.match(
+            {'prim': 'map', 'args': [{'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}]}, {'prim': 'nat'}]}
+        )
+        res = ty.from_python_object({(2, 0): 1, (1, 5): 2, (1, 3): 3})
+        self.assertEqual([(1, 3), (1, 5), (2, 0)], [k.to_python_object() for k, _ in res])
+        self.assertEqual(2, res[(1, 5)].to_python_object())
+        self.assertTrue(PairType.from_comb([key(1), key(5)]) < PairType.from_comb([key(2), key(0)]))
+
+
+class SortedSetTest(TestCase):
+    def test_add_remove(self):
+        items = SetType.from_items([key(1), key(3)])
+        items = items.add(key(2)).add(key(0)).add(key(3))
+        self.assertEqual([key(x) for x in range(4)], list(items))
+        items = items.remove(key(2)).remove(key(5))
+        self.assertEqual([key(0), key(1), key(3)], list(items))
+        self.assertTrue(items.contains(key(1)))
+        self.assertFalse(items.contains(key(2)))
+
+
+class SortedBigMapTest(TestCase):
+    def test_local_diff(self):
+        big_map = BigMapType.empty(IntType, StringType)
+        big_map.attach_context(ExecutionContext())
+        _, big_map = big_map.update(key(2), val('2'))
+        _, big_map = big_map.update(key(1), val('1'))
+        self.assertEqual([key(1), key(2)], [k for k, _ in big_map])
+        prev, big_map = big_map.update(key(2), None)
+        self.assertEqual(val('2'), prev)
+        self.assertEqual([key(2)], big_map.removed_keys)
+        self.assertIsNone(big_map.get(key(2)))
+        _, big_map = big_map.update(key(2), val('x'))
+        self.assertEqual([], big_map.removed_keys)
+        self.assertEqual(val('x'), big_map.get(key(2)))
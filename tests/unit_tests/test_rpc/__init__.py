@@ -0,0 +1,14 @@
+import json
+from typing import Any
+from unittest.mock import Mock
+
+
+def make_response(status_code: int = 200, data: Any = None) -> Mock:
+    """Mock of `requests.Response` with JSON body, decoded anew on each `json()` call"""
+    res = Mock()
+    res.status_code = status_code
+    res.content = json.dumps(data).encode()
+    res.text = res.content.decode()
+    res.json.side_effect = lambda: json.loads(res.content)
+    res.headers = {'content-type': 'application/json'}
+    return res
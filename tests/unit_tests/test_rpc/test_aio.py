@@ -0,0 +1,82 @@
+import asyncio
+from unittest import TestCase
+
+from pymavryk.rpc.aio import AsyncRpcNode
+from pymavryk.rpc.aio import AsyncShellQuery
+from pymavryk.rpc.errors import MichelsonError
+from pymavryk.rpc.node import RpcError
+
+
+class FakeResponse:
+    def __init__(self, status, text, content_type='application/json'):
+        self.status = status
+        self.content_type = content_type
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def text(self):
+        await asyncio.sleep(0)
+        return self._text
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0) if isinstance(self.responses, list) else self.responses
+
+
+class TestAsyncRpc(TestCase):
+    def test_query_path(self) -> None:
+        session = FakeSession(FakeResponse(200, '{"prim": "Unit"}'))
+        shell = AsyncShellQuery(AsyncRpcNode('https://rpc.example.com/', session=session))
+
+        async def run():
+            query = shell.blocks['head'].context.contracts['KT1AbC'].storage
+            return await asyncio.gather(*[query() for _ in range(10)])
+
+        self.assertEqual([{'prim': 'Unit'}] * 10, asyncio.run(run()))
+        self.assertEqual(10, len(session.calls))
+        method, url, _ = session.calls[0]
+        self.assertEqual('GET', method)
+        self.assertEqual('https://rpc.example.com/chains/main/blocks/head/context/contracts/KT1AbC/storage', url)
+
+    def test_params(self) -> None:
+        session = FakeSession(FakeResponse(200, '[]'))
+        shell = AsyncShellQuery(AsyncRpcNode('https://rpc.example.com', session=session))
+        asyncio.run(shell.head.helpers.baking_rights(level=10, delegate=None, all=True))
+        _, _, kwargs = session.calls[0]
+        self.assertEqual([('level', '10'), ('all', 'True')], kwargs['params'])
+
+    def test_post(self) -> None:
+        session = FakeSession(FakeResponse(200, '"oo6JPEAy8VuMRGaFuMmLNFFGdJgiaKfnmT1CpHJfKP3Ye5ZahiP"'))
+        shell = AsyncShellQuery(AsyncRpcNode('https://rpc.example.com', session=session))
+        res = asyncio.run(shell.injection.operation.post(json='deadbeef', chain='main'))
+        self.assertEqual('oo6JPEAy8VuMRGaFuMmLNFFGdJgiaKfnmT1CpHJfKP3Ye5ZahiP', res)
+        method, url, kwargs = session.calls[0]
+        self.assertEqual(('POST', 'https://rpc.example.com/injection/operation'), (method, url))
+        self.assertEqual('deadbeef', kwargs['json'])
+
+    def test_retry(self) -> None:
+        session = FakeSession([FakeResponse(503, 'unavailable', 'text/plain'), FakeResponse(200, '1')])
+        node = AsyncRpcNode('https://rpc.example.com', session=session, backoff_factor=0)
+        self.assertEqual(1, asyncio.run(node.get('/chains/main/blocks/head/level')))
+        self.assertEqual(2, len(session.calls))
+
+    def test_errors(self) -> None:
+        node = AsyncRpcNode('https://rpc.example.com', session=FakeSession(FakeResponse(404, '')))
+        with self.assertRaises(RpcError):
+            asyncio.run(node.get('/unknown'))
+
+        errors = '[{"kind": "temporary", "id": "proto.alpha.michelson_v1.script_rejected"}]'
+        node = AsyncRpcNode('https://rpc.example.com', session=FakeSession(FakeResponse(500, errors)))
+        with self.assertRaises(MichelsonError):
+            asyncio.run(node.post('/chains/main/blocks/head/helpers/scripts/run_operation', json={}))
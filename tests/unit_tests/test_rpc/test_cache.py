@@ -0,0 +1,76 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+
+from pymavryk.rpc.cache import RpcCache
+from pymavryk.rpc.cache import get_cache_policy
+from pymavryk.rpc.node import RpcNode
+from pymavryk.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc import make_response
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+contract_path = f'/chains/main/blocks/{block_hash}/context/contracts/KT1AbC/script'
+
+
+class TestRpcCache(TestCase):
+    @parameterized.expand(
+        [
+            (contract_path, None, (True, None)),
+            (f'chains/main/blocks/{block_hash}', None, (True, None)),
+            ('/chains/main/blocks/genesis/header', None, (True, None)),
+            ('/chains/main/chain_id', None, (True, None)),
+            ('/chains/main/blocks/head/context/constants', None, (False, None)),
+            ('/chains/main/blocks/head~2/context/constants', 5, (True, 5)),
+            ('/chains/main/blocks/100/header', 5, (False, None)),
+            ('/chains/main/mempool/pending_operations', 5, (False, None)),
+        ]
+    )
+    def test_policy(self, path, ttl, expected) -> None:
+        self.assertEqual(expected, get_cache_policy(path, ttl))
+
+    def test_node_cache(self) -> None:
+        cache = RpcCache()
+        node = RpcNode('https://rpc.example.com', cache=cache)
+        with patch.object(node.session, 'request', return_value=make_response(data={'code': []})) as mock:
+            shell = ShellQuery(node)
+            self.assertEqual({'code': []}, shell.blocks[block_hash].context.contracts['KT1AbC'].script())
+            res = shell.blocks[block_hash].context.contracts['KT1AbC'].script()
+            self.assertEqual({'code': []}, res)
+            res['code'].append(1)
+            self.assertEqual({'code': []}, shell.blocks[block_hash].context.contracts['KT1AbC'].script())
+            shell.head.header()
+            shell.head.header()
+
+        self.assertEqual(3, mock.call_count)
+        self.assertEqual({'size': 1, 'hits': 2, 'misses': 1}, cache.stats)
+
+    def test_lru(self) -> None:
+        cache = RpcCache(max_size=2)
+        for i in range(3):
+            cache.put('uri', f'/chains/main/blocks/{block_hash}/context/contracts/{i}', None, b'1')
+        self.assertIsNone(cache.get('uri', f'/chains/main/blocks/{block_hash}/context/contracts/0'))
+        self.assertEqual(b'1', cache.get('uri', f'/chains/main/blocks/{block_hash}/context/contracts/2'))
+        self.assertEqual(2, len(cache))
+
+    def test_ttl(self) -> None:
+        cache = RpcCache(ttl=0.05)
+        cache.put('uri', '/chains/main/blocks/head/context/constants', {'a': None}, b'{}')
+        self.assertEqual(b'{}', cache.get('uri', '/chains/main/blocks/head/context/constants'))
+        sleep(0.1)
+        self.assertIsNone(cache.get('uri', '/chains/main/blocks/head/context/constants'))
+
+    def test_persistence(self) -> None:
+        with TemporaryDirectory() as tmp:
+            cache = RpcCache(db_path=join(tmp, 'cache.db'), ttl=10)
+            cache.put('uri', contract_path, {'unparsing_mode': 'Readable'}, b'{}')
+            cache.put('uri', '/chains/main/blocks/head/header', None, b'{}')
+            cache.close()
+
+            cache = RpcCache(db_path=join(tmp, 'cache.db'), ttl=10)
+            self.assertEqual(b'{}', cache.get('uri', contract_path, {'unparsing_mode': 'Readable'}))
+            self.assertIsNone(cache.get('uri', '/chains/main/blocks/head/header'))
+            cache.close()
@@ -0,0 +1,169 @@
+import logging
+from copy import deepcopy
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pymavryk.logging import logger
+from pymavryk.rpc.node import RpcBalancedNode
+from pymavryk.rpc.node import RpcError
+from pymavryk.rpc.node import RpcMultiNode
+from pymavryk.rpc.node import RpcNode
+from pymavryk.rpc.node import close_sessions
+from pymavryk.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc import make_response
+
+
+class TestRpcNode(TestCase):
+    def tearDown(self) -> None:
+        close_sessions()
+
+    def test_session_is_shared_per_host(self) -> None:
+        a = RpcNode('https://rpc.example.com/mainnet')
+        b = RpcNode('https://rpc.example.com/ghostnet')
+        c = RpcNode('https://other.example.com')
+        self.assertIs(a.session, b.session)
+        self.assertIsNot(a.session, c.session)
+
+    def test_pool_settings(self) -> None:
+        node = RpcNode('https://rpc.example.com', pool_size=32, retries=5)
+        adapter = node.session.get_adapter('https://rpc.example.com')
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertEqual(5, adapter.max_retries.total)
+        self.assertNotIn('POST', adapter.max_retries.allowed_methods)
+        self.assertIsNot(node.session, RpcNode('https://rpc.example.com').session)
+
+    def test_multi_node_settings(self) -> None:
+        node = RpcMultiNode(['https://a.example.com', 'https://b.example.com'], pool_size=4, timeout=5)
+        self.assertEqual([4, 4], [n.pool_size for n in node.nodes])
+        self.assertEqual([5, 5], [n.timeout for n in node.nodes])
+
+    def test_request_uses_session(self) -> None:
+        node = RpcNode('https://rpc.example.com/', timeout=7)
+        with patch.object(node.session, 'request', return_value=make_response(data={'level': 1})) as request_mock:
+            shell = ShellQuery(node)
+            self.assertEqual({'level': 1}, shell.head.header())
+            self.assertEqual({'level': 1}, shell.blocks['head'].header())
+
+        self.assertEqual(2, request_mock.call_count)
+        kwargs = request_mock.call_args.kwargs
+        self.assertEqual('https://rpc.example.com/chains/main/blocks/head/header', kwargs['url'])
+        self.assertEqual(7, kwargs['timeout'])
+
+    def test_deepcopy(self) -> None:
+        node = RpcNode('https://rpc.example.com')
+        _ = node.session
+        self.assertIs(node.session, deepcopy(node).session)
+
+    def test_response_decoded_once(self) -> None:
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.INFO)
+        node = RpcNode('https://rpc.example.com')
+        response = make_response(data={'protocol': 'PtAtLas'})
+        with patch.object(node.session, 'request', return_value=response), patch(
+            'pymavryk.rpc.node.json.dumps'
+        ) as dumps_mock:
+            self.assertEqual({'protocol': 'PtAtLas'}, node.get('/chains/main/blocks/head/protocols'))
+
+        response.json.assert_called_once()
+        dumps_mock.assert_not_called()
+
+    def test_debug_logging(self) -> None:
+        node = RpcNode('https://rpc.example.com')
+        response = make_response(data=[1, 2, 3])
+        with patch.object(node.session, 'request', return_value=response), self.assertLogs('pymavryk', 'DEBUG') as logs:
+            self.assertEqual([1, 2, 3], node.get('/chains/main/blocks'))
+
+        response.json.assert_called_once()
+        self.assertEqual(2, len(logs.output))
+
+
+class TestRpcBalancedNode(TestCase):
+    def make_node(self, **kwargs) -> RpcBalancedNode:
+        kwargs.setdefault('head_check_interval', None)
+        return RpcBalancedNode(['https://a.example.com', 'https://b.example.com', 'https://c.example.com'], **kwargs)
+
+    def test_prefers_fastest(self) -> None:
+        node = self.make_node()
+        for i, latency in enumerate([0.3, 0.1, 0.2]):
+            node.health[i].latency = latency
+        self.assertEqual([1, 2, 0], node.rank())
+
+    def test_ejects_lagging(self) -> None:
+        node = self.make_node(max_lag=2)
+        for i, level in enumerate([100, 97, 99]):
+            node.health[i].level = level
+            node.health[i].latency = 0.1 * (3 - i)
+        self.assertEqual([2, 0, 1], node.rank())
+
+    def test_failover(self) -> None:
+        node = self.make_node(max_failures=1)
+        error = requests.exceptions.ConnectionError('refused')
+        with patch.object(node.nodes[0], 'request', side_effect=error), patch.object(
+            node.nodes[1], 'request', return_value=make_response(data=42)
+        ):
+            self.assertEqual(42, node.get('/chains/main/blocks/head/level'))
+
+        self.assertGreater(node.health[0].ejected_until, 0)
+        self.assertEqual(0, node.rank()[-1])
+        self.assertIsNotNone(node.health[1].latency)
+
+    def test_failover_on_server_error(self) -> None:
+        node = self.make_node(max_failures=1)
+        with patch.object(node.nodes[0].session, 'request', return_value=make_response(503, [])), patch.object(
+            node.nodes[1].session, 'request', return_value=make_response(data=42)
+        ):
+            self.assertEqual(42, node.get('/chains/main/blocks/head/level'))
+
+        self.assertIsNone(node.health[0].latency)
+        self.assertEqual(0, node.rank()[-1])
+        self.assertIsNotNone(node.health[1].latency)
+
+    def test_no_failover_on_client_error(self) -> None:
+        node = self.make_node(max_failures=1)
+        with patch.object(node.nodes[0].session, 'request', return_value=make_response(400, [])), patch.object(
+            node.nodes[1].session, 'request'
+        ) as mock:
+            with self.assertRaises(RpcError):
+                node.get('/chains/main/blocks/head/level')
+            mock.assert_not_called()
+
+        self.assertEqual(0, node.health[0].failures)
+        self.assertIsNotNone(node.health[0].latency)
+
+    def test_no_failover_for_post(self) -> None:
+        node = self.make_node()
+        error = requests.exceptions.ConnectionError('refused')
+        with patch.object(node.nodes[0], 'request', side_effect=error), patch.object(node.nodes[1], 'request') as mock:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                node.post('/injection/operation', json='00')
+            mock.assert_not_called()
+
+    def test_hedging(self) -> None:
+        node = self.make_node(hedge_after=0.01)
+
+        def slow_request(*args, **kwargs):
+            sleep(0.5)
+            return make_response(data='slow')
+
+        with patch.object(node.nodes[0], 'request', side_effect=slow_request), patch.object(
+            node.nodes[1], 'request', return_value=make_response(data='fast')
+        ):
+            self.assertEqual('fast', node.get('/chains/main/blocks/head/hash'))
+
+    def test_head_check(self) -> None:
+        node = self.make_node(head_check_interval=60)
+        with patch.object(RpcNode, 'request', return_value=make_response(data={'level': 10})) as mock:
+            node.get('/chains/main/blocks/head/hash')
+            node.executor.shutdown(wait=True)
+        self.assertEqual([10, 10, 10], [h.level for h in node.health])
+        self.assertEqual(4, mock.call_count)
+
+    def test_close(self) -> None:
+        with self.make_node() as node:
+            executor = node.executor
+        self.assertTrue(executor._shutdown)
+        self.assertIsNot(executor, node.executor)
+        node.close()
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from pymavryk.rpc import AsyncShellQuery
+from pymavryk.rpc import RpcNode
+from pymavryk.rpc import ShellQuery
+
+
+class RpcQueryDocstringTest(TestCase):
+    def setUp(self):
+        self.shell = ShellQuery(RpcNode('https://localhost'))
+
+    def test_docstring_is_lazy(self):
+        query = self.shell.blocks['head'].context
+        self.assertNotIn('__doc__', query.__dict__)
+        self.assertIn('.contracts', query.__doc__)
+        self.assertIn('__doc__', query.__dict__)
+
+    def test_docstring_in_repr(self):
+        self.assertIn('.version', repr(self.shell))
+
+    def test_class_docstring(self):
+        self.assertIn('Asynchronous shell', AsyncShellQuery.__doc__)